@@ -2,32 +2,230 @@
 Helper script to add wallet addresses from Dune Analytics to the known grifters list
 """
 
+import argparse
 import json
 import os
+import re
+import sys
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; fall back to a full load
+    ijson = None
+
+GRIFTERS_FILE = 'known_grifters.json'
+JOURNAL_FILE = 'known_grifters.jsonl'
+
+_ADDR_RE = re.compile(r'^0x[0-9a-fA-F]{40}$')
+
+_SEP = "=" * 70
+
+# Per-address status prefixes; plain text when output is piped or redirected
+if sys.stdout.isatty():
+    _ADDED, _EXISTS, _INVALID = "  ✅ Added: ", "  ⚠️ Already exists: ", "  ❌ Invalid address format: "
+else:
+    _ADDED, _EXISTS, _INVALID = "  Added: ", "  Already exists: ", "  Invalid address format: "
+
+
+def empty_grifters():
+    """Fresh, empty grifters document"""
+    return {
+        'description': 'Known malicious actors from Arena platform',
+        'known_grifters': [],
+        'additional_suspicious_wallets': []
+    }
+
+
+def _loads(raw):
+    """Parse JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data, pretty=False):
+    """Serialize data to JSON bytes, compact unless pretty is requested"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _atomic_write(path, payload):
+    """Write to a temp file, fsync, then swap it in so readers never see a partial file"""
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _dumps_line(record):
+    """Serialize one record as a compact newline-terminated JSON line"""
+    if orjson is not None:
+        return orjson.dumps(record) + b'\n'
+    return json.dumps(record, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def append_entries(section, entries, path=JOURNAL_FILE):
+    """
+    Append new entries to the JSONL journal instead of rewriting the base file.
+    Each line records the section it belongs to so loaders can merge it back.
+    """
+    with open(path, 'ab') as f:
+        f.write(b''.join(_dumps_line({'section': section, 'entry': e}) for e in entries))
+        f.flush()
+        os.fsync(f.fileno())
+    _load_db.cache_clear()
+
+
+def _merge_journal(data, path=JOURNAL_FILE):
+    """Merge journal entries (if any) into the loaded base data"""
+    try:
+        with open(path, 'rb') as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return data
+
+    for line in lines:
+        if not line.strip():
+            continue
+        record = _loads(line)
+        data.setdefault(record['section'], []).append(record['entry'])
+    return data
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def load_grifters(path=GRIFTERS_FILE, journal=JOURNAL_FILE):
+    """
+    Load known_grifters.json merged with its append-only journal.
+    The parsed result is shared between callers until either file changes,
+    so treat it as read-only.
+    Raises FileNotFoundError if neither the base file nor the journal exist.
+    """
+    return _load_db(path, journal, _mtime(path), _mtime(journal))
+
+
+@lru_cache(maxsize=1)
+def _load_db(path, journal, base_mtime, journal_mtime):
+    """Parse base file + journal; the mtimes are only part of the cache key"""
+    try:
+        with open(path, 'rb') as f:
+            data = _loads(f.read())
+    except FileNotFoundError:
+        if not os.path.exists(journal):
+            raise
+        data = empty_grifters()
+    data = _merge_journal(data, journal)
+
+    # Addresses are compared case-insensitively everywhere, so normalize once here
+    for grifter in data.get('known_grifters', []):
+        grifter['wallet_address'] = grifter['wallet_address'].lower()
+    data['additional_suspicious_wallets'] = [
+        w.lower() for w in data.get('additional_suspicious_wallets', [])
+    ]
+    return data
+
+
+def _address_of(item):
+    """known_grifters entries are dicts, additional_suspicious_wallets are plain strings"""
+    return item['wallet_address'] if isinstance(item, dict) else item
+
+
+def load_existing_addresses(section, path=GRIFTERS_FILE, journal=JOURNAL_FILE):
+    """
+    Lowercased addresses in one section of the database, base file plus journal.
+    With ijson the base file is streamed, so only the address set is held in memory.
+    Raises FileNotFoundError if neither the base file nor the journal exist.
+    """
+    if ijson is None:
+        data = load_grifters(path, journal)
+        return {_address_of(item).lower() for item in data.get(section, [])}
+
+    existing = set()
+    try:
+        with open(path, 'rb') as f:
+            for item in ijson.items(f, f'{section}.item'):
+                existing.add(_address_of(item).lower())
+    except FileNotFoundError:
+        if not os.path.exists(journal):
+            raise
+
+    try:
+        with open(journal, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = _loads(line)
+                if record['section'] == section:
+                    existing.add(_address_of(record['entry']).lower())
+    except FileNotFoundError:
+        pass
+
+    return existing
+
+
+def compact(path=GRIFTERS_FILE, journal=JOURNAL_FILE, pretty=False):
+    """
+    Fold the journal into the base file and remove it.
+    The base file is replaced atomically so a crash never leaves it half-written.
+    Output is compact JSON unless pretty is set.
+    """
+    try:
+        data = load_grifters(path, journal)
+    except FileNotFoundError:
+        print("❌ Error: known_grifters.json not found!")
+        return
+
+    _atomic_write(path, _dumps(data, pretty))
+
+    if os.path.exists(journal):
+        os.remove(journal)
+    _load_db.cache_clear()
+
+    print(f"✅ Compacted {path}: {len(data.get('known_grifters', []))} known grifters, "
+          f"{len(data.get('additional_suspicious_wallets', []))} suspicious wallets")
+
 
 def add_wallets_from_dune():
     """
     Interactive script to add wallet addresses from Dune Analytics
     """
-    print("\n" + "="*70)
+    print("\n" + _SEP)
     print("🔍 ADD WALLETS FROM DUNE ANALYTICS")
-    print("="*70)
+    print(_SEP)
     print("\nThis tool helps you add wallet addresses from:")
     print("https://dune.com/couchdicks/arenatrade-top-grifters\n")
 
     # Load existing data
     try:
-        with open('known_grifters.json', 'r') as f:
-            data = json.load(f)
+        existing = load_existing_addresses('known_grifters')
     except FileNotFoundError:
         print("❌ Error: known_grifters.json not found!")
         return
 
-    print("Current known grifters: ", len(data['known_grifters']))
+    print("Current known grifters: ", len(existing))
     print("\nPaste wallet addresses from Dune (one per line).")
     print("Type 'DONE' when finished:\n")
 
+    # Status lines are collected and written once after DONE, rather than
+    # taking the stdout lock per pasted address
     new_wallets = []
+    msgs = []
     while True:
         line = input("> ").strip()
 
@@ -35,25 +233,27 @@ def add_wallets_from_dune():
             break
 
         # Validate wallet address format
-        if line.startswith('0x') and len(line) == 42:
-            # Check if already exists
-            exists = False
-            for grifter in data['known_grifters']:
-                if grifter['wallet_address'].lower() == line.lower():
-                    print(f"  ⚠️ Already exists: {line}")
-                    exists = True
-                    break
-
-            if not exists:
+        if _ADDR_RE.match(line):
+            line_lc = line.lower()
+            # Check if already exists (also catches repeats within this paste)
+            if line_lc in existing:
+                msgs.append(_EXISTS + line)
+            else:
                 new_wallets.append(line)
-                print(f"  ✅ Added: {line}")
+                existing.add(line_lc)
+                msgs.append(_ADDED + line)
         elif line:
-            print(f"  ❌ Invalid address format: {line}")
+            msgs.append(_INVALID + line)
+
+    if msgs:
+        sys.stdout.write("\n".join(msgs) + "\n")
+        sys.stdout.flush()
 
     if new_wallets:
         print(f"\n📝 Adding {len(new_wallets)} new wallet(s)...")
 
         # Get additional info for each wallet
+        entries = []
         for wallet in new_wallets:
             print(f"\nWallet: {wallet}")
             arena_name = input("Arena username (or press Enter to skip): ").strip()
@@ -72,99 +272,114 @@ def add_wallets_from_dune():
                 profit_avax = 0.0
 
             entry = {
-                "wallet_address": wallet,
+                "wallet_address": wallet.lower(),
                 "arena_name": arena_name,
                 "tokens_created": tokens_count,
                 "total_profit_avax": profit_avax,
                 "notes": notes or "Added from Dune Analytics"
             }
 
-            data['known_grifters'].append(entry)
+            entries.append(entry)
 
-        # Save updated data
-        with open('known_grifters.json', 'w') as f:
-            json.dump(data, f, indent=2)
+        # Save only the new entries; run compact() to fold them into the base file
+        append_entries('known_grifters', entries)
 
         print(f"\n✅ Successfully added {len(new_wallets)} wallet(s)")
-        print(f"Total known grifters: {len(data['known_grifters'])}")
+        print(f"Total known grifters: {len(existing)}")
     else:
         print("\nNo new wallets added.")
 
-    print("\n" + "="*70)
+    print("\n" + _SEP)
 
 
-def quick_add_wallets():
+def read_wallets_from_stdin():
     """
-    Quick add multiple wallets without detailed info
+    Read a whole paste or pipe from stdin in one call and keep the valid addresses
     """
-    print("\n" + "="*70)
+    lines = sys.stdin.read().splitlines()
+    return [ln.strip() for ln in lines if _ADDR_RE.match(ln.strip())]
+
+
+def quick_add_wallets(wallets=None):
+    """
+    Quick add multiple wallets without detailed info.
+    Prompts for a paste unless a list of wallets is passed in.
+    """
+    print("\n" + _SEP)
     print("⚡ QUICK ADD WALLET ADDRESSES")
-    print("="*70)
-    print("\nPaste all wallet addresses (one per line):")
-    print("Press Enter twice when done:\n")
+    print(_SEP)
+
+    if wallets is None:
+        print("\nPaste all wallet addresses (one per line):")
+        print("Press Enter twice when done:\n")
 
-    wallets = []
-    empty_count = 0
+        wallets = []
+        empty_count = 0
 
-    while empty_count < 2:
-        line = input().strip()
+        while empty_count < 2:
+            line = input().strip()
 
-        if not line:
-            empty_count += 1
-        else:
-            empty_count = 0
-            if line.startswith('0x') and len(line) == 42:
-                wallets.append(line)
+            if not line:
+                empty_count += 1
+            else:
+                empty_count = 0
+                if _ADDR_RE.match(line):
+                    wallets.append(line)
 
     if wallets:
         print(f"\n✅ Found {len(wallets)} valid addresses")
 
-        # Load existing data
+        # Load existing addresses
         try:
-            with open('known_grifters.json', 'r') as f:
-                data = json.load(f)
+            existing = load_existing_addresses('additional_suspicious_wallets')
         except FileNotFoundError:
-            data = {
-                'description': 'Known malicious actors from Arena platform',
-                'known_grifters': [],
-                'additional_suspicious_wallets': []
-            }
-
-        # Add to additional suspicious wallets
-        existing = set(w.lower() for w in data.get('additional_suspicious_wallets', []))
+            existing = set()
 
-        added = 0
+        new_wallets = []
         for wallet in wallets:
-            if wallet.lower() not in existing:
-                if 'additional_suspicious_wallets' not in data:
-                    data['additional_suspicious_wallets'] = []
-                data['additional_suspicious_wallets'].append(wallet)
-                added += 1
+            wallet_lc = wallet.lower()
+            if wallet_lc not in existing:
+                new_wallets.append(wallet_lc)
+                existing.add(wallet_lc)
 
-        # Save
-        with open('known_grifters.json', 'w') as f:
-            json.dump(data, f, indent=2)
+        # Save only the new wallets to the journal
+        if new_wallets:
+            append_entries('additional_suspicious_wallets', new_wallets)
 
-        print(f"📝 Added {added} new wallet(s) to suspicious list")
+        print(f"📝 Added {len(new_wallets)} new wallet(s) to suspicious list")
         print(f"⚠️ Run the complete tracker to analyze these wallets")
     else:
         print("❌ No valid addresses found")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Add Dune Analytics wallets to known_grifters.json")
+    parser.add_argument('--stdin', action='store_true',
+                        help="quick add every address piped on stdin, e.g. cat addrs.txt | python add_dune_wallets.py --stdin")
+    parser.add_argument('--pretty', action='store_true',
+                        help="write known_grifters.json indented for humans when compacting")
+    args = parser.parse_args()
+
+    if args.stdin:
+        quick_add_wallets(read_wallets_from_stdin())
+        sys.exit(0)
+
     print("\n🛡️ DUNE WALLET IMPORTER")
-    print("="*70)
+    print(_SEP)
     print("\nChoose an option:")
     print("1. Add wallets with detailed info")
     print("2. Quick add (just addresses)")
-    print("3. Exit")
+    print("3. Compact database (merge known_grifters.jsonl into known_grifters.json)")
+    print("4. Exit")
 
-    choice = input("\nSelect (1-3): ").strip()
+    choice = input("\nSelect (1-4): ").strip()
 
     if choice == "1":
         add_wallets_from_dune()
     elif choice == "2":
         quick_add_wallets()
+    elif choice == "3":
+        compact(pretty=args.pretty)
     else:
         print("Exiting...")
 
@@ -1,50 +1,231 @@
-import requests
-from bs4 import BeautifulSoup
-import time
+import argparse
+import asyncio
+import json
+import os
+from collections import deque
+from functools import lru_cache
 
-# Token ID (example)
-TOKEN_ID = "0x3C5f68d2F72DEBBa4900c60f32EB8629876401f2"
-EXPLORER_URL = f"https://snowtrace.io/token/{TOKEN_ID}"
+import aiohttp
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
-def scrape_avalanche_explorer():
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
+# Tokens to monitor (example)
+TOKEN_IDS = [
+    "0x3C5f68d2F72DEBBa4900c60f32EB8629876401f2",
+]
+RPC_URL = "https://api.avax.network/ext/bc/C/rpc"
+
+OWNER_SELECTOR = "0x8da5cb5b"  # owner()
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+LARGE_TRANSFER_WEI = 10**18  # 1 AVAX
+LOOKBACK_BLOCKS = 2000  # Public RPC caps eth_getLogs ranges at 2048 blocks
+
+MAX_CONCURRENT = 8
+MAX_RETRIES = 3
+POLL_INTERVAL = 300  # Check every 5 minutes
+
+HEADERS = {'Accept-Encoding': 'gzip, br', 'User-Agent': 'rug-scanner/1.0'}
+
+# Scan cursors survive restarts so a new process doesn't rescan the lookback window
+STATE_FILE = 'arena_bet_state.json'
+
+
+def _loads(raw):
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _dumps(data):
+    return orjson.dumps(data) if orjson is not None else json.dumps(data).encode('utf-8')
+
+
+def load_state():
+    """
+    Load the per-token block cursors and recent large-transfer blocks saved by the
+    previous run; files from before the large-transfer window held only the cursors
+    """
     try:
-        res = requests.get(EXPLORER_URL)
-        soup = BeautifulSoup(res.text, 'html.parser')
-
-        # Extract owner wallet
-        owner = soup.find('span', text='Owner').find_next_sibling('span').text.strip()
-
-        # Extract transactions
-        txs = soup.find_all('tr', class_='tx-row')
-        large_transfers = 0
-        for tx in txs:
-            value = tx.find('td', class_='tx-value').text.strip()
-            if float(value) > 1000000000000000000:  # > 1 AVAX
-                large_transfers += 1
-
-        return {
-            "owner": owner,
-            "large_transfers": large_transfers,
-            "total_txs": len(txs)
-        }
-    except Exception as e:
-        return {"error": str(e)}
-
-# Main loop
-def main():
-    while True:
-        print("Scraping Avalanche Explorer...")
-        data = scrape_avalanche_explorer()
-        if "error" in data:
-            print(f"Error: {data['error']}")
+        with open(STATE_FILE, 'rb') as f:
+            state = _loads(f.read())
+    except (FileNotFoundError, ValueError):
+        return {}, {}
+    if 'cursors' not in state:
+        return state, {}
+    return state['cursors'], state.get('large_transfers', {})
+
+
+def save_state(cursors, large_transfers):
+    """Persist the per-token block cursors and large-transfer windows"""
+    state = {
+        'cursors': cursors,
+        'large_transfers': {token: list(blocks) for token, blocks in large_transfers.items()},
+    }
+    tmp = STATE_FILE + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(_dumps(state))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, STATE_FILE)
+
+
+# First block not yet scanned for Transfer logs, per token
+_next_block, _saved_large = load_state()
+
+# Blocks of each token's large transfers within the last LOOKBACK_BLOCKS, oldest first;
+# the rug check counts this window rather than only the logs new since the last poll
+_large_transfer_blocks = {token: deque(blocks) for token, blocks in _saved_large.items()}
+
+# Cursors that may have fallen more than LOOKBACK_BLOCKS behind the chain head: restored
+# from disk, or left by a failed poll. They're clamped before the next eth_getLogs,
+# which the public RPC rejects for wider ranges.
+_stale_cursors = set(_next_block)
+
+
+async def rpc_batch(session, calls):
+    """
+    Send several JSON-RPC calls in one HTTP request, retrying transient failures.
+    Returns results keyed by request id, since batch responses may come back in any order.
+    """
+    payload = [
+        {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+        for i, (method, params) in enumerate(calls, start=1)
+    ]
+
+    for attempt in range(MAX_RETRIES):
+        try:
+            async with session.post(RPC_URL, json=payload) as res:
+                res.raise_for_status()
+                body = await res.read()
+            break
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == MAX_RETRIES - 1:
+                raise
+            await asyncio.sleep(2 ** attempt)
+
+    responses = _loads(body)
+    if not isinstance(responses, list):
+        # Rejected or rate-limited batches come back as a single error object
+        error = responses.get('error', responses) if isinstance(responses, dict) else responses
+        message = error.get('message', error) if isinstance(error, dict) else error
+        raise RuntimeError(f"RPC batch error: {message}")
+
+    results = {}
+    for r in responses:
+        if 'error' in r:
+            raise RuntimeError(f"RPC error: {r['error'].get('message', r['error'])}")
+        results[r['id']] = r['result']
+    return results
+
+
+@lru_cache(maxsize=None)
+def _static_params(token_id):
+    """
+    Per-token request pieces that never change between polls, built once.
+    The log filter is copied per poll since only fromBlock varies.
+    """
+    owner_call = ("eth_call", [{"to": token_id, "data": OWNER_SELECTOR}, "latest"])
+    log_filter = {"address": token_id, "topics": [TRANSFER_TOPIC], "toBlock": "latest"}
+    return owner_call, log_filter
+
+
+async def scrape_avalanche_explorer(session, token_id):
+    if token_id not in _next_block or token_id in _stale_cursors:
+        latest = int((await rpc_batch(session, [("eth_blockNumber", [])]))[1], 16)
+        _next_block[token_id] = max(_next_block.get(token_id, 0), latest - LOOKBACK_BLOCKS, 0)
+        _stale_cursors.discard(token_id)
+
+    owner_call, log_filter = _static_params(token_id)
+    results = await rpc_batch(session, [
+        ("eth_blockNumber", []),
+        owner_call,
+        ("eth_getLogs", [dict(log_filter, fromBlock=hex(_next_block[token_id]))]),
+    ])
+
+    # owner() returns a 32-byte word; the address is the low 20 bytes. Tokens without
+    # owner() (or a reverted call) return "0x" or nothing, so there's no owner to report
+    owner = "0x" + results[2][-40:] if len(results[2] or "") == 66 else None
+
+    # Transfer value is the (unindexed) data word of each log; compare as
+    # exact integers so values above 2**53 wei don't lose precision. ERC-721
+    # Transfers share the topic but index tokenId and carry no data word
+    logs = results[3]
+    values = [(int(log['blockNumber'], 16), int(log['data'], 16))
+              for log in logs if len(log.get('data') or "") == 66]
+
+    # 'latest' may have advanced past eth_blockNumber between calls
+    last_block = max([int(results[1], 16)] + [int(log['blockNumber'], 16) for log in logs])
+    _next_block[token_id] = last_block + 1
+
+    # Slide the token's large-transfer window: add this poll's, drop those now out of range
+    window = _large_transfer_blocks.setdefault(token_id, deque())
+    window.extend(block for block, value in values if value > LARGE_TRANSFER_WEI)
+    while window and window[0] <= last_block - LOOKBACK_BLOCKS:
+        window.popleft()
+
+    return {
+        "owner": owner,
+        "large_transfers": len(window),
+        "total_txs": len(logs)
+    }
+
+
+async def scrape_one(session, sem, token_id):
+    async with sem:
+        try:
+            return await scrape_avalanche_explorer(session, token_id)
+        except (aiohttp.ClientError, asyncio.TimeoutError, RuntimeError, KeyError, ValueError) as e:
+            # The cursor didn't move; re-clamp it in case the outage outlasts the lookback
+            _stale_cursors.add(token_id)
+            return {"error": str(e)}
+
+
+def report(token_id, data):
+    print(f"\nToken: {token_id}")
+    if "error" in data:
+        print(f"Error: {data['error']}")
+    else:
+        print(f"Owner: {data['owner']}")
+        print(f"Large transfers: {data['large_transfers']}")
+        if data['large_transfers'] > 5:
+            print("🚨 RUG DETECTED: 5+ large transfers")
         else:
-            print(f"Owner: {data['owner']}")
-            print(f"Large transfers: {data['large_transfers']}")
-            if data['large_transfers'] > 5:
-                print("🚨 RUG DETECTED: 5+ large transfers")
-            else:
-                print("✅ Safe: No rug detected")
-        time.sleep(300)  # Check every 5 minutes
+            print("✅ Safe: No rug detected")
+
+
+async def poll_once():
+    """Scan every token once and save the cursors; safe to run from cron or a systemd timer"""
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout) as session:
+        sem = asyncio.Semaphore(MAX_CONCURRENT)
+        print("Scraping Avalanche Explorer...")
+        results = await asyncio.gather(*[scrape_one(session, sem, tok) for tok in TOKEN_IDS])
+        for token_id, data in zip(TOKEN_IDS, results):
+            report(token_id, data)
+    save_state(_next_block, _large_transfer_blocks)
+
+
+async def run_scheduler():
+    """Run poll_once every POLL_INTERVAL seconds on the event loop"""
+    scheduler = AsyncIOScheduler()
+    scheduler.add_job(poll_once, 'interval', seconds=POLL_INTERVAL, max_instances=1)
+    scheduler.start()
+    await poll_once()
+    await asyncio.Event().wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monitor Arena tokens for rug pulls")
+    parser.add_argument('--once', action='store_true',
+                        help="poll once and exit (for cron, e.g. */5 * * * *, or a systemd timer)")
+    args = parser.parse_args()
+
+    if args.once:
+        asyncio.run(poll_once())
+    else:
+        asyncio.run(run_scheduler())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -14,15 +14,120 @@ Features:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
 import json
 from datetime import datetime, timedelta
 import time
-from typing import List, Dict, Optional, Set, Tuple
-from collections import defaultdict
+from typing import List, Dict, Optional, Set, Tuple, Iterator
+from collections import Counter
 from decimal import Decimal
+import atexit
 import csv
+import io
 import os
+import sqlite3
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+from rate_limiter import COINGECKO_BURST, COINGECKO_RATE, SNOWTRACE_RATE, shared_bucket
+
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional; falls back to the per-tx loop
+    pd = None
+
+try:
+    from sortedcontainers import SortedKeyList
+except ImportError:  # sortedcontainers is optional; reports sort on demand instead
+    SortedKeyList = None
+
+try:
+    from datasketch import HyperLogLog
+except ImportError:  # datasketch is optional; victims are counted exactly with a set
+    HyperLogLog = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
+WEI_PER_AVAX = 1e18
+
+SNOWTRACE_API = "https://api.snowtrace.io/api"
+SNOWTRACE_PAGE_SIZE = 1000
+SNOWTRACE_MAX_WINDOW = 10000  # Snowtrace rejects page * offset above this
+
+# A deployer's victims are counted exactly up to this many distinct addresses
+# (far above min_victims_for_flag, so the flag decision never rests on the estimate)
+EXACT_VICTIM_LIMIT = 10000
+
+# (deployer_buys, deployer_sells, buyers, deployer_totals) from _aggregate_token_txs
+TokenAggregates = Tuple[List[Dict], List[Dict], Dict[str, Dict], Dict[str, float]]
+
+
+@lru_cache(maxsize=65536)
+def _lc(address: str) -> str:
+    """Lowercased address; each distinct address is lowercased once, not once per tx"""
+    return address.lower()
+
+
+class _UniqueCounter:
+    """
+    Distinct addresses, fed one list at a time.
+    Counted exactly with a set up to exact_limit addresses; past that, when datasketch is
+    available, the set is folded into a HyperLogLog sketch (constant memory, ~2-3% error).
+    """
+
+    def __init__(self, exact_limit: int):
+        self.exact_limit = exact_limit
+        self.seen: Optional[Set[str]] = set()
+        self.sketch = None
+
+    def update(self, addresses):
+        if self.sketch is not None:
+            for address in addresses:
+                self.sketch.update(address.encode('utf-8'))
+            return
+
+        self.seen.update(addresses)
+        if HyperLogLog is not None and len(self.seen) > self.exact_limit:
+            self.sketch = HyperLogLog()
+            for address in self.seen:
+                self.sketch.update(address.encode('utf-8'))
+            self.seen = None
+
+    def count(self) -> int:
+        if self.sketch is None:
+            return len(self.seen)
+        # The set already held more than exact_limit; don't let the estimate undercut that
+        return max(self.exact_limit + 1, int(round(self.sketch.count())))
+
+
+def _json_loads(raw):
+    """Parse JSON str/bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize obj to JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+def _atomic_write(path, payload):
+    """Write to a temp file, fsync, then swap it in so readers never see a partial file"""
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
 
 class ArenaBlacklistTracker:
     """
@@ -32,20 +137,43 @@ class ArenaBlacklistTracker:
 
     def __init__(self, rpc_url: str, avax_scan_api_key: str,
                  blacklist_file: str = 'arena_blacklist.json',
-                 arena_names_file: str = 'arena_names_cache.json'):
+                 arena_names_file: str = 'arena_names_cache.json',
+                 blacklist_db: str = 'arena_blacklist.sqlite',
+                 max_tokens_per_wallet: Optional[int] = None,
+                 cursors_file: str = 'arena_scan_cursors.json',
+                 lifecycle_cache_file: str = 'arena_lifecycle_cache.json'):
         """
         Initialize the Arena Blacklist Tracker
 
         Args:
             rpc_url: Avalanche C-Chain RPC URL
             avax_scan_api_key: Snowtrace API key
-            blacklist_file: JSON file for storing blacklist
+            blacklist_file: JSON file the blacklist is exported to
             arena_names_file: Cache file for Arena usernames
+            blacklist_db: SQLite database backing the blacklist
+            max_tokens_per_wallet: Analyze at most this many deployed tokens per wallet (None = all)
+            cursors_file: Per-wallet scan cursors so reruns only fetch new blocks
+            lifecycle_cache_file: On-disk cache of token lifecycle analyses
         """
         self.w3 = Web3(Web3.HTTPProvider(rpc_url))
         self.api_key = avax_scan_api_key
         self.blacklist_file = blacklist_file
+        self.blacklist_db = blacklist_db
         self.arena_names_file = arena_names_file
+        self.cursors_file = cursors_file
+        self.lifecycle_cache_file = lifecycle_cache_file
+
+        # Shared keep-alive HTTP session; at most max_workers requests in flight at once,
+        # and no more than requests_per_second started (the shared Snowtrace rate).
+        # Rate-limit and server errors are retried with backoff by the adapter.
+        self.max_workers = 5
+        self.requests_per_second = SNOWTRACE_RATE
+        self._session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        self._session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+        self._http_slots = threading.BoundedSemaphore(self.max_workers)
+        self._rate_limiter = shared_bucket('snowtrace', rate=self.requests_per_second, capacity=self.requests_per_second)
+        self._coingecko_limiter = shared_bucket('coingecko', rate=COINGECKO_RATE, capacity=COINGECKO_BURST)
 
         # Arena factory contracts
         self.factory_addresses = [
@@ -53,10 +181,28 @@ class ArenaBlacklistTracker:
             "0x8315f1eb449Dd4B779495C3A0b05e5d194446c6e",
             "0xc605c2cf66ee98ea925b1bb4fea584b71c00cc4c"
         ]
+        self._factory_addresses_lower = frozenset(a.lower() for a in self.factory_addresses)
+        self.max_tokens_per_wallet = max_tokens_per_wallet
+
+        # AVAX/USD price cache: 'current' or date string -> (price, fetched_at)
+        self._price_cache: Dict[str, Tuple[float, float]] = {}
+        self.price_cache_ttl = 300  # seconds, for the current price only
 
         # Load existing data
         self.blacklist = self.load_blacklist()
         self.arena_names_cache = self.load_arena_names_cache()
+        self._wallet_cursors = self.load_wallet_cursors()
+        self._cursors_lock = threading.Lock()  # wallet threads update and save cursors concurrently
+
+        # token:deployer -> {fetched_at, last_block, analysis}; flushed like the names cache
+        self.lifecycle_cache_ttl = 3600  # seconds
+        self._lifecycle_cache = self.load_lifecycle_cache()
+        self._lifecycle_dirty = False
+        atexit.register(self._flush_lifecycle_cache)
+
+        # Names cache is written once at exit (or on flush) rather than per lookup
+        self._names_dirty = False
+        atexit.register(self._flush_names)
 
         # Violation thresholds (configurable)
         self.config = {
@@ -89,55 +235,179 @@ class ArenaBlacklistTracker:
             'total_losses_usd': 0.0
         }
 
+    def _open_blacklist_db(self) -> sqlite3.Connection:
+        """Open the blacklist database, creating the table on first use"""
+        db = sqlite3.connect(self.blacklist_db)
+        db.execute("""
+            CREATE TABLE IF NOT EXISTS blacklisted_users (
+                wallet_address TEXT PRIMARY KEY,
+                entry TEXT NOT NULL
+            )
+        """)
+        return db
+
     def load_blacklist(self) -> Dict:
-        """Load existing blacklist from JSON file"""
-        try:
-            if os.path.exists(self.blacklist_file):
-                with open(self.blacklist_file, 'r') as f:
-                    return json.load(f)
-            return {
-                'blacklisted_users': [],
-                'metadata': {
-                    'last_updated': None,
-                    'total_entries': 0,
-                    'version': '1.0'
-                }
+        """
+        Load existing blacklist from the SQLite database.
+        On first run, entries from an existing JSON blacklist are imported.
+        Also builds self._by_wallet, the wallet -> entry index used for lookups,
+        and self._by_score, the entries ordered by descending rug score for reports.
+        """
+        blacklist = {
+            'blacklisted_users': [],
+            'metadata': {
+                'last_updated': None,
+                'total_entries': 0,
+                'version': '1.0'
             }
+        }
+        self._by_wallet: Dict[str, Dict] = {}
+
+        try:
+            self._db = self._open_blacklist_db()
+            rows = self._db.execute(
+                "SELECT entry FROM blacklisted_users ORDER BY rowid"
+            ).fetchall()
+
+            if rows:
+                blacklist['blacklisted_users'] = [_json_loads(row[0]) for row in rows]
+            elif os.path.exists(self.blacklist_file):
+                with open(self.blacklist_file, 'rb') as f:
+                    blacklist = _json_loads(f.read())
+                self.save_blacklist(blacklist['blacklisted_users'])
         except Exception as e:
             print(f"Error loading blacklist: {e}")
-            return {'blacklisted_users': [], 'metadata': {}}
+            blacklist = {'blacklisted_users': [], 'metadata': {}}
+
+        for entry in blacklist['blacklisted_users']:
+            self._by_wallet[entry['wallet_address']] = entry
+
+        if SortedKeyList is not None:
+            self._by_score = SortedKeyList(
+                blacklist['blacklisted_users'],
+                key=lambda e: -e['metrics']['average_rug_score']
+            )
+        else:
+            self._by_score = None
+        return blacklist
 
     def load_arena_names_cache(self) -> Dict:
         """Load cached Arena usernames"""
         try:
             if os.path.exists(self.arena_names_file):
-                with open(self.arena_names_file, 'r') as f:
-                    return json.load(f)
+                with open(self.arena_names_file, 'rb') as f:
+                    return _json_loads(f.read())
             return {}
         except Exception as e:
             print(f"Error loading Arena names cache: {e}")
             return {}
 
-    def save_blacklist(self):
-        """Save blacklist to JSON file"""
+    def save_blacklist(self, entries: List[Dict]):
+        """Upsert the given entries into the blacklist database"""
+        try:
+            with self._db:
+                self._db.executemany(
+                    """
+                    INSERT INTO blacklisted_users (wallet_address, entry) VALUES (?, ?)
+                    ON CONFLICT(wallet_address) DO UPDATE SET entry = excluded.entry
+                    """,
+                    [(e['wallet_address'], _json_dumps(e).decode('utf-8')) for e in entries]
+                )
+        except Exception as e:
+            print(f"❌ Error saving blacklist: {e}")
+
+    def export_json(self, filename: str = None):
+        """Write the full blacklist to a JSON file"""
+        filename = filename or self.blacklist_file
         try:
             self.blacklist['metadata']['last_updated'] = datetime.now().isoformat()
             self.blacklist['metadata']['total_entries'] = len(self.blacklist['blacklisted_users'])
 
-            with open(self.blacklist_file, 'w') as f:
-                json.dump(self.blacklist, f, indent=2)
-            print(f"✅ Blacklist saved: {self.blacklist_file}")
+            with open(filename, 'wb') as f:
+                f.write(_json_dumps(self.blacklist, indent=True))
+            print(f"✅ Blacklist saved: {filename}")
         except Exception as e:
             print(f"❌ Error saving blacklist: {e}")
 
+    def load_wallet_cursors(self) -> Dict:
+        """Load per-wallet scan cursors: wallet -> {last_block, deployment_hashes}"""
+        try:
+            if os.path.exists(self.cursors_file):
+                with open(self.cursors_file, 'rb') as f:
+                    return _json_loads(f.read())
+            return {}
+        except Exception as e:
+            print(f"Error loading scan cursors: {e}")
+            return {}
+
+    def save_wallet_cursors(self):
+        """Save per-wallet scan cursors; safe to call from several wallet threads"""
+        try:
+            with self._cursors_lock:
+                payload = _json_dumps(self._wallet_cursors)
+                _atomic_write(self.cursors_file, payload)
+        except Exception as e:
+            print(f"Error saving scan cursors: {e}")
+
+    def load_lifecycle_cache(self) -> Dict:
+        """Load cached token lifecycle analyses"""
+        try:
+            if os.path.exists(self.lifecycle_cache_file):
+                with open(self.lifecycle_cache_file, 'rb') as f:
+                    return _json_loads(f.read())
+            return {}
+        except Exception as e:
+            print(f"Error loading lifecycle cache: {e}")
+            return {}
+
+    def _flush_lifecycle_cache(self):
+        """
+        Write the lifecycle cache if it changed since the last write, dropping entries
+        older than lifecycle_cache_ttl so the file doesn't grow without bound
+        """
+        if not self._lifecycle_dirty:
+            return
+        try:
+            cutoff = time.time() - self.lifecycle_cache_ttl
+            self._lifecycle_cache = {
+                key: entry for key, entry in self._lifecycle_cache.items()
+                if entry['fetched_at'] >= cutoff
+            }
+            _atomic_write(self.lifecycle_cache_file, _json_dumps(self._lifecycle_cache))
+            self._lifecycle_dirty = False
+        except Exception as e:
+            print(f"Error saving lifecycle cache: {e}")
+
     def save_arena_names_cache(self):
         """Save Arena names cache"""
         try:
-            with open(self.arena_names_file, 'w') as f:
-                json.dump(self.arena_names_cache, f, indent=2)
+            with open(self.arena_names_file, 'wb') as f:
+                f.write(_json_dumps(self.arena_names_cache, indent=True))
         except Exception as e:
             print(f"Error saving Arena names cache: {e}")
 
+    def _http_get(self, url: str, params: Dict, timeout: int, limiter=None) -> requests.Response:
+        """
+        GET through the shared session, bounded by the worker slots and a rate limiter
+        (the Snowtrace bucket unless another endpoint's limiter is given)
+        """
+        (limiter or self._rate_limiter).acquire()
+        with self._http_slots:
+            return self._session.get(url, params=params, timeout=timeout)
+
+    def _flush_names(self):
+        """Write the Arena names cache if it changed since the last write"""
+        if self._names_dirty:
+            self.save_arena_names_cache()
+            self._names_dirty = False
+
+    def remember_arena_name(self, wallet_address: str, arena_name: str):
+        """Record a name learned elsewhere (e.g. the grifter list) in the names cache"""
+        wallet_lower = wallet_address.lower()
+        if self.arena_names_cache.get(wallet_lower) != arena_name:
+            self.arena_names_cache[wallet_lower] = arena_name
+            self._names_dirty = True
+
     def get_arena_username(self, wallet_address: str) -> Optional[str]:
         """
         Get Arena username for a wallet address.
@@ -168,12 +438,30 @@ class ArenaBlacklistTracker:
 
         # Cache the result
         self.arena_names_cache[wallet_lower] = arena_name
-        self.save_arena_names_cache()
+        self._names_dirty = True
 
         return arena_name
 
     def get_avax_usd_price(self, timestamp: Optional[int] = None) -> float:
-        """Get AVAX/USD price at specific timestamp or current"""
+        """
+        Get AVAX/USD price at specific timestamp or current.
+        Historical prices are cached per day; the current price for price_cache_ttl seconds.
+        """
+        if timestamp:
+            cache_key = datetime.fromtimestamp(timestamp).strftime('%d-%m-%Y')
+        else:
+            cache_key = 'current'
+
+        cached = self._price_cache.get(cache_key)
+        if cached and (timestamp or time.time() - cached[1] < self.price_cache_ttl):
+            return cached[0]
+
+        price = self._fetch_avax_usd_price(timestamp)
+        self._price_cache[cache_key] = (price, time.time())
+        return price
+
+    def _fetch_avax_usd_price(self, timestamp: Optional[int] = None) -> float:
+        """Fetch AVAX/USD price from CoinGecko"""
         try:
             if timestamp:
                 # Get historical price
@@ -185,8 +473,8 @@ class ArenaBlacklistTracker:
                 url = "https://api.coingecko.com/api/v3/simple/price"
                 params = {'ids': 'avalanche-2', 'vs_currencies': 'usd'}
 
-            response = requests.get(url, params=params, timeout=10)
-            data = response.json()
+            response = self._http_get(url, params, timeout=10, limiter=self._coingecko_limiter)
+            data = _json_loads(response.content)
 
             if timestamp:
                 return data.get('market_data', {}).get('current_price', {}).get('usd', 30.0)
@@ -195,41 +483,96 @@ class ArenaBlacklistTracker:
         except Exception:
             return 30.0  # Fallback price
 
-    def get_token_transactions(self, token_contract: str) -> List[Dict]:
-        """Get all transactions for a token"""
+    def _iter_snowtrace(self, params: Dict, start_block: int = 0) -> Iterator[List[Dict]]:
+        """
+        Yield a Snowtrace account query one page at a time, oldest first.
+        Snowtrace caps page * offset at SNOWTRACE_MAX_WINDOW, so when a window fills up
+        the query restarts from the last block seen; that block's rows are held back
+        and re-fetched with the next window so nothing is duplicated or skipped.
+        """
+        page = 1
+        while True:
+            query = dict(params, startblock=start_block, endblock=99999999, sort='asc',
+                         page=page, offset=SNOWTRACE_PAGE_SIZE, apikey=self.api_key)
+            response = self._http_get(SNOWTRACE_API, query, timeout=15)
+            data = _json_loads(response.content)
+
+            if data['status'] != '1' and data.get('result'):
+                # Errors (e.g. rate limits) carry a message string in 'result'
+                raise RuntimeError(f"Snowtrace error: {data['result']}")
+
+            rows = data['result'] if data['status'] == '1' else []
+            if len(rows) < SNOWTRACE_PAGE_SIZE:
+                if rows:
+                    yield rows
+                return
+
+            if page * SNOWTRACE_PAGE_SIZE < SNOWTRACE_MAX_WINDOW:
+                yield rows
+                page += 1
+                continue
+
+            # Window exhausted: restart at the last block, holding its rows back
+            last_block = int(rows[-1]['blockNumber'])
+            complete = [r for r in rows if int(r['blockNumber']) < last_block]
+            if complete:
+                yield complete
+                start_block = last_block
+            else:
+                # Whole window is one block; can't split it further
+                yield rows
+                start_block = last_block + 1
+            page = 1
+
+    def get_token_transactions(self, token_contract: str) -> Optional[List[Dict]]:
+        """Get all transactions for a token; None if the fetch failed"""
+        try:
+            params = {
+                'module': 'account',
+                'action': 'tokentx',
+                'contractaddress': token_contract
+            }
+            token_txs = []
+            for rows in self._iter_snowtrace(params):
+                token_txs.extend(rows)
+            return token_txs
+        except Exception as e:
+            print(f"Error fetching token transactions: {e}")
+            return None
+
+    def _has_transfers_since(self, token_contract: str, last_block: int) -> bool:
+        """Whether a token has any transfer after last_block; True if that can't be checked"""
         try:
-            url = "https://api.snowtrace.io/api"
             params = {
                 'module': 'account',
                 'action': 'tokentx',
                 'contractaddress': token_contract,
-                'startblock': 0,
+                'startblock': last_block + 1,
                 'endblock': 99999999,
-                'sort': 'asc',
+                'page': 1,
+                'offset': 1,
                 'apikey': self.api_key
             }
-            response = requests.get(url, params=params, timeout=15)
-            data = response.json()
-
-            if data['status'] == '1':
-                return data['result']
-            return []
-        except Exception as e:
-            print(f"Error fetching token transactions: {e}")
-            return []
+            response = self._http_get(SNOWTRACE_API, params, timeout=15)
+            data = _json_loads(response.content)
+            if data['status'] != '1' and not isinstance(data.get('result'), list):
+                return True
+            return bool(data['result'])
+        except Exception:
+            return True
 
     def get_token_deployer(self, token_contract: str) -> Optional[str]:
         """Get the deployer address of a token"""
         try:
-            url = "https://api.snowtrace.io/api"
+            url = SNOWTRACE_API
             params = {
                 'module': 'contract',
                 'action': 'getcontractcreation',
                 'contractaddresses': token_contract,
                 'apikey': self.api_key
             }
-            response = requests.get(url, params=params, timeout=15)
-            data = response.json()
+            response = self._http_get(url, params, timeout=15)
+            data = _json_loads(response.content)
 
             if data['status'] == '1' and len(data['result']) > 0:
                 return data['result'][0]['contractCreator']
@@ -238,57 +581,68 @@ class ArenaBlacklistTracker:
             print(f"Error getting token deployer: {e}")
             return None
 
-    def analyze_token_lifecycle(self, token_contract: str, deployer_address: str) -> Dict:
-        """
-        Analyze complete lifecycle of a token from creation to current state
-        Returns detailed metrics about the token's performance and creator behavior
+    def _aggregate_token_txs(self, token_txs: List[Dict], deployer_lower: str,
+                             deployment_time: int) -> TokenAggregates:
         """
-        print(f"  Analyzing token lifecycle: {token_contract[:10]}...")
+        Split a token's transfers into deployer buys, deployer sells and per-buyer totals.
+        Uses the vectorized pandas path when available.
 
-        # Get all token transactions
-        token_txs = self.get_token_transactions(token_contract)
-        if not token_txs:
-            return {}
-
-        # Get deployment timestamp
-        deployment_time = int(token_txs[0]['timeStamp']) if token_txs else 0
+        Returns:
+            (deployer_buys, deployer_sells, buyers, deployer_totals) where buyers maps
+            address -> {spent_avax, received_avax, first_buy_time} in first-buy order and
+            deployer_totals holds self_bought, sold, early_sold and early_sell_count
+        """
+        if pd is not None:
+            return self._aggregate_token_txs_df(token_txs, deployer_lower, deployment_time)
+        return self._aggregate_token_txs_scalar(token_txs, deployer_lower, deployment_time)
 
-        # Track unique buyers and their losses
+    def _aggregate_token_txs_scalar(self, token_txs: List[Dict], deployer_lower: str,
+                                    deployment_time: int) -> TokenAggregates:
+        """Per-transaction loop used when pandas is not installed"""
         buyers = {}  # address -> {spent, received, first_buy_time}
         deployer_buys = []
         deployer_sells = []
+        bonding_time = self.config['bonding_time_estimate']
+
+        # Running deployer totals so callers don't rescan the buy/sell lists
+        total_self_buys = total_sold = early_sold = 0.0
+        early_sell_count = 0
 
         # Process all transactions
         for tx in token_txs:
-            from_addr = tx['from'].lower()
-            to_addr = tx['to'].lower()
+            from_addr = _lc(tx['from'])
+            to_addr = _lc(tx['to'])
             timestamp = int(tx['timeStamp'])
 
-            # Skip if no value
-            value_wei = int(tx.get('value', 0))
-            if value_wei == 0:
+            # Skip if no value (plain float division; from_wei builds a Decimal per call)
+            value_avax = int(tx.get('value', 0)) / WEI_PER_AVAX
+            if value_avax == 0.0:
                 continue
 
-            value_avax = float(self.w3.from_wei(value_wei, 'ether'))
-
             # Track deployer activity
-            if from_addr == deployer_address.lower():
+            if from_addr == deployer_lower:
                 # Deployer selling
+                time_from_launch = timestamp - deployment_time
                 deployer_sells.append({
                     'timestamp': timestamp,
                     'amount_avax': value_avax,
-                    'time_from_launch': timestamp - deployment_time
+                    'time_from_launch': time_from_launch
                 })
-            elif to_addr == deployer_address.lower():
+                total_sold += value_avax
+                if time_from_launch < bonding_time:
+                    early_sold += value_avax
+                    early_sell_count += 1
+            elif to_addr == deployer_lower:
                 # Deployer buying
                 deployer_buys.append({
                     'timestamp': timestamp,
                     'amount_avax': value_avax,
                     'time_from_launch': timestamp - deployment_time
                 })
+                total_self_buys += value_avax
 
             # Track other buyers
-            if to_addr != deployer_address.lower() and from_addr != to_addr:
+            if to_addr != deployer_lower and from_addr != to_addr:
                 if to_addr not in buyers:
                     buyers[to_addr] = {
                         'spent_avax': 0,
@@ -297,12 +651,151 @@ class ArenaBlacklistTracker:
                     }
                 buyers[to_addr]['spent_avax'] += value_avax
 
-            if from_addr != deployer_address.lower() and from_addr in buyers:
+            if from_addr != deployer_lower and from_addr in buyers:
                 buyers[from_addr]['received_avax'] += value_avax
 
+        deployer_totals = {
+            'self_bought': total_self_buys,
+            'sold': total_sold,
+            'early_sold': early_sold,
+            'early_sell_count': early_sell_count
+        }
+        return deployer_buys, deployer_sells, buyers, deployer_totals
+
+    def _aggregate_token_txs_df(self, token_txs: List[Dict], deployer_lower: str,
+                                deployment_time: int) -> TokenAggregates:
+        """Column-wise equivalent of _aggregate_token_txs_scalar"""
+        df = pd.DataFrame(token_txs, columns=['from', 'to', 'timeStamp', 'value'])
+        df['from'] = df['from'].str.lower()
+        df['to'] = df['to'].str.lower()
+        df['ts'] = df['timeStamp'].astype('int64')
+        df['v'] = df['value'].fillna('0').astype('float64') / WEI_PER_AVAX
+
+        # Skip if no value; keep original order as the position for "bought before" checks
+        df = df[df['v'] != 0.0].reset_index(drop=True)
+        df['pos'] = df.index
+
+        def _records(rows) -> List[Dict]:
+            return [
+                {'timestamp': int(ts), 'amount_avax': float(v), 'time_from_launch': int(ts - deployment_time)}
+                for ts, v in zip(rows['ts'], rows['v'])
+            ]
+
+        # Track deployer activity
+        is_sell = df['from'].eq(deployer_lower)
+        is_buy = ~is_sell & df['to'].eq(deployer_lower)
+        sells = df[is_sell]
+        deployer_sells = _records(sells)
+        deployer_buys = _records(df[is_buy])
+
+        early = sells[(sells['ts'] - deployment_time) < self.config['bonding_time_estimate']]
+        deployer_totals = {
+            'self_bought': float(df.loc[is_buy, 'v'].sum()),
+            'sold': float(sells['v'].sum()),
+            'early_sold': float(early['v'].sum()),
+            'early_sell_count': len(early)
+        }
+
+        # Track other buyers
+        buys = df[~df['to'].eq(deployer_lower) & df['from'].ne(df['to'])]
+        grouped = buys.groupby('to', sort=False)
+        spent = grouped['v'].sum()
+        first_pos = grouped['pos'].min()
+        first_time = grouped['ts'].first()
+
+        # Outflows only count once the address has bought in an earlier transfer
+        bought_before = df['pos'] > df['from'].map(first_pos)
+        sold = df[~is_sell & bought_before]
+        received = sold.groupby('from')['v'].sum().reindex(spent.index, fill_value=0.0)
+
+        order = first_pos.sort_values().index
+        buyers = {
+            addr: {
+                'spent_avax': float(spent[addr]),
+                'received_avax': float(received[addr]),
+                'first_buy_time': int(first_time[addr])
+            }
+            for addr in order
+        }
+
+        return deployer_buys, deployer_sells, buyers, deployer_totals
+
+    def analyze_token_lifecycle(self, token_contract: str, deployer_address: str,
+                                avax_usd_price: Optional[float] = None) -> Dict:
+        """
+        Analyze complete lifecycle of a token from creation to current state
+        Returns detailed metrics about the token's performance and creator behavior.
+        Results younger than lifecycle_cache_ttl are served from the lifecycle cache,
+        with USD figures re-valued at the current price. Older results are still served
+        (and their age reset) if the token has had no transfers since their last block.
+
+        Args:
+            avax_usd_price: Price to value losses at; fetched if not given
+        """
+        cache_key = f"{token_contract.lower()}:{deployer_address.lower()}"
+        cached = self._lifecycle_cache.get(cache_key)
+        if cached and time.time() - cached['fetched_at'] >= self.lifecycle_cache_ttl:
+            if cached.get('last_block') is not None and \
+                    not self._has_transfers_since(token_contract, cached['last_block']):
+                cached['fetched_at'] = time.time()
+                self._lifecycle_dirty = True
+            else:
+                cached = None
+        if cached:
+            print(f"  Using cached lifecycle: {token_contract[:10]}...")
+            analysis = cached['analysis']
+            if not analysis:
+                return {}
+            if avax_usd_price is None:
+                avax_usd_price = self.get_avax_usd_price()
+            return dict(
+                analysis,
+                victims=[dict(v, loss_usd=v['loss_avax'] * avax_usd_price) for v in analysis['victims']],
+                total_losses_usd=analysis['total_losses_avax'] * avax_usd_price
+            )
+
+        print(f"  Analyzing token lifecycle: {token_contract[:10]}...")
+
+        # Get all token transactions
+        token_txs = self.get_token_transactions(token_contract)
+        if token_txs is None:
+            # Failed fetch (rate limit, network); don't cache it as an empty token
+            return {}
+        analysis = self._analyze_token_txs(token_contract, deployer_address, token_txs, avax_usd_price)
+
+        self._lifecycle_cache[cache_key] = {
+            'fetched_at': time.time(),
+            'last_block': max((int(tx['blockNumber']) for tx in token_txs), default=None),
+            'analysis': analysis
+        }
+        self._lifecycle_dirty = True
+        return analysis
+
+    def _analyze_token_txs(self, token_contract: str, deployer_address: str,
+                           token_txs: List[Dict], avax_usd_price: Optional[float]) -> Dict:
+        """Lifecycle metrics and violations from a token's full transfer history"""
+        if not token_txs:
+            return {}
+
+        # Skip tokens the deployer never traded directly; stops at the first hit
+        deployer_lower = deployer_address.lower()
+        if not any(_lc(tx['from']) == deployer_lower or _lc(tx['to']) == deployer_lower
+                   for tx in token_txs):
+            return {}
+
+        # Get deployment timestamp
+        deployment_time = int(token_txs[0]['timeStamp'])
+
+        # Track unique buyers and their losses
+        deployer_buys, deployer_sells, buyers, deployer_totals = self._aggregate_token_txs(
+            token_txs, deployer_lower, deployment_time
+        )
+
         # Calculate victim metrics
         victims = []
         total_losses_avax = 0
+        if avax_usd_price is None:
+            avax_usd_price = self.get_avax_usd_price()
 
         for buyer_addr, data in buyers.items():
             loss = data['spent_avax'] - data['received_avax']
@@ -310,7 +803,7 @@ class ArenaBlacklistTracker:
                 victims.append({
                     'address': buyer_addr,
                     'loss_avax': loss,
-                    'loss_usd': loss * self.get_avax_usd_price()
+                    'loss_usd': loss * avax_usd_price
                 })
                 total_losses_avax += loss
 
@@ -328,7 +821,7 @@ class ArenaBlacklistTracker:
                 })
 
         # 2. Self-pumping detection
-        total_self_buys = sum(b['amount_avax'] for b in deployer_buys)
+        total_self_buys = deployer_totals['self_bought']
         if total_self_buys >= self.config['min_buy_limit']:
             violations.append({
                 'type': 'self_pumper',
@@ -337,9 +830,8 @@ class ArenaBlacklistTracker:
             })
 
         # 3. Pre-bonding sell detection
-        early_sells = [s for s in deployer_sells if s['time_from_launch'] < self.config['bonding_time_estimate']]
-        if early_sells:
-            total_early_sold = sum(s['amount_avax'] for s in early_sells)
+        if deployer_totals['early_sell_count']:
+            total_early_sold = deployer_totals['early_sold']
             violations.append({
                 'type': 'pre_bond_seller',
                 'details': f"Sold {total_early_sold:.2f} AVAX before bonding period",
@@ -363,22 +855,35 @@ class ArenaBlacklistTracker:
             'deployer_buys': deployer_buys,
             'deployer_sells': deployer_sells,
             'total_self_bought': total_self_buys,
-            'total_sold': sum(s['amount_avax'] for s in deployer_sells),
+            'total_sold': deployer_totals['sold'],
             'victims': victims,
+            'victim_addresses': [v['address'] for v in victims],
             'victim_count': len(victims),
             'total_losses_avax': total_losses_avax,
-            'total_losses_usd': total_losses_avax * self.get_avax_usd_price(),
+            'total_losses_usd': total_losses_avax * avax_usd_price,
             'violations': violations,
             'rug_score': rug_score
         }
 
-    def analyze_deployer_history(self, wallet_address: str) -> Dict:
+    def analyze_deployer_history(self, wallet_address: str,
+                                 avax_usd_price: Optional[float] = None,
+                                 known_name: Optional[str] = None) -> Dict:
         """
         Comprehensive analysis of a deployer's entire history
+
+        Args:
+            avax_usd_price: Price to value losses at; fetched once here if not given
+            known_name: Arena name the caller already has; skips the name lookup
         """
+        if known_name:
+            arena_name = known_name
+            self.remember_arena_name(wallet_address, known_name)
+        else:
+            arena_name = self.get_arena_username(wallet_address)
+
         print(f"\n{'='*70}")
         print(f"ANALYZING DEPLOYER: {wallet_address}")
-        print(f"Arena Name: {self.get_arena_username(wallet_address)}")
+        print(f"Arena Name: {arena_name}")
         print(f"{'='*70}\n")
 
         # Get all tokens deployed by this address
@@ -390,28 +895,35 @@ class ArenaBlacklistTracker:
 
         print(f"Found {len(deployed_tokens)} deployed tokens\n")
 
+        if avax_usd_price is None:
+            avax_usd_price = self.get_avax_usd_price()
+
         # Analyze each token
         all_violations = []
-        total_victims = set()
+        victims = _UniqueCounter(max(EXACT_VICTIM_LIMIT, self.config['min_victims_for_flag']))
         total_losses_avax = 0
         rug_scores = []
 
-        for i, token in enumerate(deployed_tokens, 1):
-            print(f"[{i}/{len(deployed_tokens)}] Analyzing token {token[:10]}...")
-
-            analysis = self.analyze_token_lifecycle(token, wallet_address)
-
-            if analysis:
-                all_violations.extend(analysis['violations'])
-                for victim in analysis.get('victims', []):
-                    total_victims.add(victim['address'])
-                total_losses_avax += analysis.get('total_losses_avax', 0)
-                rug_scores.append(analysis.get('rug_score', 0))
-
-            time.sleep(0.2)  # Rate limiting
+        # Token analyses are independent HTTP-bound work, so fetch them concurrently;
+        # each is folded into the totals as it arrives rather than kept until the end
+        print(f"Analyzing {len(deployed_tokens)} tokens with up to {self.max_workers} workers...")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for analysis in pool.map(
+                lambda token: self.analyze_token_lifecycle(token, wallet_address, avax_usd_price),
+                deployed_tokens
+            ):
+                if analysis:
+                    all_violations.extend(analysis['violations'])
+                    # Lifecycle analyses cached before victim_addresses existed only have the dicts
+                    victims.update(
+                        analysis.get('victim_addresses') or [v['address'] for v in analysis.get('victims', [])]
+                    )
+                    total_losses_avax += analysis.get('total_losses_avax', 0)
+                    rug_scores.append(analysis.get('rug_score', 0))
 
         # Calculate aggregate metrics
         avg_rug_score = sum(rug_scores) / len(rug_scores) if rug_scores else 0
+        unique_victims = victims.count()
 
         # Determine if should be blacklisted
         should_blacklist = False
@@ -425,28 +937,28 @@ class ArenaBlacklistTracker:
             should_blacklist = True
             blacklist_reasons.append(f"Caused {total_losses_avax:.2f} AVAX in losses")
 
-        if len(total_victims) >= self.config['min_victims_for_flag']:
+        if unique_victims >= self.config['min_victims_for_flag']:
             should_blacklist = True
-            blacklist_reasons.append(f"Harmed {len(total_victims)} unique victims")
+            blacklist_reasons.append(f"Harmed {unique_victims} unique victims")
 
         if avg_rug_score >= 60:
             should_blacklist = True
             blacklist_reasons.append(f"High rug score: {avg_rug_score:.1f}/100")
 
         # Compile violation summary
-        violation_counts = defaultdict(int)
-        for v in all_violations:
-            violation_counts[v['type']] += 1
+        violation_counts = Counter(v['type'] for v in all_violations)
 
         result = {
             'wallet_address': wallet_address,
-            'arena_name': self.get_arena_username(wallet_address),
+            'arena_name': arena_name,
             'tokens_deployed': len(deployed_tokens),
             'total_violations': len(all_violations),
             'violation_counts': dict(violation_counts),
-            'unique_victims': len(total_victims),
+            'unique_victims': unique_victims,
+            # Distinct victims for callers aggregating wallets; empty once past EXACT_VICTIM_LIMIT
+            'distinct_victim_addresses': list(victims.seen) if victims.seen is not None else [],
             'total_losses_avax': total_losses_avax,
-            'total_losses_usd': total_losses_avax * self.get_avax_usd_price(),
+            'total_losses_usd': total_losses_avax * avax_usd_price,
             'average_rug_score': avg_rug_score,
             'should_blacklist': should_blacklist,
             'blacklist_reasons': blacklist_reasons,
@@ -455,18 +967,18 @@ class ArenaBlacklistTracker:
             'evidence': {
                 'token_contracts': deployed_tokens[:10],  # First 10 as evidence
                 'violations': all_violations[:20],  # First 20 violations
-                'victim_count': len(total_victims)
+                'victim_count': unique_victims
             }
         }
 
         # Print summary
         print(f"\n{'='*70}")
-        print(f"ANALYSIS SUMMARY: {self.get_arena_username(wallet_address)}")
+        print(f"ANALYSIS SUMMARY: {arena_name}")
         print(f"{'='*70}")
         print(f"  Tokens Deployed:     {len(deployed_tokens)}")
         print(f"  Total Violations:    {len(all_violations)}")
-        print(f"  Unique Victims:      {len(total_victims)}")
-        print(f"  Total Losses:        {total_losses_avax:.2f} AVAX (${total_losses_avax * self.get_avax_usd_price():.2f})")
+        print(f"  Unique Victims:      {unique_victims}")
+        print(f"  Total Losses:        {total_losses_avax:.2f} AVAX (${total_losses_avax * avax_usd_price:.2f})")
         print(f"  Average Rug Score:   {avg_rug_score:.1f}/100")
         print(f"  Blacklist Status:    {'❌ BLACKLISTED' if should_blacklist else '✅ CLEAN'}")
 
@@ -485,37 +997,76 @@ class ArenaBlacklistTracker:
         return result
 
     def get_deployed_tokens(self, wallet_address: str) -> List[str]:
-        """Get all tokens deployed by a wallet (simplified version)"""
+        """
+        Get all tokens deployed by a wallet.
+        Only blocks after the wallet's saved cursor are fetched; earlier deployment
+        hashes come from the cursor file.
+        """
         try:
-            url = "https://api.snowtrace.io/api"
+            wallet_lower = wallet_address.lower()
+            cursor = self._wallet_cursors.get(wallet_lower, {'last_block': -1, 'deployment_hashes': []})
+            last_block = cursor['last_block']
+            deployment_hashes = list(cursor['deployment_hashes'])
+
             params = {
                 'module': 'account',
                 'action': 'txlist',
-                'address': wallet_address,
-                'startblock': 0,
-                'endblock': 99999999,
-                'sort': 'asc',
-                'apikey': self.api_key
+                'address': wallet_address
             }
-            response = requests.get(url, params=params, timeout=15)
-            data = response.json()
-
-            deployed_tokens = []
-            if data['status'] == '1':
-                for tx in data['result']:
-                    # Check if transaction is to a factory
+            for rows in self._iter_snowtrace(params, start_block=last_block + 1):
+                for tx in rows:
+                    last_block = max(last_block, int(tx['blockNumber']))
+                    # Check if transaction is to a factory (likely a token deployment)
                     to_addr = tx.get('to', '')
-                    if to_addr.lower() in [f.lower() for f in self.factory_addresses]:
-                        # This is likely a token deployment
-                        # In production, would parse the actual created contract
-                        # For now, using transaction hash as placeholder
-                        deployed_tokens.append(tx['hash'][:42])  # Mock token address
+                    if to_addr.lower() in self._factory_addresses_lower:
+                        deployment_hashes.append(tx['hash'])
+
+            with self._cursors_lock:
+                self._wallet_cursors[wallet_lower] = {
+                    'last_block': last_block,
+                    'deployment_hashes': deployment_hashes
+                }
+            self.save_wallet_cursors()
 
-            return deployed_tokens[:10]  # Limit for testing
+            if self.max_tokens_per_wallet is not None:
+                deployment_hashes = deployment_hashes[:self.max_tokens_per_wallet]
+            return self.resolve_token_contracts(deployment_hashes)
         except Exception as e:
             print(f"Error getting deployed tokens: {e}")
             return []
 
+    def resolve_token_contracts(self, tx_hashes: List[str], batch_size: int = 500) -> List[str]:
+        """
+        Resolve deployment transactions to the token contracts they created.
+        Receipts are fetched in JSON-RPC batches of batch_size rather than one call per hash.
+        Uses the receipt's contractAddress for direct deployments, otherwise the first
+        log emitted by a non-factory contract (the new token's mint/ownership event).
+        """
+        tokens = []
+        for start in range(0, len(tx_hashes), batch_size):
+            chunk = tx_hashes[start:start + batch_size]
+            try:
+                with self.w3.batch_requests() as batch:
+                    for tx_hash in chunk:
+                        batch.add(self.w3.eth.get_transaction_receipt(tx_hash))
+                    receipts = batch.execute()
+            except Exception as e:
+                print(f"Error fetching deployment receipts: {e}")
+                continue
+
+            for receipt in receipts:
+                if not receipt:
+                    continue
+                if receipt.get('contractAddress'):
+                    tokens.append(receipt['contractAddress'])
+                    continue
+                for log in receipt.get('logs', []):
+                    if log['address'].lower() not in self._factory_addresses_lower:
+                        tokens.append(log['address'])
+                        break
+
+        return tokens
+
     def add_to_blacklist(self, analysis_result: Dict):
         """Add a user to the blacklist based on analysis"""
         if not analysis_result.get('should_blacklist'):
@@ -540,22 +1091,27 @@ class ArenaBlacklistTracker:
         }
 
         # Check if already in blacklist
-        existing_idx = None
-        for i, existing in enumerate(self.blacklist['blacklisted_users']):
-            if existing['wallet_address'] == entry['wallet_address']:
-                existing_idx = i
-                break
-
-        if existing_idx is not None:
-            # Update existing entry
-            self.blacklist['blacklisted_users'][existing_idx] = entry
+        existing = self._by_wallet.get(entry['wallet_address'])
+
+        if existing is not None:
+            # Update existing entry in place so the list and index stay in sync;
+            # it has to leave the score index while its score changes
+            if self._by_score is not None:
+                self._by_score.remove(existing)
+            existing.clear()
+            existing.update(entry)
+            if self._by_score is not None:
+                self._by_score.add(existing)
             print(f"📝 Updated blacklist entry for {entry['arena_name']}")
         else:
             # Add new entry
             self.blacklist['blacklisted_users'].append(entry)
+            self._by_wallet[entry['wallet_address']] = entry
+            if self._by_score is not None:
+                self._by_score.add(entry)
             print(f"🚫 Added {entry['arena_name']} to blacklist")
 
-        self.save_blacklist()
+        self.save_blacklist([entry])
         return True
 
     def batch_analyze_wallets(self, wallet_addresses: List[str]):
@@ -568,11 +1124,14 @@ class ArenaBlacklistTracker:
         results = []
         blacklisted_count = 0
 
+        # One price for the whole run
+        avax_usd_price = self.get_avax_usd_price()
+
         for i, wallet in enumerate(wallet_addresses, 1):
             print(f"\n[{i}/{len(wallet_addresses)}] Processing wallet...")
 
             try:
-                result = self.analyze_deployer_history(wallet)
+                result = self.analyze_deployer_history(wallet, avax_usd_price)
 
                 if result:
                     results.append(result)
@@ -585,7 +1144,8 @@ class ArenaBlacklistTracker:
                 print(f"Error analyzing {wallet}: {e}")
                 continue
 
-            time.sleep(0.5)  # Rate limiting
+        self._flush_names()
+        self._flush_lifecycle_cache()
 
         # Generate summary report
         print(f"\n{'#'*70}")
@@ -606,26 +1166,30 @@ class ArenaBlacklistTracker:
             filename = f"arena_blacklist_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
 
         try:
-            with open(filename, 'w', newline='') as csvfile:
-                fieldnames = [
-                    'wallet_address', 'arena_name', 'tokens_deployed',
-                    'unique_victims', 'total_losses_avax', 'rug_score',
-                    'blacklist_reasons', 'added_timestamp'
-                ]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-
-                for entry in self.blacklist['blacklisted_users']:
-                    writer.writerow({
-                        'wallet_address': entry['wallet_address'],
-                        'arena_name': entry['arena_name'],
-                        'tokens_deployed': entry['metrics']['tokens_deployed'],
-                        'unique_victims': entry['metrics']['unique_victims'],
-                        'total_losses_avax': entry['metrics']['total_losses_avax'],
-                        'rug_score': entry['metrics']['average_rug_score'],
-                        'blacklist_reasons': '; '.join(entry['blacklist_reasons']),
-                        'added_timestamp': entry['added_timestamp']
-                    })
+            # Build the whole file in memory and write it with a single call
+            csvfile = io.StringIO()
+            fieldnames = [
+                'wallet_address', 'arena_name', 'tokens_deployed',
+                'unique_victims', 'total_losses_avax', 'rug_score',
+                'blacklist_reasons', 'added_timestamp'
+            ]
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer.writeheader()
+
+            for entry in self.blacklist['blacklisted_users']:
+                writer.writerow({
+                    'wallet_address': entry['wallet_address'],
+                    'arena_name': entry['arena_name'],
+                    'tokens_deployed': entry['metrics']['tokens_deployed'],
+                    'unique_victims': entry['metrics']['unique_victims'],
+                    'total_losses_avax': entry['metrics']['total_losses_avax'],
+                    'rug_score': entry['metrics']['average_rug_score'],
+                    'blacklist_reasons': '; '.join(entry['blacklist_reasons']),
+                    'added_timestamp': entry['added_timestamp']
+                })
+
+            with open(filename, 'w', newline='') as f:
+                f.write(csvfile.getvalue())
 
             print(f"✅ Blacklist exported to {filename}")
         except Exception as e:
@@ -637,70 +1201,81 @@ class ArenaBlacklistTracker:
             filename = f"arena_blacklist_report_{datetime.now().strftime('%Y%m%d')}.md"
 
         try:
-            with open(filename, 'w') as f:
-                f.write("# Arena Community Safety Blacklist\n\n")
-                f.write(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
-                f.write("## ⚠️ WARNING\n")
-                f.write("The following users have been identified as harmful to the Arena community.\n")
-                f.write("**DO NOT** buy tokens from these creators.\n\n")
-
-                f.write("## 📊 Summary Statistics\n\n")
-                f.write(f"- Total Blacklisted Users: {len(self.blacklist['blacklisted_users'])}\n")
-                total_victims = sum(e['metrics']['unique_victims'] for e in self.blacklist['blacklisted_users'])
-                total_losses = sum(e['metrics']['total_losses_avax'] for e in self.blacklist['blacklisted_users'])
-                f.write(f"- Total Unique Victims: {total_victims}\n")
-                f.write(f"- Total Community Losses: {total_losses:.2f} AVAX\n\n")
-
-                f.write("## 🚫 Blacklisted Users\n\n")
-
-                # Sort by rug score
+            # Build the whole report in memory and write it with a single call
+            report = io.StringIO()
+            report.write("# Arena Community Safety Blacklist\n\n")
+            report.write(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
+            report.write("## ⚠️ WARNING\n")
+            report.write("The following users have been identified as harmful to the Arena community.\n")
+            report.write("**DO NOT** buy tokens from these creators.\n\n")
+
+            report.write("## 📊 Summary Statistics\n\n")
+            report.write(f"- Total Blacklisted Users: {len(self.blacklist['blacklisted_users'])}\n")
+            total_victims = sum(e['metrics']['unique_victims'] for e in self.blacklist['blacklisted_users'])
+            total_losses = sum(e['metrics']['total_losses_avax'] for e in self.blacklist['blacklisted_users'])
+            report.write(f"- Total Unique Victims: {total_victims}\n")
+            report.write(f"- Total Community Losses: {total_losses:.2f} AVAX\n\n")
+
+            report.write("## 🚫 Blacklisted Users\n\n")
+
+            # Sort by rug score (already maintained in order when sortedcontainers is available)
+            if self._by_score is not None:
+                sorted_blacklist = self._by_score
+            else:
                 sorted_blacklist = sorted(
                     self.blacklist['blacklisted_users'],
                     key=lambda x: x['metrics']['average_rug_score'],
                     reverse=True
                 )
 
-                for i, entry in enumerate(sorted_blacklist, 1):
-                    f.write(f"### {i}. {entry['arena_name']}\n")
-                    f.write(f"**Wallet:** `{entry['wallet_address']}`\n")
-                    f.write(f"**Rug Score:** {entry['metrics']['average_rug_score']:.1f}/100\n")
-                    f.write(f"**Tokens Created:** {entry['metrics']['tokens_deployed']}\n")
-                    f.write(f"**Victims:** {entry['metrics']['unique_victims']}\n")
-                    f.write(f"**Losses Caused:** {entry['metrics']['total_losses_avax']:.2f} AVAX ")
-                    f.write(f"(${entry['metrics']['total_losses_usd']:.2f})\n\n")
+            for i, entry in enumerate(sorted_blacklist, 1):
+                report.write(f"### {i}. {entry['arena_name']}\n")
+                report.write(f"**Wallet:** `{entry['wallet_address']}`\n")
+                report.write(f"**Rug Score:** {entry['metrics']['average_rug_score']:.1f}/100\n")
+                report.write(f"**Tokens Created:** {entry['metrics']['tokens_deployed']}\n")
+                report.write(f"**Victims:** {entry['metrics']['unique_victims']}\n")
+                report.write(f"**Losses Caused:** {entry['metrics']['total_losses_avax']:.2f} AVAX ")
+                report.write(f"(${entry['metrics']['total_losses_usd']:.2f})\n\n")
 
-                    f.write("**Violations:**\n")
-                    for vtype, count in entry['metrics']['violation_breakdown'].items():
-                        f.write(f"- {self.violation_types.get(vtype, vtype)}: {count} times\n")
+                report.write("**Violations:**\n")
+                for vtype, count in entry['metrics']['violation_breakdown'].items():
+                    report.write(f"- {self.violation_types.get(vtype, vtype)}: {count} times\n")
 
-                    f.write("\n**Blacklist Reasons:**\n")
-                    for reason in entry['blacklist_reasons']:
-                        f.write(f"- {reason}\n")
+                report.write("\n**Blacklist Reasons:**\n")
+                for reason in entry['blacklist_reasons']:
+                    report.write(f"- {reason}\n")
 
-                    f.write("\n---\n\n")
+                report.write("\n---\n\n")
 
-                f.write("## 📝 Notes\n\n")
-                f.write("- This blacklist is generated based on on-chain evidence\n")
-                f.write("- Users can appeal by demonstrating changed behavior\n")
-                f.write("- Always DYOR before buying any token\n")
-                f.write("- Report new bad actors to help protect the community\n")
+            report.write("## 📝 Notes\n\n")
+            report.write("- This blacklist is generated based on on-chain evidence\n")
+            report.write("- Users can appeal by demonstrating changed behavior\n")
+            report.write("- Always DYOR before buying any token\n")
+            report.write("- Report new bad actors to help protect the community\n")
+
+            with open(filename, 'w') as f:
+                f.write(report.getvalue())
 
             print(f"✅ Markdown report generated: {filename}")
         except Exception as e:
             print(f"❌ Error generating report: {e}")
 
+    def is_blacklisted(self, wallet_address: str) -> bool:
+        """Membership-only check for scanning bots; a single hash probe, no result dict"""
+        return wallet_address.lower() in self._by_wallet
+
     def check_wallet_status(self, wallet_address: str) -> Dict:
         """Quick check if a wallet is blacklisted"""
         wallet_lower = wallet_address.lower()
 
-        for entry in self.blacklist['blacklisted_users']:
-            if entry['wallet_address'] == wallet_lower:
-                return {
-                    'blacklisted': True,
-                    'arena_name': entry['arena_name'],
-                    'rug_score': entry['metrics']['average_rug_score'],
-                    'reasons': entry['blacklist_reasons']
-                }
+        entry = self._by_wallet.get(wallet_lower)
+        if entry is not None:
+            return {
+                'blacklisted': True,
+                'arena_name': entry['arena_name'],
+                'rug_score': entry['metrics']['average_rug_score'],
+                'reasons': entry['blacklist_reasons']
+            }
 
         return {'blacklisted': False}
 
@@ -730,6 +1305,7 @@ if __name__ == "__main__":
     results = tracker.batch_analyze_wallets(TEST_WALLETS)
 
     # Export results
+    tracker.export_json()
     tracker.export_blacklist_csv()
     tracker.generate_markdown_report()
 
@@ -746,6 +1322,7 @@ if __name__ == "__main__":
     print("=" * 70)
     print("✅ Blacklist generation complete!")
     print(f"📁 Files created:")
+    print(f"   - arena_blacklist.sqlite (Blacklist database)")
     print(f"   - arena_blacklist.json (JSON blacklist)")
     print(f"   - arena_blacklist_*.csv (CSV export)")
     print(f"   - arena_blacklist_report_*.md (Human-readable report)")
\ No newline at end of file
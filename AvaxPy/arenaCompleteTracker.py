@@ -5,16 +5,229 @@ Integrates all tracking systems to create a comprehensive blacklist of Arena bad
 Combines data from multiple sources to protect the community.
 """
 
+import argparse
+import atexit
+import glob
 import json
+import logging
 import os
+import queue
+import sys
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from dataclasses import dataclass, field
+from logging.handlers import QueueHandler, QueueListener
 from typing import List, Dict, Optional, Set
-import time
+
+from web3 import Web3
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; blacklists are sorted in Python instead
+    np = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
+from rate_limiter import AVAX_RPC_RATE, TokenBucket, shared_bucket
 
 # Import existing trackers
 from arenaProxyProfitTracker import ArenaProxyProfitTracker
 from arenaShitBagTracker import DeployerTokenTracker
 from arenaBlacklistTracker import ArenaBlacklistTracker
+from add_dune_wallets import load_grifters
+
+logger = logging.getLogger(__name__)
+
+# Sub-tracker results are cached per wallet for this many blocks (~30 min on the C-Chain);
+# finalized chain history doesn't change, so a rerun within the window skips the RPC work
+ANALYSIS_CACHE_DB = 'analysis_cache.db'
+CACHE_BLOCK_BUCKET = 1000
+
+# Risk score at or above which a wallet is blacklisted
+BLACKLIST_THRESHOLD = 40
+
+# Metric rules: (metric, threshold, risk points, violation type, severity, details format).
+# A wallet whose metric is >= threshold gains the points; rules without a violation
+# type only affect the score.
+PROFIT_RULES = (
+    ('tokens_deployed', 50, 30, 'serial_deployer', 'HIGH', "Deployed {value} tokens"),
+    ('total_profit_avax', 10, 20, 'high_profiteer', 'HIGH', "Profited {value:.2f} AVAX from dumps"),
+)
+DAMAGE_RULES = (
+    ('unique_victims', 10, 20, None, None, None),
+    ('total_losses_avax', 50, 20, None, None, None),
+    ('rug_score', 60, 10, None, None, None),
+)
+
+# Violation types seen more than this many times are HIGH severity, otherwise MEDIUM
+HIGH_SEVERITY_COUNT = 5
+
+# Bot export lists by minimum risk score, checked in order
+RISK_BUCKETS = (
+    (80, 'blacklisted_addresses'),
+    (60, 'high_risk_addresses'),
+    (0, 'medium_risk_addresses'),
+)
+
+# Metrics repeated in each entry's evidence_summary
+EVIDENCE_FIELDS = ('tokens_deployed', 'total_profit_avax', 'unique_victims', 'total_losses_avax', 'rug_score')
+
+# Fields of a blacklist entry kept in memory; violations and metrics are only streamed to disk
+SUMMARY_FIELDS = ('wallet_address', 'arena_name', 'risk_score', 'added_timestamp', 'evidence_summary')
+
+
+def _loads(raw):
+    """Parse JSON str/bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def setup_logging(quiet: bool = False) -> QueueListener:
+    """
+    Send this module's log output through a queue drained by one background thread,
+    so analysis worker threads never wait on stdout. quiet keeps only warnings.
+    """
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter('%(message)s'))
+    listener = QueueListener(log_queue, console)
+
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.WARNING if quiet else logging.INFO)
+    logger.propagate = False
+
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+def _dumps(data, indent: bool = False, default=None) -> bytes:
+    """Serialize to JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(data, indent=2 if indent else None, default=default).encode('utf-8')
+
+
+def _risk_bucket(risk_score: int) -> str:
+    """Name of the bot export list a risk score falls into"""
+    for min_risk, bucket in RISK_BUCKETS:
+        if risk_score >= min_risk:
+            return bucket
+    return RISK_BUCKETS[-1][1]
+
+
+def _risk_order(scores: List[int]) -> List[int]:
+    """Indices of scores from highest to lowest risk, ties kept in the order they were added"""
+    if np is not None:
+        return np.argsort(-np.asarray(scores, dtype=np.int32), kind='stable').tolist()
+    return sorted(range(len(scores)), key=lambda i: -scores[i])
+
+
+def _lines_at(f, offsets: List[int]):
+    """Yield the line starting at each byte offset of f"""
+    for offset in offsets:
+        f.seek(offset)
+        yield f.readline()
+
+
+def jsonl_to_json(jsonl_path: str, json_path: str, metadata: Dict,
+                  offsets: Optional[List[int]] = None):
+    """
+    Write the legacy single-object blacklist file from a streamed JSONL file.
+    metadata becomes the top-level fields and the JSONL lines become 'blacklisted_users',
+    copied one line at a time (in the order of the given byte offsets, if any)
+    so the full entry list is never loaded.
+    """
+    header = {k: v for k, v in metadata.items() if k != 'blacklisted_users'}
+    header['blacklisted_users'] = []
+    head, tail = _dumps(header).rsplit(b'[]', 1)
+
+    with open(jsonl_path, 'rb') as src, open(json_path, 'wb') as dst:
+        if offsets is None:
+            lines = src
+        else:
+            lines = _lines_at(src, offsets)
+        dst.write(head + b'[')
+        first = True
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            if not first:
+                dst.write(b',')
+            dst.write(line)
+            first = False
+        dst.write(b']' + tail)
+
+
+@dataclass(slots=True)
+class WalletAnalysis:
+    """
+    Result of analyze_wallet_complete for one wallet.
+    Metrics are plain attributes rather than a nested dict, so the scoring code
+    reads them without repeated dict lookups.
+    """
+    wallet_address: str
+    analysis_timestamp: str
+    arena_name: Optional[str] = None
+    violations: List[Dict] = field(default_factory=list)
+    evidence: Dict = field(default_factory=dict)
+    risk_score: int = 0
+    blacklist_status: bool = False
+
+    # Metrics
+    tokens_deployed: int = 0
+    total_profit_avax: float = 0.0
+    success_rate: float = 0.0
+    unique_victims: int = 0
+    total_losses_avax: float = 0.0
+    rug_score: float = 0.0
+
+    def apply_rules(self, rules):
+        """Add the risk points and violations of every rule whose threshold is met"""
+        for metric, threshold, points, violation_type, severity, details in rules:
+            value = getattr(self, metric)
+            if value >= threshold:
+                self.risk_score += points
+                if violation_type:
+                    self.violations.append({
+                        'type': violation_type,
+                        'details': details.format(value=value),
+                        'severity': severity
+                    })
+
+    def metrics(self) -> Dict:
+        """Metrics as the dict stored in blacklist entries"""
+        return {
+            'tokens_deployed': self.tokens_deployed,
+            'total_profit_avax': self.total_profit_avax,
+            'success_rate': self.success_rate,
+            'unique_victims': self.unique_victims,
+            'total_losses_avax': self.total_losses_avax,
+            'rug_score': self.rug_score
+        }
+
+
+def score_wallet(result: WalletAnalysis) -> WalletAnalysis:
+    """
+    Final risk assessment of a fetched wallet analysis: metric rules, the 100 cap
+    and the blacklist decision.
+    """
+    # Adjust risk score based on metrics
+    result.apply_rules(DAMAGE_RULES)
+
+    # Cap at 100
+    result.risk_score = min(100, result.risk_score)
+
+    # Determine blacklist status
+    result.blacklist_status = result.risk_score >= BLACKLIST_THRESHOLD
+    return result
 
 
 class ArenaCompleteTracker:
@@ -22,10 +235,33 @@ class ArenaCompleteTracker:
     Master tracker that combines all data sources to create the ultimate blacklist
     """
 
-    def __init__(self, rpc_url: str, api_key: str):
-        """Initialize all tracking components"""
+    def __init__(self, rpc_url: str, api_key: str,
+                 cache_db: str = ANALYSIS_CACHE_DB, refresh: bool = False,
+                 fast_mode: bool = False):
+        """
+        Initialize all tracking components
+
+        Args:
+            cache_db: SQLite file caching sub-tracker results
+            refresh: Ignore cached results and re-run every analysis
+            fast_mode: Skip the remaining on-chain phases once a wallet's score guarantees blacklisting
+        """
         self.rpc_url = rpc_url
         self.api_key = api_key
+        self.refresh = refresh
+
+        # Phases only ever add to the risk score, so once it reaches
+        # BLACKLIST_THRESHOLD + safety_margin the outcome can't change
+        self.fast_mode = fast_mode
+        self.safety_margin = 0
+
+        # Shared across worker threads, so every query goes through _cache_lock
+        self._cache_db = sqlite3.connect(cache_db, check_same_thread=False)
+        self._cache_db.execute(
+            "CREATE TABLE IF NOT EXISTS analysis_cache (key TEXT PRIMARY KEY, result TEXT NOT NULL)"
+        )
+        self._cache_lock = threading.Lock()
+        self._cache_bucket = None
 
         # Initialize sub-trackers
         self.profit_tracker = ArenaProxyProfitTracker(
@@ -35,8 +271,29 @@ class ArenaCompleteTracker:
         self.shitbag_tracker = DeployerTokenTracker(rpc_url, api_key)
         self.blacklist_tracker = ArenaBlacklistTracker(rpc_url, api_key)
 
-        # Load known grifters
+        # Load known grifters, indexed by lowercased wallet for O(1) lookups
         self.known_grifters = self.load_known_grifters()
+        self.grifter_index = {
+            g['wallet_address'].lower(): g for g in self.known_grifters.get('known_grifters', [])
+        }
+
+        # Arena names shared with the blacklist tracker (persisted to its names cache file),
+        # seeded with the names the grifter list already gives us
+        self.arena_name_cache: Dict[str, str] = self.blacklist_tracker.arena_names_cache
+        for wallet, grifter in self.grifter_index.items():
+            if grifter.get('arena_name'):
+                self.blacklist_tracker.remember_arena_name(wallet, grifter['arena_name'])
+
+        # Wallets are analyzed concurrently (the work is RPC/HTTP-bound);
+        # wallet starts are paced so the combined request rate stays bounded
+        self.max_workers = 16
+        self.wallets_per_second = 3
+        self._wallet_limiter = TokenBucket(rate=self.wallets_per_second)
+
+        # Per-wallet RPC lookups are sent as JSON-RPC batches of this size
+        # (kept small since some providers meter each call in a batch)
+        self.rpc_batch_size = 25
+        self._rpc_limiter = shared_bucket('avax_rpc', rate=AVAX_RPC_RATE)
 
         # Master blacklist
         self.master_blacklist = {
@@ -46,259 +303,462 @@ class ArenaCompleteTracker:
             'total_victims_protected': 0,
             'total_losses_prevented_avax': 0.0,
             'blacklisted_users': [],
-            'statistics': {}
+            'statistics': {},
+            # For incremental runs: chain height and each analyzed wallet's nonce at analysis time
+            'last_block_analyzed': None,
+            'wallet_nonces': {}
         }
 
+        # JSONL file the current build streams full entries to (see build_master_blacklist)
+        self.blacklist_jsonl = None
+        self._entry_offsets = []
+        self._seen_blacklisted: Set[str] = set()
+
+        # Distinct victims of blacklisted wallets; addresses are interned since
+        # the same victims recur across many deployers
+        self._victims_protected: Set[str] = set()
+
+        # Blacklisted wallets grouped for export_for_bots, filled as entries are added
+        self._risk_buckets: Dict[str, List[str]] = {bucket: [] for _, bucket in RISK_BUCKETS}
+
     def load_known_grifters(self) -> Dict:
         """Load the known grifters list from Dune Analytics data"""
         try:
-            with open('known_grifters.json', 'r') as f:
-                return json.load(f)
+            # Includes entries still sitting in the known_grifters.jsonl journal;
+            # load_grifters caches the parsed file until it changes on disk
+            return load_grifters()
         except FileNotFoundError:
-            print("⚠️ Known grifters file not found. Creating empty list.")
+            logger.warning("⚠️ Known grifters file not found. Creating empty list.")
             return {'known_grifters': [], 'additional_suspicious_wallets': []}
 
-    def analyze_wallet_complete(self, wallet_address: str) -> Dict:
+    def _cached_analysis(self, name: str, wallet_address: str, analyze):
+        """
+        Return the cached result of a sub-tracker analysis for this wallet, or run
+        analyze() and cache it. Keys are name:wallet:block bucket, so entries expire
+        every CACHE_BLOCK_BUCKET blocks. wallet_address must already be lowercased.
+        """
+        if self._cache_bucket is None:
+            self._cache_bucket = self.profit_tracker.get_latest_block_number() // CACHE_BLOCK_BUCKET
+        if not self._cache_bucket:
+            # Block height unknown; don't cache under a key that never expires
+            return analyze()
+
+        key = f"{name}:{wallet_address}:{self._cache_bucket}"
+        if not self.refresh:
+            with self._cache_lock:
+                row = self._cache_db.execute(
+                    "SELECT result FROM analysis_cache WHERE key = ?", (key,)
+                ).fetchone()
+            if row is not None:
+                logger.info(f"   💾 Using cached {name} analysis")
+                return _loads(row[0])
+
+        result = analyze()
+        with self._cache_lock:
+            self._cache_db.execute(
+                "INSERT OR REPLACE INTO analysis_cache (key, result) VALUES (?, ?)",
+                (key, _dumps(result, default=str))
+            )
+            self._cache_db.commit()
+        return result
+
+    def _batch_per_wallet(self, wallet_addresses: List[str], request, what: str) -> Dict[str, int]:
+        """
+        Run request(w3, checksum_address) for many wallets in JSON-RPC batches of
+        rpc_batch_size. Returns integer results keyed by checksum address; wallets
+        whose batch failed are left out.
+        """
+        w3 = self.profit_tracker.w3
+        wallets = [Web3.to_checksum_address(w) for w in wallet_addresses if Web3.is_address(w)]
+        results = {}
+
+        for start in range(0, len(wallets), self.rpc_batch_size):
+            chunk = wallets[start:start + self.rpc_batch_size]
+            try:
+                self._rpc_limiter.acquire()
+                with w3.batch_requests() as batch:
+                    for wallet in chunk:
+                        batch.add(request(w3, wallet))
+                    values = batch.execute()
+            except Exception as e:
+                logger.warning(f"⚠️ Batched {what} lookup failed: {e}")
+                continue
+
+            for wallet, value in zip(chunk, values):
+                if isinstance(value, int):
+                    results[wallet] = value
+        return results
+
+    def prefetch_balances(self, wallet_addresses: List[str]):
+        """
+        Fetch AVAX balances for many wallets in JSON-RPC batches, so the profit
+        tracker doesn't make one eth_getBalance round trip per wallet
+        """
+        w3 = self.profit_tracker.w3
+        balances = self._batch_per_wallet(
+            wallet_addresses, lambda w3, wallet: w3.eth.get_balance(wallet), 'balance'
+        )
+        for wallet, balance_wei in balances.items():
+            self.profit_tracker.balance_cache[wallet] = float(w3.from_wei(balance_wei, 'ether'))
+
+    def fetch_nonces(self, wallet_addresses: List[str]) -> Dict[str, int]:
+        """
+        Transaction counts for many wallets, keyed by lowercased address.
+        A wallet whose nonce hasn't changed has sent no transactions since it was last seen.
+        """
+        nonces = self._batch_per_wallet(
+            wallet_addresses, lambda w3, wallet: w3.eth.get_transaction_count(wallet), 'nonce'
+        )
+        return {wallet.lower(): nonce for wallet, nonce in nonces.items()}
+
+    def load_previous_blacklist(self, filename: Optional[str] = None) -> Optional[Dict]:
+        """Load the given master blacklist JSON, or the newest arena_master_blacklist_*.json"""
+        if filename is None:
+            candidates = sorted(glob.glob('arena_master_blacklist_*.json'))
+            if not candidates:
+                return None
+            filename = candidates[-1]
+
+        try:
+            with open(filename, 'rb') as f:
+                previous = _loads(f.read())
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Could not load previous blacklist {filename}: {e}")
+            return None
+
+        logger.info(f"📂 Previous blacklist: {filename} "
+                    f"(block {previous.get('last_block_analyzed', 'unknown')})")
+        return previous
+
+    def analyze_wallet_complete(self, wallet_address: str, ts: Optional[str] = None) -> WalletAnalysis:
         """
         Complete analysis using all available data sources
+
+        Args:
+            ts: Analysis timestamp to record; batch runs pass one shared run timestamp
         """
-        print(f"\n{'='*80}")
-        print(f"🔍 COMPLETE ANALYSIS: {wallet_address}")
-        print(f"{'='*80}\n")
-
-        result = {
-            'wallet_address': wallet_address.lower(),
-            'arena_name': None,
-            'analysis_timestamp': datetime.now().isoformat(),
-            'violations': [],
-            'metrics': {},
-            'evidence': {},
-            'risk_score': 0,
-            'blacklist_status': False
-        }
+        # Canonical form for every lookup below; sub-trackers normalize case themselves
+        wallet_address = wallet_address.lower()
+
+        logger.info(f"\n{'='*80}")
+        logger.info(f"🔍 COMPLETE ANALYSIS: {wallet_address}")
+        logger.info(f"{'='*80}\n")
+
+        result = WalletAnalysis(
+            wallet_address=wallet_address,
+            analysis_timestamp=ts or datetime.now().isoformat()
+        )
 
         # 1. Check if in known grifters list
-        print("[1/5] Checking known grifters list...")
-        for grifter in self.known_grifters.get('known_grifters', []):
-            if grifter['wallet_address'].lower() == wallet_address.lower():
-                result['arena_name'] = grifter['arena_name']
-                result['violations'].append({
-                    'type': 'known_grifter',
-                    'source': 'Dune Analytics',
-                    'details': grifter['notes'],
-                    'severity': 'CRITICAL'
-                })
-                result['risk_score'] += 50
-                print(f"   ⚠️ FOUND in known grifters list: {grifter['arena_name']}")
+        logger.info("[1/5] Checking known grifters list...")
+        grifter = self.grifter_index.get(wallet_address)
+        if grifter is not None:
+            result.arena_name = grifter['arena_name']
+            result.violations.append({
+                'type': 'known_grifter',
+                'source': 'Dune Analytics',
+                'details': grifter['notes'],
+                'severity': 'CRITICAL'
+            })
+            result.risk_score += 50
+            logger.info(f"   ⚠️ FOUND in known grifters list: {grifter['arena_name']}")
+
+        # 2-4. On-chain analyses; in fast mode, stop once the wallet is certain to be blacklisted
+        phases = [
+            ("[2/5] Analyzing profit patterns...", self._analyze_profit),
+            ("[3/5] Checking deployment patterns...", self._analyze_deployment),
+            ("[4/5] Analyzing community damage...", self._analyze_damage),
+        ]
+        for label, phase in phases:
+            if self.fast_mode and result.risk_score >= BLACKLIST_THRESHOLD + self.safety_margin:
+                logger.info(f"   ⏩ Fast mode: risk {result.risk_score} already decisive, skipping remaining phases")
                 break
+            logger.info(label)
+            phase(result, wallet_address)
 
-        # 2. Analyze with profit tracker
-        print("[2/5] Analyzing profit patterns...")
+        # 5. Calculate final risk score
+        logger.info("[5/5] Calculating risk assessment...")
+        result = score_wallet(result)
+
+        # Risk level
+        if result.risk_score >= 80:
+            risk_level = "🔴 EXTREME RISK"
+        elif result.risk_score >= 60:
+            risk_level = "🟠 HIGH RISK"
+        elif result.risk_score >= 40:
+            risk_level = "🟡 MEDIUM RISK"
+        elif result.risk_score >= 20:
+            risk_level = "🟢 LOW RISK"
+        else:
+            risk_level = "⚪ MINIMAL RISK"
+
+        logger.info(f"\n   📊 RISK SCORE: {result.risk_score}/100 - {risk_level}")
+        logger.info(f"   🚫 BLACKLIST: {'YES - DO NOT BUY' if result.blacklist_status else 'NO - Proceed with caution'}")
+
+        return result
+
+    def _analyze_profit(self, result: WalletAnalysis, wallet_address: str):
+        """Phase 2: deployment count and dump profits from the profit tracker"""
         try:
-            profit_analysis = self.profit_tracker.analyze_wallet(wallet_address)
+            profit_analysis = self._cached_analysis(
+                'profit', wallet_address,
+                lambda: self.profit_tracker.analyze_wallet(wallet_address)
+            )
 
             if profit_analysis:
                 tokens_deployed = profit_analysis.get('num_tokens_deployed', 0)
                 total_profit = profit_analysis.get('total_profit_avax', 0)
                 success_rate = profit_analysis.get('success_rate', 0)
 
-                result['metrics']['tokens_deployed'] = tokens_deployed
-                result['metrics']['total_profit_avax'] = total_profit
-                result['metrics']['success_rate'] = success_rate
+                result.tokens_deployed = tokens_deployed
+                result.total_profit_avax = total_profit
+                result.success_rate = success_rate
 
                 # Check for violations
-                if tokens_deployed >= 50:
-                    result['violations'].append({
-                        'type': 'serial_deployer',
-                        'details': f"Deployed {tokens_deployed} tokens",
-                        'severity': 'HIGH'
-                    })
-                    result['risk_score'] += 30
+                result.apply_rules(PROFIT_RULES)
 
-                if total_profit >= 10:
-                    result['violations'].append({
-                        'type': 'high_profiteer',
-                        'details': f"Profited {total_profit:.2f} AVAX from dumps",
-                        'severity': 'HIGH'
-                    })
-                    result['risk_score'] += 20
-
-                print(f"   📊 Tokens: {tokens_deployed}, Profit: {total_profit:.2f} AVAX")
+                logger.info(f"   📊 Tokens: {tokens_deployed}, Profit: {total_profit:.2f} AVAX")
         except Exception as e:
-            print(f"   ❌ Profit analysis failed: {e}")
+            logger.warning(f"   ❌ Profit analysis failed: {e}")
 
-        # 3. Check with shitbag tracker
-        print("[3/5] Checking deployment patterns...")
+    def _analyze_deployment(self, result: WalletAnalysis, wallet_address: str):
+        """Phase 3: existing blacklist status and serial deployment from the shitbag tracker"""
         try:
             # Check if already blacklisted
             if self.shitbag_tracker.is_blacklisted(wallet_address):
-                result['violations'].append({
+                result.violations.append({
                     'type': 'previously_blacklisted',
                     'details': 'Already in shitbag tracker blacklist',
                     'severity': 'CRITICAL'
                 })
-                result['risk_score'] += 40
-                print(f"   🚫 Already blacklisted in shitbag tracker")
+                result.risk_score += 40
+                logger.info(f"   🚫 Already blacklisted in shitbag tracker")
 
             # Analyze serial deployment
-            serial_analysis = self.shitbag_tracker.analyze_serial_deployer(
-                wallet_address, min_tokens=50, min_profit=10
+            serial_analysis = self._cached_analysis(
+                'serial', wallet_address,
+                lambda: self.shitbag_tracker.analyze_serial_deployer(
+                    wallet_address, min_tokens=50, min_profit=10
+                )
             )
 
             if serial_analysis:
-                result['evidence']['serial_deployment'] = serial_analysis
-                print(f"   ⚠️ Serial deployer confirmed")
+                result.evidence['serial_deployment'] = serial_analysis
+                logger.info(f"   ⚠️ Serial deployer confirmed")
         except Exception as e:
-            print(f"   ❌ Deployment pattern check failed: {e}")
+            logger.warning(f"   ❌ Deployment pattern check failed: {e}")
 
-        # 4. Enhanced blacklist analysis
-        print("[4/5] Analyzing community damage...")
+    def _analyze_damage(self, result: WalletAnalysis, wallet_address: str):
+        """Phase 4: victims, losses and rug score from the blacklist tracker"""
         try:
-            blacklist_analysis = self.blacklist_tracker.analyze_deployer_history(wallet_address)
+            blacklist_analysis = self._cached_analysis(
+                'community_damage', wallet_address,
+                lambda: self.blacklist_tracker.analyze_deployer_history(
+                    wallet_address, known_name=result.arena_name or self.arena_name_cache.get(wallet_address)
+                )
+            )
 
             if blacklist_analysis:
-                result['metrics']['unique_victims'] = blacklist_analysis.get('unique_victims', 0)
-                result['metrics']['total_losses_avax'] = blacklist_analysis.get('total_losses_avax', 0)
-                result['metrics']['rug_score'] = blacklist_analysis.get('average_rug_score', 0)
+                result.unique_victims = blacklist_analysis.get('unique_victims', 0)
+                result.total_losses_avax = blacklist_analysis.get('total_losses_avax', 0)
+                result.rug_score = blacklist_analysis.get('average_rug_score', 0)
+                result.evidence['victims'] = blacklist_analysis.get('distinct_victim_addresses', [])
 
                 # Update arena name if found
-                if not result['arena_name']:
-                    result['arena_name'] = blacklist_analysis.get('arena_name')
+                if not result.arena_name:
+                    result.arena_name = blacklist_analysis.get('arena_name')
 
                 # Add violation details
                 for violation_type, count in blacklist_analysis.get('violation_counts', {}).items():
                     if count > 0:
-                        result['violations'].append({
+                        result.violations.append({
                             'type': violation_type,
                             'count': count,
-                            'severity': 'HIGH' if count > 5 else 'MEDIUM'
+                            'severity': 'HIGH' if count > HIGH_SEVERITY_COUNT else 'MEDIUM'
                         })
 
-                print(f"   👥 Victims: {result['metrics']['unique_victims']}")
-                print(f"   💰 Losses: {result['metrics']['total_losses_avax']:.2f} AVAX")
+                logger.info(f"   👥 Victims: {result.unique_victims}")
+                logger.info(f"   💰 Losses: {result.total_losses_avax:.2f} AVAX")
         except Exception as e:
-            print(f"   ❌ Community damage analysis failed: {e}")
-
-        # 5. Calculate final risk score
-        print("[5/5] Calculating risk assessment...")
-
-        # Adjust risk score based on metrics
-        if result['metrics'].get('unique_victims', 0) >= 10:
-            result['risk_score'] += 20
-        if result['metrics'].get('total_losses_avax', 0) >= 50:
-            result['risk_score'] += 20
-        if result['metrics'].get('rug_score', 0) >= 60:
-            result['risk_score'] += 10
-
-        # Cap at 100
-        result['risk_score'] = min(100, result['risk_score'])
+            logger.warning(f"   ❌ Community damage analysis failed: {e}")
 
-        # Determine blacklist status
-        result['blacklist_status'] = result['risk_score'] >= 40
-
-        # Risk level
-        if result['risk_score'] >= 80:
-            risk_level = "🔴 EXTREME RISK"
-        elif result['risk_score'] >= 60:
-            risk_level = "🟠 HIGH RISK"
-        elif result['risk_score'] >= 40:
-            risk_level = "🟡 MEDIUM RISK"
-        elif result['risk_score'] >= 20:
-            risk_level = "🟢 LOW RISK"
-        else:
-            risk_level = "⚪ MINIMAL RISK"
-
-        print(f"\n   📊 RISK SCORE: {result['risk_score']}/100 - {risk_level}")
-        print(f"   🚫 BLACKLIST: {'YES - DO NOT BUY' if result['blacklist_status'] else 'NO - Proceed with caution'}")
-
-        return result
-
-    def build_master_blacklist(self, wallet_addresses: List[str]):
+    def build_master_blacklist(self, wallet_addresses: List[str], previous: Optional[Dict] = None):
         """
         Build the master blacklist from all data sources
+
+        Args:
+            previous: An earlier master blacklist (see load_previous_blacklist). Wallets that
+                      have sent no transactions since then keep their previous result
+                      instead of being re-analyzed. Their scores are not refreshed, so
+                      losses from trades in their tokens since then aren't counted.
         """
-        print(f"\n{'#'*80}")
-        print(f"# 🛡️ BUILDING MASTER ARENA BLACKLIST")
-        print(f"# Analyzing {len(wallet_addresses)} wallets")
-        print(f"{'#'*80}\n")
+        # The Dune list and the additional wallets often overlap; analyze each wallet once
+        wallet_addresses = list(dict.fromkeys(w.lower() for w in wallet_addresses))
+
+        # Chain height and nonces at the start of this run, recorded for the next incremental run
+        latest_block = self.profit_tracker.get_latest_block_number()
+        nonces = self.fetch_nonces(wallet_addresses)
+        wallet_nonces = self.master_blacklist['wallet_nonces']
+
+        to_analyze = wallet_addresses
+        carried_over = []
+        if previous:
+            prior_nonces = previous.get('wallet_nonces', {})
+            unchanged = {
+                w for w in wallet_addresses
+                if w in prior_nonces and nonces.get(w) == prior_nonces[w]
+            }
+            prior_entries = {e['wallet_address']: e for e in previous.get('blacklisted_users', [])}
+            carried_over = [prior_entries[w] for w in wallet_addresses if w in unchanged and w in prior_entries]
+            to_analyze = [w for w in wallet_addresses if w not in unchanged]
+            for wallet in unchanged:
+                wallet_nonces[wallet] = prior_nonces[wallet]
+
+        logger.info(f"\n{'#'*80}")
+        logger.info(f"# 🛡️ BUILDING MASTER ARENA BLACKLIST")
+        logger.info(f"# Analyzing {len(to_analyze)} wallets")
+        if previous:
+            logger.info(f"# ♻️ {len(wallet_addresses) - len(to_analyze)} unchanged since the previous run")
+        logger.info(f"{'#'*80}\n")
 
         blacklisted_count = 0
-        total_victims = set()
         total_losses = 0.0
 
-        for i, wallet in enumerate(wallet_addresses, 1):
-            print(f"\n[{i}/{len(wallet_addresses)}] Processing...")
-
-            try:
-                analysis = self.analyze_wallet_complete(wallet)
-
-                if analysis['blacklist_status']:
-                    # Add to master blacklist
-                    entry = {
-                        'wallet_address': analysis['wallet_address'],
-                        'arena_name': analysis['arena_name'] or f"@unknown_{wallet[:8]}",
-                        'risk_score': analysis['risk_score'],
-                        'violations': analysis['violations'],
-                        'metrics': analysis['metrics'],
-                        'added_timestamp': datetime.now().isoformat(),
-                        'evidence_summary': {
-                            'tokens_deployed': analysis['metrics'].get('tokens_deployed', 0),
-                            'total_profit_avax': analysis['metrics'].get('total_profit_avax', 0),
-                            'unique_victims': analysis['metrics'].get('unique_victims', 0),
-                            'total_losses_avax': analysis['metrics'].get('total_losses_avax', 0),
-                            'rug_score': analysis['metrics'].get('rug_score', 0)
-                        }
-                    }
-
-                    self.master_blacklist['blacklisted_users'].append(entry)
+        self.prefetch_balances(to_analyze)
+
+        # One timestamp for the whole run, shared by every analysis and entry
+        run_ts = datetime.now()
+        run_ts_iso = run_ts.isoformat()
+
+        # Full entries are streamed to JSONL as they're produced; only summaries
+        # and each entry's (risk_score, byte offset) stay in memory. Repeated builds
+        # on one tracker append to the same file, so earlier offsets stay valid.
+        if self.blacklist_jsonl is None:
+            self.blacklist_jsonl = f"arena_master_blacklist_{run_ts.strftime('%Y%m%d_%H%M%S')}.jsonl"
+        stream = open(self.blacklist_jsonl, 'ab')
+
+        def analyze(wallet):
+            self._wallet_limiter.acquire()
+            return self.analyze_wallet_complete(wallet, ts=run_ts_iso)
+
+        def add(analysis):
+            nonlocal blacklisted_count, total_losses
+            if self._add_to_master(analysis, stream, run_ts_iso):
+                blacklisted_count += 1
+                total_losses += analysis.total_losses_avax
+
+        with stream:
+            # Previous entries for unchanged wallets are copied as they were, victims included
+            # (entries from files written before victims were stored contribute none)
+            for entry in carried_over:
+                if self._stream_entry(entry, stream, victims=entry.get('victims', ())):
                     blacklisted_count += 1
+                    total_losses += entry.get('metrics', {}).get('total_losses_avax', 0)
 
-                    # Update statistics
-                    victims_count = analysis['metrics'].get('unique_victims', 0)
-                    losses = analysis['metrics'].get('total_losses_avax', 0)
-                    total_losses += losses
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = {pool.submit(analyze, wallet): wallet for wallet in to_analyze}
 
-                    print(f"   ❌ BLACKLISTED: {entry['arena_name']}")
+                for i, future in enumerate(as_completed(futures), 1):
+                    wallet = futures[future]
+                    logger.info(f"\n[{i}/{len(to_analyze)}] Finished {wallet}")
 
-            except Exception as e:
-                print(f"   ⚠️ Error analyzing {wallet}: {e}")
-                continue
+                    try:
+                        add(future.result())
+                    except Exception as e:
+                        logger.warning(f"   ⚠️ Error analyzing {wallet}: {e}")
+                        continue
 
-            time.sleep(0.3)  # Rate limiting
+                    # Only wallets analyzed successfully can be skipped next time
+                    if wallet in nonces:
+                        wallet_nonces[wallet] = nonces[wallet]
 
         # Update master blacklist metadata
         self.master_blacklist['last_updated'] = datetime.now().isoformat()
+        if latest_block:
+            self.master_blacklist['last_block_analyzed'] = latest_block
         self.master_blacklist['total_bad_actors'] = blacklisted_count
+        self.master_blacklist['total_victims_protected'] = len(self._victims_protected)
         self.master_blacklist['total_losses_prevented_avax'] = total_losses
 
-        # Sort by risk score
-        self.master_blacklist['blacklisted_users'].sort(
-            key=lambda x: x['risk_score'],
-            reverse=True
-        )
-
-        print(f"\n{'#'*80}")
-        print(f"# ✅ MASTER BLACKLIST COMPLETE")
-        print(f"{'#'*80}")
-        print(f"  Total Analyzed:        {len(wallet_addresses)}")
-        print(f"  Blacklisted:          {blacklisted_count}")
-        print(f"  Clean:                {len(wallet_addresses) - blacklisted_count}")
-        print(f"  Losses Documented:    {total_losses:.2f} AVAX")
-        print(f"{'#'*80}\n")
+        # Sort by risk score, reordering summaries and their JSONL offsets with one argsort
+        order = _risk_order([risk for risk, _ in self._entry_offsets])
+        users = self.master_blacklist['blacklisted_users']
+        self.master_blacklist['blacklisted_users'] = [users[i] for i in order]
+        self._entry_offsets = [self._entry_offsets[i] for i in order]
+
+        logger.info(f"\n{'#'*80}")
+        logger.info(f"# ✅ MASTER BLACKLIST COMPLETE")
+        logger.info(f"{'#'*80}")
+        logger.info(f"  Total Analyzed:        {len(wallet_addresses)}")
+        logger.info(f"  Blacklisted:          {blacklisted_count}")
+        logger.info(f"  Clean:                {len(wallet_addresses) - blacklisted_count}")
+        logger.info(f"  Losses Documented:    {total_losses:.2f} AVAX")
+        logger.info(f"  Victims Protected:    {len(self._victims_protected)}")
+        logger.info(f"{'#'*80}\n")
 
         return self.master_blacklist
 
+    def _add_to_master(self, analysis: WalletAnalysis, stream, run_ts_iso: str) -> bool:
+        """
+        Stream a scored analysis to the master blacklist if it's blacklisted and new.
+        Returns whether it was added.
+        """
+        if not analysis.blacklist_status:
+            return False
+
+        metrics = analysis.metrics()
+        entry = {
+            'wallet_address': analysis.wallet_address,
+            'arena_name': analysis.arena_name or f"@unknown_{analysis.wallet_address[:8]}",
+            'risk_score': analysis.risk_score,
+            'violations': analysis.violations,
+            'metrics': metrics,
+            'added_timestamp': run_ts_iso,
+            'evidence_summary': {field: metrics[field] for field in EVIDENCE_FIELDS},
+            # Kept in the full entry so incremental runs can re-count carried-over victims
+            'victims': list(analysis.evidence.get('victims', ()))
+        }
+        return self._stream_entry(entry, stream, victims=entry['victims'])
+
+    def _stream_entry(self, entry: Dict, stream, victims=()) -> bool:
+        """
+        Write a full blacklist entry to the JSONL stream and index its summary.
+        Returns False if the wallet is already on the master blacklist.
+        """
+        if entry['wallet_address'] in self._seen_blacklisted:
+            return False
+
+        self._seen_blacklisted.add(entry['wallet_address'])
+        self._risk_buckets[_risk_bucket(entry['risk_score'])].append(entry['wallet_address'])
+        self._entry_offsets.append((entry['risk_score'], stream.tell()))
+        stream.write(_dumps(entry) + b'\n')
+        stream.flush()
+        self.master_blacklist['blacklisted_users'].append(
+            {field: entry[field] for field in SUMMARY_FIELDS}
+        )
+        self._victims_protected.update(sys.intern(victim) for victim in victims)
+
+        logger.info(f"   ❌ BLACKLISTED: {entry['arena_name']}")
+        return True
+
     def save_master_blacklist(self):
-        """Save the master blacklist to JSON"""
+        """
+        Save the master blacklist to JSON, built from the JSONL streamed by
+        build_master_blacklist with entries ordered by risk score
+        """
         filename = f"arena_master_blacklist_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
         try:
-            with open(filename, 'w') as f:
-                json.dump(self.master_blacklist, f, indent=2)
-            print(f"✅ Master blacklist saved: {filename}")
+            if self.blacklist_jsonl:
+                jsonl_to_json(self.blacklist_jsonl, filename, self.master_blacklist,
+                              offsets=[offset for _, offset in self._entry_offsets])
+            else:
+                with open(filename, 'wb') as f:
+                    f.write(_dumps(self.master_blacklist, indent=True))
+            logger.info(f"✅ Master blacklist saved: {filename}")
             return filename
         except Exception as e:
-            print(f"❌ Error saving master blacklist: {e}")
+            logger.warning(f"❌ Error saving master blacklist: {e}")
             return None
 
     def generate_safe_traders_list(self) -> Dict:
@@ -328,90 +788,96 @@ class ArenaCompleteTracker:
     def export_for_bots(self) -> str:
         """
         Export blacklist in format suitable for trading bots
-        Simple JSON array of addresses to avoid
+        Simple JSON array of addresses to avoid, from the buckets filled by build_master_blacklist
         """
         bot_blacklist = {
             'version': '1.0',
             'updated': datetime.now().isoformat(),
-            'blacklisted_addresses': [],
-            'high_risk_addresses': [],
-            'medium_risk_addresses': []
+            **self._risk_buckets
         }
 
-        for entry in self.master_blacklist['blacklisted_users']:
-            wallet = entry['wallet_address']
-            risk = entry['risk_score']
-
-            if risk >= 80:
-                bot_blacklist['blacklisted_addresses'].append(wallet)
-            elif risk >= 60:
-                bot_blacklist['high_risk_addresses'].append(wallet)
-            else:
-                bot_blacklist['medium_risk_addresses'].append(wallet)
-
         filename = f"arena_bot_blacklist_{datetime.now().strftime('%Y%m%d')}.json"
 
-        with open(filename, 'w') as f:
-            json.dump(bot_blacklist, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(_dumps(bot_blacklist, indent=True))
 
-        print(f"✅ Bot blacklist exported: {filename}")
+        logger.info(f"✅ Bot blacklist exported: {filename}")
         return filename
 
 
 def main():
     """Main execution"""
-    print("\n" + "="*80)
-    print("🛡️ ARENA COMPLETE BLACKLIST SYSTEM 🛡️")
-    print("Protecting the community from ruggers, scammers, and bad actors")
-    print("="*80 + "\n")
+    parser = argparse.ArgumentParser(description="Build the Arena master blacklist")
+    parser.add_argument('--refresh', action='store_true',
+                        help=f"ignore cached analyses in {ANALYSIS_CACHE_DB} and re-query everything")
+    parser.add_argument('--fast', action='store_true',
+                        help="skip remaining analyses once a wallet is certain to be blacklisted "
+                             "(faster, but leaves some evidence metrics empty)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="reuse the newest arena_master_blacklist_*.json for wallets "
+                             "that have sent no transactions since it was built; their scores "
+                             "are carried over as-is and miss later trading in their tokens "
+                             "(run without it periodically to refresh them)")
+    parser.add_argument('--quiet', action='store_true',
+                        help="only log warnings and errors")
+    args = parser.parse_args()
+
+    setup_logging(quiet=args.quiet)
+
+    logger.info("\n" + "="*80)
+    logger.info("🛡️ ARENA COMPLETE BLACKLIST SYSTEM 🛡️")
+    logger.info("Protecting the community from ruggers, scammers, and bad actors")
+    logger.info("="*80 + "\n")
 
     # Configuration
     RPC_URL = "https://api.avax.network/ext/bc/C/rpc"
     API_KEY = "YOUR_SNOWTRACE_API_KEY"  # Replace with actual key
 
     # Initialize master tracker
-    tracker = ArenaCompleteTracker(RPC_URL, API_KEY)
+    tracker = ArenaCompleteTracker(RPC_URL, API_KEY, refresh=args.refresh, fast_mode=args.fast)
 
-    # Load known grifters
-    known_grifters = tracker.load_known_grifters()
+    # Known grifters were already loaded by the tracker
+    known_grifters = tracker.known_grifters
     grifter_wallets = [g['wallet_address'] for g in known_grifters.get('known_grifters', [])]
 
-    # Add any additional suspicious wallets
-    additional_wallets = known_grifters.get('additional_suspicious_wallets', [])
-    if additional_wallets and additional_wallets[0] != "ADD_WALLET_ADDRESSES_FROM_DUNE_HERE":
-        grifter_wallets.extend(additional_wallets)
+    # Add any additional suspicious wallets; placeholders such as
+    # "ADD_WALLET_ADDRESSES_FROM_DUNE_HERE" aren't addresses and are skipped wherever they sit
+    grifter_wallets.extend(known_grifters.get('additional_suspicious_wallets', []))
+    grifter_wallets = [w for w in grifter_wallets if Web3.is_address(w)]
 
-    print(f"📋 Loaded {len(grifter_wallets)} known grifters from Dune Analytics data")
-    print("Starting comprehensive analysis...\n")
+    logger.info(f"📋 Loaded {len(grifter_wallets)} known grifters from Dune Analytics data")
+    logger.info("Starting comprehensive analysis...\n")
 
     # Build master blacklist
-    master_blacklist = tracker.build_master_blacklist(grifter_wallets)
+    previous = tracker.load_previous_blacklist() if args.incremental else None
+    master_blacklist = tracker.build_master_blacklist(grifter_wallets, previous=previous)
 
     # Save all outputs
     tracker.save_master_blacklist()
     tracker.export_for_bots()
 
     # Print top offenders
-    print("\n🚫 TOP 5 WORST OFFENDERS")
-    print("="*80)
+    logger.info("\n🚫 TOP 5 WORST OFFENDERS")
+    logger.info("="*80)
 
     for i, entry in enumerate(master_blacklist['blacklisted_users'][:5], 1):
-        print(f"\n{i}. {entry['arena_name']}")
-        print(f"   Wallet: {entry['wallet_address']}")
-        print(f"   Risk Score: {entry['risk_score']}/100")
-        print(f"   Tokens Created: {entry['evidence_summary']['tokens_deployed']}")
-        print(f"   Victims: {entry['evidence_summary']['unique_victims']}")
-        print(f"   Losses Caused: {entry['evidence_summary']['total_losses_avax']:.2f} AVAX")
-
-    print("\n" + "="*80)
-    print("✅ BLACKLIST GENERATION COMPLETE!")
-    print(f"📁 Files created:")
-    print(f"   - arena_master_blacklist_*.json (Complete blacklist with evidence)")
-    print(f"   - arena_bot_blacklist_*.json (Simple list for trading bots)")
-    print(f"   - known_grifters.json (Source data from Dune)")
-    print("\n⚠️ IMPORTANT: Add wallet addresses from Dune Analytics to known_grifters.json")
-    print("   Visit: https://dune.com/couchdicks/arenatrade-top-grifters")
-    print("="*80)
+        logger.info(f"\n{i}. {entry['arena_name']}")
+        logger.info(f"   Wallet: {entry['wallet_address']}")
+        logger.info(f"   Risk Score: {entry['risk_score']}/100")
+        logger.info(f"   Tokens Created: {entry['evidence_summary']['tokens_deployed']}")
+        logger.info(f"   Victims: {entry['evidence_summary']['unique_victims']}")
+        logger.info(f"   Losses Caused: {entry['evidence_summary']['total_losses_avax']:.2f} AVAX")
+
+    logger.info("\n" + "="*80)
+    logger.info("✅ BLACKLIST GENERATION COMPLETE!")
+    logger.info(f"📁 Files created:")
+    logger.info(f"   - arena_master_blacklist_*.jsonl (Entries streamed during analysis)")
+    logger.info(f"   - arena_master_blacklist_*.json (Complete blacklist with evidence)")
+    logger.info(f"   - arena_bot_blacklist_*.json (Simple list for trading bots)")
+    logger.info(f"   - known_grifters.json (Source data from Dune)")
+    logger.info("\n⚠️ IMPORTANT: Add wallet addresses from Dune Analytics to known_grifters.json")
+    logger.info("   Visit: https://dune.com/couchdicks/arenatrade-top-grifters")
+    logger.info("="*80)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,390 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
 import json
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Iterator
+import sys
 import time
+import asyncio
+import atexit
+import random
+import sqlite3
+import threading
+import heapq
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+
+from rate_limiter import (AVAX_RPC_RATE, COINGECKO_BURST, COINGECKO_RATE, SNOWSCAN_RATE,
+                          SNOWTRACE_RATE, shared_bucket)
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is optional; token transfers are then fetched one at a time
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; trade amounts are then computed row by row
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; trade totals then use numpy masks
+    njit = None
+
+# Explorer and price APIs served through the tracker's pooled session
+API_HOSTS = (
+    "https://api.snowtrace.io",
+    "https://api.snowscan.io",
+    "https://api.coingecko.com",
+)
+
+SNOWTRACE_API = "https://api.snowtrace.io/api"
+MAX_CONCURRENT_REQUESTS = 16
+MAX_RETRIES = 3
+SNOWTRACE_PAGE_SIZE = 1000
+SNOWTRACE_WINDOW = 10000  # Snowtrace only pages through this many rows of a single query
+
+# Daily AVAX/USD prices and explorer results persist here between runs
+PROFIT_CACHE_DB = 'profit_tracker_cache.db'
+EXPLORER_CACHE_TTL = 600  # Seconds before cached explorer results are topped up with new blocks
+PRICE_FLUSH_EVERY = 50  # New prices buffered before a database commit
+
+COINGECKO_RANGE_URL = "https://api.coingecko.com/api/v3/coins/avalanche-2/market_chart/range"
+PRICE_RANGE_WINDOW = 90 * 86400  # Longer ranges drop from hourly to daily points
+
+SECONDARY_TX_THRESHOLD = 100  # Recipients with fewer transactions are likely secondary wallets
+SECONDARY_LOOKUP_WORKERS = 8
+TOKEN_ANALYSIS_WORKERS = 8  # Tokens of one wallet analyzed concurrently
+WALLET_ANALYSIS_WORKERS = 16  # Wallets analyzed concurrently by analyze_multiple_wallets
+
+# Trade kinds, in the order _trade_totals reports them
+BUY, SELL, SECONDARY_SELL = 0, 1, 2
+RPC_BATCH_SIZE = 50  # Calls per JSON-RPC batch, under public provider limits
+LOG_BLOCK_RANGE = 2048  # Public RPC caps eth_getLogs ranges at 2048 blocks
+
+# Multicall3 (same address on every EVM chain) verifies many candidate tokens in one eth_call
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [{
+    "inputs": [{"components": [
+        {"name": "target", "type": "address"},
+        {"name": "allowFailure", "type": "bool"},
+        {"name": "callData", "type": "bytes"}
+    ], "name": "calls", "type": "tuple[]"}],
+    "name": "aggregate3",
+    "outputs": [{"components": [
+        {"name": "success", "type": "bool"},
+        {"name": "returnData", "type": "bytes"}
+    ], "name": "returnData", "type": "tuple[]"}],
+    "stateMutability": "payable",
+    "type": "function"
+}]
+TOTAL_SUPPLY_SELECTOR = bytes.fromhex("18160ddd")  # totalSupply()
+MULTICALL_CHUNK = 200  # Calls per aggregate3, well under the eth_call gas cap
+
+EXPORT_BUFFER_SIZE = 1 << 20  # Write buffer for streamed JSON reports
+
+REPORT_PROCESS_THRESHOLD = 200  # Wallet reports formatted in a process pool from this many on
+REPORT_CHUNK = 16  # Wallet reports per process-pool task
+
+# Report banner rules
+EQ_RULE = '=' * 70
+HASH_RULE = '#' * 70
+
+def _loads(raw):
+    """Parse JSON str/bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data, pretty: bool = False) -> bytes:
+    """Serialize to JSON bytes with orjson when available, compact unless pretty is requested"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+@lru_cache(maxsize=65536)
+def _checksum(address_lower: str) -> str:
+    """Checksummed form of a lowercase address; memoized since each conversion hashes with keccak"""
+    return Web3.to_checksum_address(address_lower)
+
+
+@lru_cache(maxsize=65536)
+def _b(address: str) -> bytes:
+    """
+    Raw 20-byte form of a hex address, in any letter case
+    Join loops compare these instead of lowercasing each explorer field on every row
+    """
+    return bytes.fromhex(address[2:])
+
+
+def _index_by_hash(rows: List[Dict]) -> Dict[str, List[Dict]]:
+    """Group explorer rows by lowercase transaction hash"""
+    by_hash = defaultdict(list)
+    for row in rows:
+        by_hash[row.get('hash', '').lower()].append(row)
+    return by_hash
+
+
+def _block_of(row: Dict) -> int:
+    """Block number of an explorer row"""
+    return int(row['blockNumber'])
+
+
+def _merge_transfers(txs: List[Dict], transfers: List[Dict], from_block: int = 0) -> Iterator[tuple]:
+    """
+    Pair each transaction with the token transfers it emitted, in one merge pass over
+    both lists by block; within a block, transfers are matched by lowercase hash.
+    Yields (tx, transfers) for transactions from from_block on that emitted any.
+    Explorer results are already ascending, so the sorts are linear.
+    """
+    txs = sorted(txs, key=_block_of)
+    transfers = sorted(transfers, key=_block_of)
+    transfer_blocks = [_block_of(t) for t in transfers]
+    j = bisect_left(transfer_blocks, from_block)
+
+    block, by_hash = None, {}
+    for tx in txs:
+        tx_block = _block_of(tx)
+        if tx_block < from_block:
+            continue
+
+        if tx_block != block:
+            # First transaction of a new block: index that block's transfers by hash
+            block = tx_block
+            while j < len(transfers) and transfer_blocks[j] < block:
+                j += 1
+            k = j
+            while k < len(transfers) and transfer_blocks[k] == block:
+                k += 1
+            by_hash = _index_by_hash(transfers[j:k])
+            j = k
+
+        related = by_hash.get(tx['hash'].lower())
+        if related:
+            yield tx, related
+
+
+def _trade_columns(value_weis: List[int], token_values: List[int], decimals: List[int],
+                   prices: List[float]):
+    """
+    Per-trade AVAX amount, token amount and USD value
+    Computed over whole columns with numpy when it's installed
+    """
+    if np is not None:
+        avax = np.array(value_weis, dtype=np.float64) / 1e18
+        token_amounts = np.array(token_values, dtype=np.float64) / np.power(10.0, np.array(decimals, dtype=np.int8))
+        usd = avax * np.array(prices, dtype=np.float64)
+        return avax, token_amounts, usd
+
+    avax = [float(Decimal(w).scaleb(-18)) for w in value_weis]
+    token_amounts = [v / (10 ** d) for v, d in zip(token_values, decimals)]
+    usd = [a * p for a, p in zip(avax, prices)]
+    return avax, token_amounts, usd
+
+
+def _kind_sums(kinds, avax, usd):
+    """Single pass over the trade columns, summing (AVAX, USD) into one row per trade kind"""
+    sums = np.zeros((3, 2))
+    for i in range(kinds.shape[0]):
+        sums[kinds[i], 0] += avax[i]
+        sums[kinds[i], 1] += usd[i]
+    return sums
+
+
+if njit is not None:
+    _kind_sums = njit(cache=True, fastmath=True)(_kind_sums)
+
+
+def _trade_totals(kinds: List[int], avax, usd) -> List[tuple]:
+    """(AVAX, USD) sums for buys, primary sells and secondary sells"""
+    if np is not None:
+        kinds = np.array(kinds, dtype=np.int8)
+        if njit is not None:
+            return [(float(a), float(u)) for a, u in _kind_sums(kinds, avax, usd)]
+        return [(float(avax[kinds == k].sum()), float(usd[kinds == k].sum()))
+                for k in (BUY, SELL, SECONDARY_SELL)]
+
+    totals = [[0.0, 0.0], [0.0, 0.0], [0.0, 0.0]]
+    for kind, avax_amount, usd_amount in zip(kinds, avax, usd):
+        totals[kind][0] += avax_amount
+        totals[kind][1] += usd_amount
+    return [tuple(t) for t in totals]
+
+
+# Buys over the limit are only violations once at least this share was sold back
+DUMP_RATIO = 0.8
+
+
+def _violation_kernel(bought, sold, limit):
+    """Indices of tokens bought over limit and dumped for at least DUMP_RATIO of the spend"""
+    return np.nonzero((bought > limit) & (sold >= bought * DUMP_RATIO))[0]
+
+
+if njit is not None:
+    _violation_kernel = njit(cache=True)(_violation_kernel)
+
+
+def _violation_rows(bought: List[float], sold: List[float], limit: float) -> List[int]:
+    """Violating rows of the AVAX bought/sold columns; checked row by row without numpy"""
+    if np is not None:
+        return _violation_kernel(np.array(bought, dtype=np.float64),
+                                 np.array(sold, dtype=np.float64), limit).tolist()
+    return [i for i, (b, s) in enumerate(zip(bought, sold)) if b > limit and s >= b * DUMP_RATIO]
+
+
+def _blacklist_rows(num_tokens: List[int], profit_usd: List[float],
+                    min_tokens: int, min_profit_usd: float) -> List[int]:
+    """Wallets (by position) deploying at least min_tokens or profiting at least min_profit_usd"""
+    if np is not None:
+        mask = (np.array(num_tokens, dtype=np.int64) >= min_tokens) | \
+               (np.array(profit_usd, dtype=np.float64) >= min_profit_usd)
+        return np.nonzero(mask)[0].tolist()
+    return [i for i, (n, usd) in enumerate(zip(num_tokens, profit_usd))
+            if n >= min_tokens or usd >= min_profit_usd]
+
+
+# Numeric token-analysis fields packed into each wallet's token table: (column, result key, dtype)
+TOKEN_TABLE_FIELDS = (
+    ('profit_avax', 'profit_avax', 'f8'),
+    ('profit_usd', 'profit_usd', 'f8'),
+    ('avax_spent', 'total_avax_spent', 'f8'),
+    ('avax_received', 'total_avax_received', 'f8'),
+    ('num_buys', 'num_buys', 'i4'),
+    ('num_sells', 'num_sells', 'i4'),
+    ('num_secondary_sells', 'num_secondary_sells', 'i4'),
+    ('timestamp', 'timestamp', 'i8'),
+    ('usd_spent', 'total_usd_spent', 'f8'),
+    ('usd_received', 'total_usd_received', 'f8'),
+    ('num_secondary_wallets', 'num_secondary_wallets', 'i4'),
+)
+
+RESULTS_HEADER_SUFFIX = '.json'  # Schema and wallet summaries beside a binary results file
+
+
+def _token_table(tokens: List[Dict]):
+    """
+    A wallet's token analyses as a numpy structured array, one row per token in the
+    same order (missing fields are 0); None without numpy
+    """
+    if np is None:
+        return None
+    dtype = np.dtype([('token_address', 'S42')] + [(column, kind) for column, _, kind in TOKEN_TABLE_FIELDS])
+    return np.array([
+        (t.get('token_address', '').encode('ascii'),
+         *(len(t.get('secondary_wallets', ())) if key == 'num_secondary_wallets' else t.get(key, 0)
+           for _, key, _ in TOKEN_TABLE_FIELDS))
+        for t in tokens
+    ], dtype=dtype)
+
+
+def _token_row(row) -> Dict:
+    """Token analysis dict rebuilt from one token table row"""
+    token = {key: row[column].item() for column, key, _ in TOKEN_TABLE_FIELDS}
+    token['token_address'] = token['contract_address'] = row['token_address'].decode('ascii')
+    token['datetime'] = datetime.fromtimestamp(token['timestamp']).isoformat()
+    return token
+
+
+class _TableTokens(Sequence):
+    """Read-only token list over a token table (e.g. a memmap slice); rows become dicts on access"""
+
+    def __init__(self, table):
+        self.table = table
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return _token_row(self.table[i])
+
+
+def _top_rows(table, top_n: int) -> List[int]:
+    """Rows of the top_n tokens by profit_usd, best first; ties keep token order"""
+    profits = table['profit_usd']
+    if top_n <= 0:
+        return []
+    if top_n < len(profits):
+        # Partial selection of the top_n-th largest profit; at that cut-off the earliest tokens win
+        cutoff = np.partition(profits, len(profits) - top_n)[len(profits) - top_n]
+        above = np.nonzero(profits > cutoff)[0]
+        rows = np.concatenate((above, np.nonzero(profits == cutoff)[0][:top_n - len(above)]))
+    else:
+        rows = np.arange(len(profits))
+    return rows[np.lexsort((rows, -profits[rows]))].tolist()
+
+
+def _format_wallet_report(wallet_address: str, tokens, table, top_n: int) -> str:
+    """
+    Text of a wallet's top N most profitable tokens report
+    Pure function of its arguments, so reports can be formatted in worker processes
+    """
+    # Top N by profit (USD), selected from the token table's profit column when there
+    # is one, otherwise with a bounded heap; neither sorts the whole token list
+    if table is not None and len(table) == len(tokens):
+        top_tokens = [tokens[row] for row in _top_rows(table, top_n)]
+    else:
+        top_tokens = heapq.nlargest(top_n, tokens, key=lambda x: x.get('profit_usd', 0))
+
+    lines = [f"\n{EQ_RULE}"]
+    lines.append(f"TOP {top_n} MOST PROFITABLE TOKENS - {wallet_address[:10]}...")
+    lines.append(f"{EQ_RULE}\n")
+
+    for i, token in enumerate(top_tokens, 1):
+        lines.append(f"{i}. Token: {token['token_address']}")
+        lines.append(f"   Deployed: {token['datetime']}")
+        lines.append(f"   Buys: {token['num_buys']} | Sells: {token['num_sells']} (Primary)")
+        if token.get('num_secondary_sells', 0) > 0:
+            secondary_count = token.get('num_secondary_wallets', len(token.get('secondary_wallets', [])))
+            lines.append(f"   Secondary Sells: {token['num_secondary_sells']} via {secondary_count} wallets")
+        lines.append(f"   Spent: {token['total_avax_spent']:.4f} AVAX (${token['total_usd_spent']:.2f})")
+        lines.append(f"   Received: {token['total_avax_received']:.4f} AVAX (${token['total_usd_received']:.2f})")
+        lines.append(f"   PROFIT: {token['profit_avax']:.4f} AVAX (${token['profit_usd']:.2f})")
+        lines.append('')
+
+    return '\n'.join(lines) + '\n'
+
+
+# Per-wallet result fields summed by analyze_multiple_wallets; wallets without
+# deployments leave some out, and those count as 0
+WALLET_TOTAL_FIELDS = ('num_tokens_deployed', 'total_profit_avax', 'total_profit_usd',
+                       'profitable_tokens', 'num_tokens_analyzed', 'total_secondary_wallets_used')
+
+
+def _wallet_totals(results: List[Dict]) -> tuple:
+    """Sums of WALLET_TOTAL_FIELDS over wallet results, in one pass over the list"""
+    if np is not None:
+        table = np.array([[r.get(f, 0) for f in WALLET_TOTAL_FIELDS] for r in results],
+                         dtype=np.float64).reshape(-1, len(WALLET_TOTAL_FIELDS))
+        sums = table.sum(axis=0).tolist()
+    else:
+        sums = [0] * len(WALLET_TOTAL_FIELDS)
+        for r in results:
+            for i, field in enumerate(WALLET_TOTAL_FIELDS):
+                sums[i] += r.get(field, 0)
+
+    # Counts come back as ints, profits as floats
+    return tuple(float(s) if f.startswith('total_profit') else int(s)
+                 for f, s in zip(WALLET_TOTAL_FIELDS, sums))
+
 
 class ArenaProxyProfitTracker:
     """
@@ -14,19 +393,85 @@ class ArenaProxyProfitTracker:
     Includes USD conversion and secondary wallet transfer tracking
     """
 
-    def __init__(self, rpc_url, avax_scan_api_key, arena_proxy_address):
+    def __init__(self, rpc_url, avax_scan_api_key, arena_proxy_address, cache_db: str = PROFIT_CACHE_DB):
         self.w3 = Web3(Web3.HTTPProvider(rpc_url))
         self.api_key = avax_scan_api_key
-        self.arena_proxy = Web3.to_checksum_address(arena_proxy_address)
+        self.arena_proxy = _checksum(arena_proxy_address.lower())
 
         # Arena factory contract addresses that create tokens via internal transactions
         self.factory_addresses = [
-            Web3.to_checksum_address("0x2196E106Af476f57618373ec028924767c758464"),
-            Web3.to_checksum_address("0x8315f1eb449Dd4B779495C3A0b05e5d194446c6e"),
-            Web3.to_checksum_address(arena_proxy_address)  # Original proxy
+            _checksum("0x2196e106af476f57618373ec028924767c758464"),
+            _checksum("0x8315f1eb449dd4b779495c3a0b05e5d194446c6e"),
+            _checksum(arena_proxy_address.lower())  # Original proxy
         ]
-
-        self.avax_usd_price_cache = {}  # Cache AVAX prices by timestamp
+        # Lowercase lookup set for matching explorer 'to' fields
+        self._factory_lower = frozenset(f.lower() for f in self.factory_addresses)
+
+        # One keep-alive session for every explorer/price call instead of a new
+        # TCP + TLS handshake per request
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'arena-profit-tracker/1.0',
+            'Accept': 'application/json'
+        })
+        self.parallelism = TOKEN_ANALYSIS_WORKERS
+        # Token pool shared by every wallet of analyze_multiple_wallets, so concurrent
+        # wallets add to the request load only while fetching their own histories
+        self._token_pool = None
+        retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        # Most requests in flight at once: each wallet thread, plus every worker of the
+        # shared token pool running its secondary-wallet lookups. The rate buckets below
+        # still bound the request rate; this only keeps every waiting thread's connection alive
+        adapter = HTTPAdapter(pool_connections=4,
+                              pool_maxsize=WALLET_ANALYSIS_WORKERS + self.parallelism * SECONDARY_LOOKUP_WORKERS,
+                              max_retries=retry)
+        for host in API_HOSTS:
+            self.session.mount(host, adapter)
+
+        # Token buckets replace fixed sleeps: calls only wait once an endpoint's quota is spent
+        self._snowtrace_limiter = shared_bucket('snowtrace', rate=SNOWTRACE_RATE)
+        self._snowscan_limiter = shared_bucket('snowscan', rate=SNOWSCAN_RATE)
+        self._coingecko_limiter = shared_bucket('coingecko', rate=COINGECKO_RATE, capacity=COINGECKO_BURST)
+        self._rpc_limiter = shared_bucket('avax_rpc', rate=AVAX_RPC_RATE)
+        self.batch_size = RPC_BATCH_SIZE
+        self._verified_contracts = set()  # Checksum addresses confirmed to be token contracts
+        # Lowercase wallet -> {lowercase token: transfers}, filled by prefetch_token_transfers
+        self._transfer_cache = {}
+        self._tx_count_cache = {}  # (lowercase wallet, cap) -> capped transaction count
+        # (action, lowercase wallet) -> (block numbers, rows) for the full history, kept
+        # while any analyze_wallet run is active so each token slices it instead of refetching
+        self._tx_cache = {}
+        self._tx_cache_locks = defaultdict(threading.Lock)
+        self._tx_cache_guard = threading.Lock()
+        self._active_runs = 0
+
+        # Shared across worker threads, so every query goes through _cache_lock
+        self._cache_db = sqlite3.connect(cache_db, check_same_thread=False)
+        self._cache_db.executescript("""
+            CREATE TABLE IF NOT EXISTS avax_usd_prices (ts INTEGER PRIMARY KEY, price REAL NOT NULL);
+            CREATE TABLE IF NOT EXISTS explorer_cache (
+                key TEXT PRIMARY KEY,
+                fetched_at REAL NOT NULL,
+                last_block INTEGER NOT NULL,
+                rows BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS verified_contracts (address TEXT PRIMARY KEY);
+            CREATE TABLE IF NOT EXISTS creation_receipts (tx_hash TEXT PRIMARY KEY, contract_address TEXT);
+        """)
+        self._cache_lock = threading.Lock()
+        self.explorer_cache_ttl = EXPLORER_CACHE_TTL
+
+        # Mined receipts and deployed code don't change, so these never expire
+        self._verified_contracts.update(a for (a,) in self._cache_db.execute("SELECT address FROM verified_contracts"))
+
+        # Cache AVAX prices by day timestamp, loaded from earlier runs
+        self.avax_usd_price_cache = dict(self._cache_db.execute("SELECT ts, price FROM avax_usd_prices"))
+        self._pending_prices = []
+        atexit.register(self._flush_prices)
+        self.balance_cache = {}  # Checksum address -> AVAX balance, filled by batched prefetches
+        # Checksum wallet -> _token_table of its result's tokens, for the report passes;
+        # kept beside self.results so exports stay plain JSON
+        self._token_tables = {}
         self.results = {
             'wallets': {},
             'summary': {},
@@ -45,53 +490,193 @@ class ArenaProxyProfitTracker:
         self.last_processed_block = 0
         self.flagged_deployers = set()
 
-    def get_wallet_transactions(self, wallet_address: str, start_block: int = 0) -> List[Dict]:
-        """Get all transactions for a wallet address"""
+    def close(self):
+        """Release the pooled HTTP connections and write any buffered prices"""
+        self._flush_prices()
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def _snowtrace_page(self, params: Dict) -> List[Dict]:
+        """One Snowtrace account request; raises on request or API errors"""
+        self._snowtrace_limiter.acquire()
+        response = self.session.get(SNOWTRACE_API, params={**params, 'apikey': self.api_key}, timeout=15)
+        data = _loads(response.content)
+
+        # Empty histories come back as status '0' with an empty result list;
+        # errors carry a message string in 'result' instead
+        if data['status'] == '1' or isinstance(data.get('result'), list):
+            return data['result']
+        raise RuntimeError(f"API Error: {data.get('result') or data.get('message', 'Unknown error')}")
+
+    def _iter_snowtrace(self, params: Dict, page_size: int = SNOWTRACE_PAGE_SIZE) -> Iterator[Dict]:
+        """
+        Yield every row of an ascending Snowtrace account query, page_size rows per request
+        Past the first SNOWTRACE_WINDOW rows the query restarts from the last block seen,
+        skipping that block's rows that were already yielded
+        """
+        start_block = params['startblock']
+        page = 1
+        skip = 0
+        last_block, yielded_in_last_block = None, 0
+
+        while True:
+            rows = self._snowtrace_page({**params, 'startblock': start_block, 'page': page, 'offset': page_size})
+            for row in rows:
+                if skip:
+                    skip -= 1
+                    continue
+                block = int(row['blockNumber'])
+                if block == last_block:
+                    yielded_in_last_block += 1
+                else:
+                    last_block, yielded_in_last_block = block, 1
+                yield row
+
+            if len(rows) < page_size:
+                return
+
+            page += 1
+            if page * page_size > SNOWTRACE_WINDOW:
+                if last_block == start_block:
+                    print(f"[WARNING] Over {SNOWTRACE_WINDOW} rows in block {last_block}; history truncated")
+                    return
+                start_block, page, skip = last_block, 1, yielded_in_last_block
+
+    def _snowtrace_rows(self, params: Dict, label: str) -> Optional[List[Dict]]:
+        """
+        Rows returned by a Snowtrace account query, fetched page by page unless params
+        already name a page
+        Returns [] for an empty history and None if the request failed, so failures aren't cached
+        """
         try:
-            url = "https://api.snowtrace.io/api"
-            params = {
-                'module': 'account',
-                'action': 'txlist',
-                'address': wallet_address,
-                'startblock': start_block,
-                'endblock': 99999999,
-                'sort': 'asc',
-                'apikey': self.api_key
-            }
-            response = requests.get(url, params=params, timeout=15)
-            data = response.json()
+            if 'page' in params:
+                return self._snowtrace_page(params)
+            return list(self._iter_snowtrace(params))
+        except Exception as e:
+            print(f"Error fetching {label}: {e}")
+            return None
 
-            if data['status'] == '1':
-                return data['result']
-            else:
-                print(f"API Error for {wallet_address}: {data.get('message', 'Unknown error')}")
+    def _cached_rows(self, params: Dict, label: str) -> List[Dict]:
+        """
+        Snowtrace rows for params through the persistent explorer cache
+        Entries younger than explorer_cache_ttl are served as-is; older ones are
+        topped up by fetching only from their last cached block onwards
+        """
+        key = ':'.join(str(params.get(k, '')).lower()
+                       for k in ('action', 'address', 'contractaddress', 'startblock'))
+        with self._cache_lock:
+            row = self._cache_db.execute(
+                "SELECT fetched_at, last_block, rows FROM explorer_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is not None:
+            fetched_at, last_block, cached = row[0], row[1], _loads(row[2])
+            if time.time() - fetched_at < self.explorer_cache_ttl:
+                return cached
+
+            # The last cached block may have been incomplete, so it's fetched again in full
+            new_rows = self._snowtrace_rows({**params, 'startblock': last_block}, label)
+            if new_rows is None:
+                return cached
+            rows = [r for r in cached if int(r['blockNumber']) < last_block] + new_rows
+        else:
+            rows = self._snowtrace_rows(params, label)
+            if rows is None:
                 return []
-        except Exception as e:
-            print(f"Error fetching transactions for {wallet_address}: {e}")
-            return []
+            last_block = params['startblock']
+
+        if rows:
+            last_block = max(last_block, int(rows[-1]['blockNumber']))
+
+        with self._cache_lock:
+            self._cache_db.execute(
+                "INSERT OR REPLACE INTO explorer_cache (key, fetched_at, last_block, rows) VALUES (?, ?, ?, ?)",
+                (key, time.time(), last_block, _dumps(rows))
+            )
+            self._cache_db.commit()
+        return rows
+
+    def _wallet_history(self, action: str, wallet_address: str, label: str) -> tuple:
+        """
+        A wallet's full txlist/txlistinternal history from block 0 with its block numbers,
+        fetched once per analysis run and shared by every token's lookups
+        Outside a run (between _begin_run and _end_run) nothing is memoized, so long-lived
+        callers always get the explorer cache's current view
+        """
+        params = {
+            'module': 'account',
+            'action': action,
+            'address': wallet_address,
+            'startblock': 0,
+            'endblock': 99999999,
+            'sort': 'asc'
+        }
+        key = (action, wallet_address.lower())
+        with self._tx_cache_guard:
+            if self._active_runs == 0:
+                lock = None
+            else:
+                lock = self._tx_cache_locks[key]
+
+        if lock is None:
+            rows = self._cached_rows(params, label)
+            return [int(r['blockNumber']) for r in rows], rows
+
+        # Concurrent token analyses for one wallet wait for a single fetch
+        with lock:
+            entry = self._tx_cache.get(key)
+            if entry is None:
+                rows = self._cached_rows(params, label)
+                entry = self._tx_cache[key] = ([int(r['blockNumber']) for r in rows], rows)
+        return entry
+
+    def _begin_run(self):
+        """Start a wallet run; the first concurrent run starts from an empty history memo"""
+        with self._tx_cache_guard:
+            if self._active_runs == 0:
+                self._tx_cache.clear()
+                self._tx_cache_locks.clear()
+            self._active_runs += 1
+
+    def _end_run(self):
+        """Finish a wallet run; the memo is dropped once no runs remain"""
+        with self._tx_cache_guard:
+            self._active_runs -= 1
+            if self._active_runs == 0:
+                self._tx_cache.clear()
+                self._tx_cache_locks.clear()
+
+    def get_wallet_transactions(self, wallet_address: str, start_block: int = 0) -> List[Dict]:
+        """Get all transactions for a wallet address"""
+        blocks, rows = self._wallet_history('txlist', wallet_address, f"transactions for {wallet_address}")
+        return rows[bisect_left(blocks, start_block):]
 
     def get_internal_transactions(self, wallet_address: str) -> List[Dict]:
         """Get internal transactions (contract calls) for a wallet"""
-        try:
-            url = "https://api.snowtrace.io/api"
-            params = {
-                'module': 'account',
-                'action': 'txlistinternal',
-                'address': wallet_address,
-                'startblock': 0,
-                'endblock': 99999999,
-                'sort': 'asc',
-                'apikey': self.api_key
-            }
-            response = requests.get(url, params=params, timeout=15)
-            data = response.json()
-
-            if data['status'] == '1':
-                return data['result']
-            return []
-        except Exception as e:
-            print(f"Error fetching internal transactions: {e}")
-            return []
+        return list(self._wallet_history('txlistinternal', wallet_address, "internal transactions")[1])
+
+    def _remember_price(self, day_timestamp: int, price: float):
+        """Cache a daily price in memory and queue it for the cache database"""
+        self.avax_usd_price_cache[day_timestamp] = price
+        self._pending_prices.append((day_timestamp, price))
+        if len(self._pending_prices) >= PRICE_FLUSH_EVERY:
+            self._flush_prices()
+
+    def _flush_prices(self):
+        """Write queued prices to the cache database in one transaction"""
+        with self._cache_lock:
+            pending, self._pending_prices = self._pending_prices, []
+            if pending:
+                self._cache_db.executemany(
+                    "INSERT OR IGNORE INTO avax_usd_prices (ts, price) VALUES (?, ?)", pending
+                )
+                self._cache_db.commit()
 
     def get_avax_usd_price(self, timestamp: int) -> float:
         """
@@ -114,12 +699,13 @@ class ArenaProxyProfitTracker:
                 'localization': 'false'
             }
 
-            response = requests.get(url, params=params, timeout=10)
-            data = response.json()
+            self._coingecko_limiter.acquire()
+            response = self.session.get(url, params=params, timeout=10)
+            data = _loads(response.content)
 
             if 'market_data' in data and 'current_price' in data['market_data']:
                 price = data['market_data']['current_price'].get('usd', 0)
-                self.avax_usd_price_cache[day_timestamp] = price
+                self._remember_price(day_timestamp, price)
                 return price
             else:
                 # Fallback: try current price
@@ -130,6 +716,37 @@ class ArenaProxyProfitTracker:
             # Return current price as fallback
             return self.get_current_avax_price()
 
+    def prefetch_avax_prices(self, timestamps: List[int]):
+        """
+        Fill the daily price cache for the span of timestamps with one market_chart/range
+        request per 90-day window, instead of a /history request per day
+        Days the range doesn't cover are still fetched individually by get_avax_usd_price
+        """
+        missing = {(ts // 86400) * 86400 for ts in timestamps} - self.avax_usd_price_cache.keys()
+        if not missing:
+            return
+
+        start, end = min(missing), max(missing) + 86400
+        for window_start in range(start, end, PRICE_RANGE_WINDOW):
+            params = {
+                'vs_currency': 'usd',
+                'from': window_start,
+                'to': min(window_start + PRICE_RANGE_WINDOW, end)
+            }
+            try:
+                self._coingecko_limiter.acquire()
+                response = self.session.get(COINGECKO_RANGE_URL, params=params, timeout=10)
+                prices = _loads(response.content).get('prices', [])
+            except Exception as e:
+                print(f"    [WARNING] Could not fetch AVAX price range: {e}")
+                continue
+
+            # Points are [ms, price]; the first point of each day stands in for that day
+            for ms, price in prices:
+                day_timestamp = (int(ms) // 1000 // 86400) * 86400
+                if day_timestamp not in self.avax_usd_price_cache:
+                    self._remember_price(day_timestamp, price)
+
     def get_current_avax_price(self) -> float:
         """Get current AVAX/USD price"""
         try:
@@ -138,8 +755,9 @@ class ArenaProxyProfitTracker:
                 'ids': 'avalanche-2',
                 'vs_currencies': 'usd'
             }
-            response = requests.get(url, params=params, timeout=10)
-            data = response.json()
+            self._coingecko_limiter.acquire()
+            response = self.session.get(url, params=params, timeout=10)
+            data = _loads(response.content)
             return data.get('avalanche-2', {}).get('usd', 0)
         except Exception as e:
             print(f"    [WARNING] Could not fetch current AVAX price: {e}")
@@ -148,10 +766,12 @@ class ArenaProxyProfitTracker:
     def get_avax_balance(self, wallet_address: str) -> float:
         """
         Get current AVAX balance for a wallet address
-        Returns balance in AVAX (not Wei)
+        Returns balance in AVAX (not Wei); prefetched balances are served from balance_cache
         """
         try:
-            wallet_address = Web3.to_checksum_address(wallet_address)
+            wallet_address = _checksum(wallet_address.lower())
+            if wallet_address in self.balance_cache:
+                return self.balance_cache[wallet_address]
             balance_wei = self.w3.eth.get_balance(wallet_address)
             balance_avax = float(self.w3.from_wei(balance_wei, 'ether'))
             return balance_avax
@@ -159,6 +779,32 @@ class ArenaProxyProfitTracker:
             print(f"    [WARNING] Could not fetch AVAX balance for {wallet_address}: {e}")
             return 0.0
 
+    def get_wallet_tx_count(self, wallet_address: str, cap: int = SECONDARY_TX_THRESHOLD) -> Optional[int]:
+        """
+        Number of transactions for a wallet, counted up to cap
+        Only the first page of cap rows is requested; None if the lookup failed
+        """
+        key = (wallet_address.lower(), cap)
+        if key in self._tx_count_cache:
+            return self._tx_count_cache[key]
+
+        params = {
+            'module': 'account',
+            'action': 'txlist',
+            'address': wallet_address,
+            'startblock': 0,
+            'endblock': 99999999,
+            'page': 1,
+            'offset': cap,
+            'sort': 'asc'
+        }
+        rows = self._snowtrace_rows(params, f"transaction count for {wallet_address}")
+        if rows is None:
+            return None
+
+        self._tx_count_cache[key] = len(rows)
+        return len(rows)
+
     def find_secondary_wallets(self, deployer_address: str, token_contract: str) -> Set[str]:
         """
         Find secondary wallets that received token transfers from the deployer
@@ -168,24 +814,174 @@ class ArenaProxyProfitTracker:
 
         secondary_wallets = set()
         token_transfers = self.get_token_transfers(deployer_address, token_contract)
+        deployer_b = _b(deployer_address)
 
-        for transfer in token_transfers:
-            from_addr = transfer['from'].lower()
-            to_addr = transfer['to'].lower()
-            deployer_lower = deployer_address.lower()
+        # If deployer sent tokens to another wallet (not a contract/DEX); each
+        # recipient is checked once however many transfers it received
+        recipients = sorted({
+            t['to'].lower() for t in token_transfers
+            if _b(t['from']) == deployer_b and _b(t['to']) != deployer_b
+        })
+        if not recipients:
+            return secondary_wallets
 
-            # If deployer sent tokens to another wallet (not a contract/DEX)
-            if from_addr == deployer_lower and to_addr != deployer_lower:
-                # Check if recipient has low transaction count (likely secondary wallet)
-                recipient_txs = self.get_wallet_transactions(to_addr)
+        # Check if recipients have low transaction counts (likely secondary wallets)
+        with ThreadPoolExecutor(max_workers=SECONDARY_LOOKUP_WORKERS) as pool:
+            tx_counts = pool.map(self.get_wallet_tx_count, recipients)
 
-                # If wallet has relatively few transactions, likely a secondary wallet
-                if len(recipient_txs) < 100:  # Adjustable threshold
-                    secondary_wallets.add(Web3.to_checksum_address(to_addr))
-                    print(f"      → Found potential secondary: {to_addr[:10]}... ({len(recipient_txs)} txs)")
+        for to_addr, tx_count in zip(recipients, tx_counts):
+            # If wallet has relatively few transactions, likely a secondary wallet
+            if tx_count is not None and tx_count < SECONDARY_TX_THRESHOLD:
+                secondary_wallets.add(_checksum(to_addr))
+                print(f"      → Found potential secondary: {to_addr[:10]}... ({tx_count} txs)")
 
         return secondary_wallets
 
+    def _batch_rpc(self, items: List, request, what: str) -> Dict:
+        """
+        Run request(item) for many items in JSON-RPC batches of batch_size.
+        Returns results keyed by item; items whose batch or response failed are left out.
+        """
+        results = {}
+
+        for start in range(0, len(items), self.batch_size):
+            chunk = items[start:start + self.batch_size]
+            try:
+                self._rpc_limiter.acquire()
+                with self.w3.batch_requests() as batch:
+                    for item in chunk:
+                        batch.add(request(item))
+                    values = batch.execute()
+            except Exception as e:
+                print(f"  [WARNING] Batched {what} lookup failed: {e}")
+                continue
+
+            for item, value in zip(chunk, values):
+                if value is not None and not isinstance(value, Exception):
+                    results[item] = value
+        return results
+
+    def verify_contracts(self, addresses: List[str]) -> Set[str]:
+        """
+        Return the addresses that are deployed contracts answering totalSupply()
+        Checked in Multicall3 aggregate3 calls; falls back to batched eth_getCode
+        (code exists) if the multicall fails
+        """
+        unknown = [a for a in dict.fromkeys(addresses) if a not in self._verified_contracts]
+
+        for start in range(0, len(unknown), MULTICALL_CHUNK):
+            chunk = unknown[start:start + MULTICALL_CHUNK]
+            try:
+                self._rpc_limiter.acquire()
+                multicall = self.w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+                results = multicall.functions.aggregate3(
+                    [(addr, True, TOTAL_SUPPLY_SELECTOR) for addr in chunk]
+                ).call()
+                # Calls to addresses without code succeed with empty return data
+                verified = [addr for addr, (success, data) in zip(chunk, results) if success and len(data) >= 32]
+            except Exception as e:
+                print(f"  [WARNING] Multicall verification failed, falling back to eth_getCode: {e}")
+                codes = self._batch_rpc(chunk, self.w3.eth.get_code, 'code')
+                verified = [addr for addr in chunk if len(codes.get(addr, b'')) > 0]
+
+            self._verified_contracts.update(verified)
+            with self._cache_lock:
+                self._cache_db.executemany(
+                    "INSERT OR IGNORE INTO verified_contracts (address) VALUES (?)", [(a,) for a in verified]
+                )
+                self._cache_db.commit()
+
+        return {a for a in addresses if a in self._verified_contracts}
+
+    def _creation_addresses(self, tx_hashes: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Contract created by each contract-creation transaction (None if it created none),
+        keyed by the given hashes; hashes whose receipt couldn't be fetched are left out
+        Mined receipts never change, so only hashes missing from the cache database are fetched
+        """
+        created = {}
+        with self._cache_lock:
+            for tx_hash in tx_hashes:
+                row = self._cache_db.execute(
+                    "SELECT contract_address FROM creation_receipts WHERE tx_hash = ?", (tx_hash.lower(),)
+                ).fetchone()
+                if row is not None:
+                    created[tx_hash] = row[0] or None
+
+        missing = [h for h in tx_hashes if h not in created]
+        receipts = self._batch_rpc(missing, self.w3.eth.get_transaction_receipt, 'receipt')
+        fetched = []
+        for tx_hash, receipt in receipts.items():
+            contract_addr = _checksum(receipt.contractAddress.lower()) if receipt.contractAddress else None
+            created[tx_hash] = contract_addr
+            fetched.append((tx_hash.lower(), contract_addr))
+
+        if fetched:
+            with self._cache_lock:
+                self._cache_db.executemany(
+                    "INSERT OR REPLACE INTO creation_receipts (tx_hash, contract_address) VALUES (?, ?)", fetched
+                )
+                self._cache_db.commit()
+        return created
+
+    def _deployment_record(self, tx: Dict, contract_addr: str, deployment_type: str,
+                           factory_address: Optional[str] = None) -> Dict:
+        """Token deployment entry built from the deploying transaction"""
+        record = {
+            'contract_address': contract_addr,
+            'tx_hash': tx['hash'],
+            'block_number': int(tx['blockNumber']),
+            'timestamp': int(tx['timeStamp']),
+            'datetime': datetime.fromtimestamp(int(tx['timeStamp'])).isoformat(),
+            'gas_used': int(tx['gasUsed']),
+            'gas_price': int(tx['gasPrice']),
+            'deployment_type': deployment_type
+        }
+        if factory_address is not None:
+            record['factory_address'] = factory_address
+        return record
+
+    def _factory_logs_by_tx(self, txs: List[Dict]) -> tuple:
+        """
+        Logs the factory contracts emitted in the given transactions, keyed by lowercase tx hash
+        One eth_getLogs covers each LOG_BLOCK_RANGE window holding any of the transactions,
+        instead of a receipt per transaction. Also returns the transactions whose window failed.
+        """
+        wanted = {tx['hash'].lower() for tx in txs}
+        blocks = sorted({int(tx['blockNumber']) for tx in txs})
+        logs_by_tx = defaultdict(list)
+        failed_windows = []
+
+        i = 0
+        while i < len(blocks):
+            from_block = blocks[i]
+            while i < len(blocks) and blocks[i] < from_block + LOG_BLOCK_RANGE:
+                i += 1
+            to_block = blocks[i - 1]
+
+            try:
+                self._rpc_limiter.acquire()
+                logs = self.w3.eth.get_logs({
+                    'fromBlock': from_block,
+                    'toBlock': to_block,
+                    'address': self.factory_addresses
+                })
+            except Exception as e:
+                print(f"  [WARNING] eth_getLogs failed for blocks {from_block}-{to_block}: {e}")
+                failed_windows.append((from_block, to_block))
+                continue
+
+            for log in logs:
+                tx_hash = Web3.to_hex(log['transactionHash']).lower()
+                if tx_hash in wanted:
+                    logs_by_tx[tx_hash].append(log)
+
+        missed = [
+            tx for tx in txs
+            if any(lo <= int(tx['blockNumber']) <= hi for lo, hi in failed_windows)
+        ]
+        return logs_by_tx, missed
+
     def find_factory_deployed_tokens(self, wallet_address: str) -> List[Dict]:
         """
         Find tokens deployed via factory contracts (internal transactions)
@@ -202,8 +998,10 @@ class ArenaProxyProfitTracker:
         print(f"[INFO] Fetching internal transactions...")
         all_internal_txs = self.get_internal_transactions(wallet_address)
         print(f"[INFO] Found {len(all_internal_txs)} internal transactions")
+        itx_by_hash = _index_by_hash(all_internal_txs)
 
         factory_calls = 0
+        unresolved = []  # Factory calls whose token must be read from the receipt logs
         for tx in transactions:
             to_addr = tx.get('to', '')
             if not to_addr:
@@ -212,7 +1010,7 @@ class ArenaProxyProfitTracker:
             to_addr_lower = to_addr.lower()
 
             # Check if transaction calls one of our known factory addresses
-            if to_addr_lower in [f.lower() for f in self.factory_addresses]:
+            if to_addr_lower in self._factory_lower:
                 factory_calls += 1
 
                 try:
@@ -220,84 +1018,73 @@ class ArenaProxyProfitTracker:
 
                     # Method 1: Check internal transactions for contract creations
                     found_in_internal = False
-                    for itx in all_internal_txs:
-                        # Match by transaction hash
-                        if itx.get('hash', '').lower() == tx_hash.lower():
-                            # Check if this internal tx created a contract
-                            # Internal tx has 'to' == '' or 'contractAddress' field
-                            contract_addr = itx.get('contractAddress', '')
-
-                            # Sometimes contract creation is indicated by empty 'to' field
-                            if not contract_addr and itx.get('to', '') == '':
-                                # This might be a contract creation, but address not in this field
-                                continue
+                    for itx in itx_by_hash.get(tx_hash.lower(), ()):
+                        # Check if this internal tx created a contract
+                        # Internal tx has 'to' == '' or 'contractAddress' field
+                        contract_addr = itx.get('contractAddress', '')
+
+                        # Sometimes contract creation is indicated by empty 'to' field
+                        if not contract_addr and itx.get('to', '') == '':
+                            # This might be a contract creation, but address not in this field
+                            continue
 
-                            if contract_addr and contract_addr != '' and contract_addr != '0x0000000000000000000000000000000000000000':
-                                contract_addr = Web3.to_checksum_address(contract_addr)
+                        if contract_addr and contract_addr != '' and contract_addr != '0x0000000000000000000000000000000000000000':
+                            contract_addr = _checksum(contract_addr.lower())
+                            deployed_tokens.append(self._deployment_record(tx, contract_addr, 'factory', to_addr))
 
-                                deployed_tokens.append({
-                                    'contract_address': contract_addr,
-                                    'tx_hash': tx_hash,
-                                    'block_number': int(tx['blockNumber']),
-                                    'timestamp': int(tx['timeStamp']),
-                                    'datetime': datetime.fromtimestamp(int(tx['timeStamp'])).isoformat(),
-                                    'gas_used': int(tx['gasUsed']),
-                                    'gas_price': int(tx['gasPrice']),
-                                    'deployment_type': 'factory',
-                                    'factory_address': to_addr
-                                })
-
-                                print(f"  ✓ Found factory token: {contract_addr[:10]}... (Block: {tx['blockNumber']})")
-                                found_in_internal = True
-                                break
+                            print(f"  ✓ Found factory token: {contract_addr[:10]}... (Block: {tx['blockNumber']})")
+                            found_in_internal = True
+                            break
 
-                    # Method 2: If not found in internal txs, try parsing logs/receipt
+                    # Method 2: If not found in internal txs, parse the receipt logs (batched below)
                     if not found_in_internal:
-                        try:
-                            receipt = self.w3.eth.get_transaction_receipt(tx_hash)
-
-                            # Check receipt logs for contract creation events
-                            # Many factory contracts emit a TokenCreated event with the new token address
-                            if receipt and receipt.logs:
-                                for log in receipt.logs:
-                                    # Token address is often in the first topic or in the data
-                                    # For factory contracts, the created token address might be in topics[1]
-                                    if len(log.topics) > 1:
-                                        # Try to extract address from topics
-                                        potential_addr = log.topics[1].hex()
-                                        # Address is the last 20 bytes (40 hex chars) of the topic
-                                        if len(potential_addr) >= 66:  # 0x + 64 chars
-                                            addr_hex = '0x' + potential_addr[-40:]
-                                            try:
-                                                contract_addr = Web3.to_checksum_address(addr_hex)
-
-                                                # Verify this looks like a valid contract by checking it has code
-                                                if len(self.w3.eth.get_code(contract_addr)) > 0:
-                                                    deployed_tokens.append({
-                                                        'contract_address': contract_addr,
-                                                        'tx_hash': tx_hash,
-                                                        'block_number': int(tx['blockNumber']),
-                                                        'timestamp': int(tx['timeStamp']),
-                                                        'datetime': datetime.fromtimestamp(int(tx['timeStamp'])).isoformat(),
-                                                        'gas_used': int(tx['gasUsed']),
-                                                        'gas_price': int(tx['gasPrice']),
-                                                        'deployment_type': 'factory',
-                                                        'factory_address': to_addr
-                                                    })
-
-                                                    print(f"  ✓ Found factory token (via logs): {contract_addr[:10]}... (Block: {tx['blockNumber']})")
-                                                    break
-                                            except Exception:
-                                                continue
-                        except Exception as e:
-                            print(f"  [DEBUG] Could not parse receipt for {tx_hash[:10]}...: {e}")
+                        unresolved.append(tx)
 
                 except Exception as e:
                     print(f"  ✗ Error processing factory tx {tx.get('hash', 'unknown')[:10]}...: {e}")
                     continue
 
-                # Rate limiting
-                time.sleep(0.05)
+        if unresolved:
+            logs_by_tx, missed = self._factory_logs_by_tx(unresolved)
+
+            # Receipts only for transactions whose log window couldn't be fetched
+            if missed:
+                receipts = self._batch_rpc(
+                    [tx['hash'] for tx in missed], self.w3.eth.get_transaction_receipt, 'receipt'
+                )
+                for tx in missed:
+                    receipt = receipts.get(tx['hash'])
+                    if not receipt:
+                        print(f"  [DEBUG] Could not fetch receipt for {tx['hash'][:10]}...")
+                        continue
+                    logs_by_tx[tx['hash'].lower()] = receipt.logs
+
+            # Many factory contracts emit a TokenCreated event with the new token
+            # address in topics[1] (the last 20 bytes of the topic)
+            candidates_by_tx = {}
+            for tx in unresolved:
+                candidates = []
+                for log in logs_by_tx.get(tx['hash'].lower(), ()):
+                    if len(log.topics) > 1:
+                        potential_addr = log.topics[1].hex()
+                        if len(potential_addr) >= 66:  # 0x + 64 chars
+                            try:
+                                candidates.append(_checksum('0x' + potential_addr[-40:].lower()))
+                            except Exception:
+                                continue
+                candidates_by_tx[tx['hash']] = candidates
+
+            # Verify candidates are token contracts in as few eth_calls as possible
+            verified = self.verify_contracts([a for c in candidates_by_tx.values() for a in c])
+
+            for tx in unresolved:
+                for contract_addr in candidates_by_tx.get(tx['hash'], ()):
+                    if contract_addr in verified:
+                        deployed_tokens.append(self._deployment_record(tx, contract_addr, 'factory', tx['to']))
+                        print(f"  ✓ Found factory token (via logs): {contract_addr[:10]}... (Block: {tx['blockNumber']})")
+                        break
+
+            deployed_tokens.sort(key=lambda t: t['block_number'])
 
         print(f"[FACTORY] Found {factory_calls} factory calls, {len(deployed_tokens)} tokens created\n")
         return deployed_tokens
@@ -320,36 +1107,22 @@ class ArenaProxyProfitTracker:
 
         print(f"[INFO] Scanning {len(transactions)} transactions for direct deployments...")
 
-        for tx in transactions:
-            # Contract creation has empty 'to' field
-            if tx.get('to', '') == '' or tx.get('to') is None:
-                # Get transaction receipt to find contract address
-                try:
-                    tx_hash = tx['hash']
-                    receipt = self.w3.eth.get_transaction_receipt(tx_hash)
-
-                    if receipt and receipt.contractAddress:
-                        contract_addr = Web3.to_checksum_address(receipt.contractAddress)
+        # Contract creation has empty 'to' field; receipts give the contract address
+        creations = [tx for tx in transactions if tx.get('to', '') == '' or tx.get('to') is None]
+        created = self._creation_addresses([tx['hash'] for tx in creations])
 
-                        direct_tokens.append({
-                            'contract_address': contract_addr,
-                            'tx_hash': tx_hash,
-                            'block_number': int(tx['blockNumber']),
-                            'timestamp': int(tx['timeStamp']),
-                            'datetime': datetime.fromtimestamp(int(tx['timeStamp'])).isoformat(),
-                            'gas_used': int(tx['gasUsed']),
-                            'gas_price': int(tx['gasPrice']),
-                            'deployment_type': 'direct'
-                        })
+        for tx in creations:
+            try:
+                contract_addr = created.get(tx['hash'])
 
-                        print(f"  ✓ Found direct deployment: {contract_addr[:10]}... (Block: {tx['blockNumber']})")
+                if contract_addr:
+                    direct_tokens.append(self._deployment_record(tx, contract_addr, 'direct'))
 
-                except Exception as e:
-                    print(f"  ✗ Error processing tx {tx.get('hash', 'unknown')}: {e}")
-                    continue
+                    print(f"  ✓ Found direct deployment: {contract_addr[:10]}... (Block: {tx['blockNumber']})")
 
-                # Rate limiting
-                time.sleep(0.1)
+            except Exception as e:
+                print(f"  ✗ Error processing tx {tx.get('hash', 'unknown')}: {e}")
+                continue
 
         print(f"[DIRECT] Found {len(direct_tokens)} direct deployments\n")
 
@@ -373,27 +1146,121 @@ class ArenaProxyProfitTracker:
 
     def get_token_transfers(self, wallet_address: str, token_contract: str) -> List[Dict]:
         """Get all token transfer events for a specific wallet and token"""
-        try:
-            url = "https://api.snowtrace.io/api"
-            params = {
-                'module': 'account',
-                'action': 'tokentx',
-                'contractaddress': token_contract,
-                'address': wallet_address,
-                'startblock': 0,
-                'endblock': 99999999,
-                'sort': 'asc',
-                'apikey': self.api_key
-            }
-            response = requests.get(url, params=params, timeout=15)
-            data = response.json()
+        cached = self._transfer_cache.get(wallet_address.lower(), {}).get(token_contract.lower())
+        if cached is not None:
+            return cached
+
+        params = {
+            'module': 'account',
+            'action': 'tokentx',
+            'contractaddress': token_contract,
+            'address': wallet_address,
+            'startblock': 0,
+            'endblock': 99999999,
+            'sort': 'asc'
+        }
+        return self._cached_rows(params, "token transfers")
+
+    async def _fetch_token_transfers_async(self, session, sem, wallet_address: str,
+                                           token_contract: str) -> List[Dict]:
+        """Coroutine version of get_token_transfers; backs off on 429 using Retry-After"""
+        params = {
+            'module': 'account',
+            'action': 'tokentx',
+            'contractaddress': token_contract,
+            'address': wallet_address,
+            'startblock': 0,
+            'endblock': 99999999,
+            'sort': 'asc',
+            'apikey': self.api_key
+        }
 
-            if data['status'] == '1':
-                return data['result']
-            return []
-        except Exception as e:
-            print(f"Error fetching token transfers: {e}")
-            return []
+        async with sem:
+            for attempt in range(MAX_RETRIES):
+                await self._snowtrace_limiter.acquire_async()
+                async with session.get(SNOWTRACE_API, params=params) as res:
+                    if res.status == 429 and attempt < MAX_RETRIES - 1:
+                        # Retry-After when given, else exponential backoff; jitter spreads out retries
+                        delay = float(res.headers.get('Retry-After', 2 ** attempt))
+                        await asyncio.sleep(delay + random.uniform(0, 0.5))
+                        continue
+                    res.raise_for_status()
+                    data = _loads(await res.read())
+                    break
+
+        # Same rule as _snowtrace_page: NOTOK/rate-limit replies raise so the token is
+        # left to the synchronous fetch instead of being cached as empty
+        if data.get('status') == '1' or isinstance(data.get('result'), list):
+            return data['result']
+        raise RuntimeError(f"API Error: {data.get('result') or data.get('message', 'Unknown error')}")
+
+    async def _prefetch_token_transfers_async(self, wallet_address: str, token_contracts: List[str]):
+        timeout = aiohttp.ClientTimeout(total=15)
+        connector = aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENT_REQUESTS)
+        async with aiohttp.ClientSession(headers=dict(self.session.headers), connector=connector,
+                                         timeout=timeout) as session:
+            sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            results = await asyncio.gather(
+                *[self._fetch_token_transfers_async(session, sem, wallet_address, token)
+                  for token in token_contracts],
+                return_exceptions=True
+            )
+
+        cache = self._transfer_cache.setdefault(wallet_address.lower(), {})
+        for token, result in zip(token_contracts, results):
+            # Failed fetches are retried synchronously by get_token_transfers
+            if not isinstance(result, Exception):
+                cache[token.lower()] = result
+
+    def prefetch_token_transfers(self, wallet_address: str, token_contracts: List[str]):
+        """
+        Download the transfer history of every token concurrently before the per-token analysis
+        Requires aiohttp; without it get_token_transfers fetches each token on demand
+        """
+        if aiohttp is None or len(token_contracts) < 2:
+            return
+
+        print(f"[PREFETCH] Fetching transfers for {len(token_contracts)} tokens concurrently...")
+        asyncio.run(self._prefetch_token_transfers_async(wallet_address, token_contracts))
+
+    def _price_trades(self, trades: List[tuple]):
+        """
+        Turn matched (kind, tx, transfer, avax_wei, wallet) rows into buy, sell and
+        secondary-sell records, plus their (AVAX, USD) totals per kind
+        """
+        # USD price at transaction time, looked up once per day rather than per transaction
+        timestamps = [int(tx['timeStamp']) for _, tx, _, _, _ in trades]
+        day_prices = {}
+        for timestamp in timestamps:
+            day_timestamp = (timestamp // 86400) * 86400
+            if day_timestamp not in day_prices:
+                day_prices[day_timestamp] = self.get_avax_usd_price(timestamp)
+        prices = [day_prices[(timestamp // 86400) * 86400] for timestamp in timestamps]
+
+        avax, token_amounts, usd = _trade_columns(
+            [avax_wei for _, _, _, avax_wei, _ in trades],
+            [int(transfer['value']) for _, _, transfer, _, _ in trades],
+            [int(transfer.get('tokenDecimal', 18)) for _, _, transfer, _, _ in trades],
+            prices
+        )
+        totals = _trade_totals([kind for kind, _, _, _, _ in trades], avax, usd)
+        if np is not None:
+            avax, token_amounts, usd = avax.tolist(), token_amounts.tolist(), usd.tolist()
+
+        records = ([], [], [])
+        for i, (kind, tx, _, _, wallet) in enumerate(trades):
+            avax_key, usd_key = ('avax_spent', 'usd_spent') if kind == BUY else ('avax_received', 'usd_received')
+            records[kind].append({
+                'tx_hash': tx['hash'],
+                'block': int(tx['blockNumber']),
+                'timestamp': timestamps[i],
+                avax_key: avax[i],
+                usd_key: usd[i],
+                'avax_usd_price': prices[i],
+                'token_amount': token_amounts[i],
+                'wallet': wallet
+            })
+        return records, totals
 
     def analyze_token_trades(self, wallet_address: str, token_contract: str,
                             deployment_block: int) -> Dict:
@@ -407,137 +1274,81 @@ class ArenaProxyProfitTracker:
         # Find secondary wallets used for hiding dumps
         secondary_wallets = self.find_secondary_wallets(wallet_address, token_contract)
 
-        # Track all wallets (primary + secondary)
-        all_wallets = {wallet_address.lower()}
-        all_wallets.update([w.lower() for w in secondary_wallets])
+        wallet_b = _b(wallet_address)
 
-        buys = []  # AVAX spent to acquire tokens
-        sells = []  # AVAX received from selling tokens
-        secondary_sells = []  # Sales from secondary wallets
+        # Matched trades as (kind, tx, transfer, avax_wei, wallet); amounts, prices
+        # and USD values are then computed for all of them at once
+        trades = []
 
         # Analyze primary wallet transactions
         all_txs = self.get_wallet_transactions(wallet_address, start_block=deployment_block)
+        self.prefetch_avax_prices([int(tx['timeStamp']) for tx in all_txs])
         token_transfers = self.get_token_transfers(wallet_address, token_contract)
 
-        for tx in all_txs:
-            if int(tx['blockNumber']) < deployment_block:
-                continue
+        # Internal transactions are fetched once, on the first sell, and indexed by hash
+        itx_by_hash = None
 
+        # Only transactions that involved the token
+        for tx, related_transfers in _merge_transfers(all_txs, token_transfers, deployment_block):
             tx_hash = tx['hash']
-            value_wei = int(tx.get('value', 0))
-            value_avax = float(self.w3.from_wei(value_wei, 'ether'))
-            timestamp = int(tx['timeStamp'])
-
-            # Get USD price at transaction time
-            avax_usd_price = self.get_avax_usd_price(timestamp)
-
-            # Check if this transaction involved the token
-            related_transfers = [t for t in token_transfers if t['hash'] == tx_hash]
-
-            if not related_transfers:
-                continue
 
             # Determine if buy or sell based on direction
             for transfer in related_transfers:
-                from_addr = transfer['from'].lower()
-                to_addr = transfer['to'].lower()
-                wallet_lower = wallet_address.lower()
-
-                # Buy: wallet receives tokens
-                if to_addr == wallet_lower and from_addr != wallet_lower:
-                    buys.append({
-                        'tx_hash': tx_hash,
-                        'block': int(tx['blockNumber']),
-                        'timestamp': timestamp,
-                        'avax_spent': value_avax,
-                        'usd_spent': value_avax * avax_usd_price,
-                        'avax_usd_price': avax_usd_price,
-                        'token_amount': int(transfer['value']) / (10 ** int(transfer.get('tokenDecimal', 18))),
-                        'wallet': 'primary'
-                    })
+                from_addr = _b(transfer['from'])
+                to_addr = _b(transfer['to'])
+
+                # Buy: wallet receives tokens, paying the transaction value
+                if to_addr == wallet_b and from_addr != wallet_b:
+                    trades.append((BUY, tx, transfer, int(tx.get('value', 0)), 'primary'))
 
                 # Sell: wallet sends tokens
-                elif from_addr == wallet_lower and to_addr != wallet_lower:
+                elif from_addr == wallet_b and to_addr != wallet_b:
                     # For sells, we need to find AVAX received (might be in internal txs)
-                    internal_txs = self.get_internal_transactions(wallet_address)
-                    avax_received = 0
+                    if itx_by_hash is None:
+                        itx_by_hash = _index_by_hash(self.get_internal_transactions(wallet_address))
+                    received_wei = 0
 
                     # Find internal tx with matching hash
-                    for itx in internal_txs:
-                        if itx['hash'] == tx_hash and itx['to'].lower() == wallet_lower:
-                            avax_received = float(self.w3.from_wei(int(itx.get('value', 0)), 'ether'))
+                    for itx in itx_by_hash.get(tx_hash.lower(), ()):
+                        if _b(itx['to']) == wallet_b:
+                            received_wei = int(itx.get('value', 0))
                             break
 
-                    sells.append({
-                        'tx_hash': tx_hash,
-                        'block': int(tx['blockNumber']),
-                        'timestamp': timestamp,
-                        'avax_received': avax_received,
-                        'usd_received': avax_received * avax_usd_price,
-                        'avax_usd_price': avax_usd_price,
-                        'token_amount': int(transfer['value']) / (10 ** int(transfer.get('tokenDecimal', 18))),
-                        'wallet': 'primary'
-                    })
-
-            # Rate limiting
-            time.sleep(0.05)
+                    trades.append((SELL, tx, transfer, received_wei, 'primary'))
 
         # Analyze secondary wallet transactions
         for secondary_wallet in secondary_wallets:
             print(f"      [SECONDARY] Analyzing {secondary_wallet[:10]}...")
             sec_txs = self.get_wallet_transactions(secondary_wallet, start_block=deployment_block)
+            self.prefetch_avax_prices([int(tx['timeStamp']) for tx in sec_txs])
             sec_transfers = self.get_token_transfers(secondary_wallet, token_contract)
+            sec_itx_by_hash = None
+            secondary_b = _b(secondary_wallet)
 
-            for tx in sec_txs:
-                if int(tx['blockNumber']) < deployment_block:
-                    continue
-
+            for tx, related_transfers in _merge_transfers(sec_txs, sec_transfers, deployment_block):
                 tx_hash = tx['hash']
-                timestamp = int(tx['timeStamp'])
-                avax_usd_price = self.get_avax_usd_price(timestamp)
-
-                related_transfers = [t for t in sec_transfers if t['hash'] == tx_hash]
-                if not related_transfers:
-                    continue
 
                 for transfer in related_transfers:
-                    from_addr = transfer['from'].lower()
-                    to_addr = transfer['to'].lower()
-
                     # Only track sells from secondary wallet
-                    if from_addr == secondary_wallet.lower():
-                        internal_txs = self.get_internal_transactions(secondary_wallet)
-                        avax_received = 0
-
-                        for itx in internal_txs:
-                            if itx['hash'] == tx_hash and itx['to'].lower() == secondary_wallet.lower():
-                                avax_received = float(self.w3.from_wei(int(itx.get('value', 0)), 'ether'))
+                    if _b(transfer['from']) == secondary_b:
+                        if sec_itx_by_hash is None:
+                            sec_itx_by_hash = _index_by_hash(self.get_internal_transactions(secondary_wallet))
+                        received_wei = 0
+
+                        for itx in sec_itx_by_hash.get(tx_hash.lower(), ()):
+                            if _b(itx['to']) == secondary_b:
+                                received_wei = int(itx.get('value', 0))
                                 break
 
-                        secondary_sells.append({
-                            'tx_hash': tx_hash,
-                            'block': int(tx['blockNumber']),
-                            'timestamp': timestamp,
-                            'avax_received': avax_received,
-                            'usd_received': avax_received * avax_usd_price,
-                            'avax_usd_price': avax_usd_price,
-                            'token_amount': int(transfer['value']) / (10 ** int(transfer.get('tokenDecimal', 18))),
-                            'wallet': secondary_wallet
-                        })
+                        trades.append((SECONDARY_SELL, tx, transfer, received_wei, secondary_wallet))
 
-                time.sleep(0.05)
+        (buys, sells, secondary_sells), totals = self._price_trades(trades)
 
         # Calculate totals (including secondary wallets)
-        total_avax_spent = sum(b['avax_spent'] for b in buys)
-        total_usd_spent = sum(b['usd_spent'] for b in buys)
-
-        total_avax_received = sum(s['avax_received'] for s in sells)
-        total_usd_received = sum(s['usd_received'] for s in sells)
+        (total_avax_spent, total_usd_spent), (total_avax_received, total_usd_received), \
+            (secondary_avax_received, secondary_usd_received) = totals
 
         # Add secondary wallet sales
-        secondary_avax_received = sum(s['avax_received'] for s in secondary_sells)
-        secondary_usd_received = sum(s['usd_received'] for s in secondary_sells)
-
         total_avax_received += secondary_avax_received
         total_usd_received += secondary_usd_received
 
@@ -575,16 +1386,26 @@ class ArenaProxyProfitTracker:
         Complete analysis of a single wallet
         Returns all deployed tokens and profit metrics
         """
-        wallet_address = Web3.to_checksum_address(wallet_address)
+        wallet_address = _checksum(wallet_address.lower())
+
+        # Histories are refetched (or topped up) for every run, then shared by its tokens
+        self._begin_run()
+        try:
+            return self._analyze_wallet(wallet_address)
+        finally:
+            self._end_run()
+
+    def _analyze_wallet(self, wallet_address: str) -> Dict:
+        """analyze_wallet body, for a checksummed address"""
 
-        print(f"\n{'='*70}")
+        print(f"\n{EQ_RULE}")
         print(f"ANALYZING WALLET: {wallet_address}")
-        print(f"{'='*70}")
+        print(f"{EQ_RULE}")
 
         # Get current AVAX balance
         avax_balance = self.get_avax_balance(wallet_address)
         print(f"[BALANCE] Current AVAX: {avax_balance:.18f} AVAX")
-        print(f"{'='*70}\n")
+        print(f"{EQ_RULE}\n")
 
         # Find all deployed tokens
         deployed_tokens = self.find_deployed_tokens(wallet_address)
@@ -604,40 +1425,48 @@ class ArenaProxyProfitTracker:
         # Analyze each token
         print(f"\n[PROFIT ANALYSIS] Analyzing {len(deployed_tokens)} tokens...\n")
 
+        self.prefetch_token_transfers(wallet_address, [t['contract_address'] for t in deployed_tokens])
+
         token_analyses = []
         total_profit_avax = 0
         total_profit_usd = 0
         profitable_count = 0
         total_secondary_wallets = set()
 
-        for i, token_info in enumerate(deployed_tokens, 1):
-            print(f"  [{i}/{len(deployed_tokens)}] Token: {token_info['contract_address'][:10]}...")
+        # Tokens only share caches and the session, so they're analyzed concurrently
+        # (in the shared token pool during analyze_multiple_wallets); results are
+        # collected in deployment order
+        token_pool = self._token_pool
+        with nullcontext(token_pool) if token_pool else ThreadPoolExecutor(max_workers=self.parallelism) as pool:
+            futures = [
+                pool.submit(self.analyze_token_trades, wallet_address,
+                            token_info['contract_address'], token_info['block_number'])
+                for token_info in deployed_tokens
+            ]
 
-            try:
-                analysis = self.analyze_token_trades(
-                    wallet_address,
-                    token_info['contract_address'],
-                    token_info['block_number']
-                )
+            for i, (token_info, future) in enumerate(zip(deployed_tokens, futures), 1):
+                print(f"  [{i}/{len(deployed_tokens)}] Token: {token_info['contract_address'][:10]}...")
 
-                # Merge deployment info with analysis
-                full_analysis = {**token_info, **analysis}
-                token_analyses.append(full_analysis)
+                try:
+                    analysis = future.result()
 
-                total_profit_avax += analysis['profit_avax']
-                total_profit_usd += analysis['profit_usd']
-                if analysis['profit_avax'] > 0:
-                    profitable_count += 1
+                    # Merge deployment info with analysis
+                    full_analysis = {**token_info, **analysis}
+                    token_analyses.append(full_analysis)
 
-                # Track unique secondary wallets(you sneaky huh? ;-))
-                total_secondary_wallets.update(analysis.get('secondary_wallets', []))
+                    total_profit_avax += analysis['profit_avax']
+                    total_profit_usd += analysis['profit_usd']
+                    if analysis['profit_avax'] > 0:
+                        profitable_count += 1
 
-            except Exception as e:
-                print(f"      ✗ Error analyzing token: {e}")
-                continue
+                    # Track unique secondary wallets(you sneaky huh? ;-))
+                    total_secondary_wallets.update(analysis.get('secondary_wallets', []))
+
+                except Exception as e:
+                    print(f"      ✗ Error analyzing token: {e}")
+                    continue
 
-            # Rate limiting between tokens
-            time.sleep(0.3)
+        self._transfer_cache.pop(wallet_address.lower(), None)
 
         # Calculate summary metrics
         result = {
@@ -655,11 +1484,12 @@ class ArenaProxyProfitTracker:
             'secondary_wallets': list(total_secondary_wallets),
             'tokens': token_analyses
         }
+        self._token_tables[wallet_address] = _token_table(token_analyses)
 
         # Print summary
-        print(f"\n{'='*70}")
+        print(f"\n{EQ_RULE}")
         print(f"WALLET SUMMARY: {wallet_address[:10]}...")
-        print(f"{'='*70}")
+        print(f"{EQ_RULE}")
         print(f"  AVAX Balance:          {avax_balance:.18f} AVAX")
         print(f"  Tokens Deployed:       {result['num_tokens_deployed']}")
         print(f"  Tokens Analyzed:       {result['num_tokens_analyzed']}")
@@ -668,7 +1498,7 @@ class ArenaProxyProfitTracker:
         print(f"  Avg Profit/Token:      {result['average_profit_per_token_avax']:.4f} AVAX (${result['average_profit_per_token_usd']:.2f} USD)")
         print(f"  Success Rate:          {result['success_rate']:.1f}%")
         print(f"  Secondary Wallets:     {len(total_secondary_wallets)}")
-        print(f"{'='*70}\n")
+        print(f"{EQ_RULE}\n")
 
         return result
 
@@ -676,28 +1506,35 @@ class ArenaProxyProfitTracker:
         """
         Analyze multiple wallets and generate combined report
         """
-        print(f"\n{'#'*70}")
+        print(f"\n{HASH_RULE}")
         print(f"# ARENA PROXY PROFIT TRACKER")
         print(f"# Analyzing {len(wallet_addresses)} wallets")
         print(f"# Arena Proxy: {self.arena_proxy}")
-        print(f"{'#'*70}\n")
+        print(f"{HASH_RULE}\n")
 
         all_results = []
 
-        for wallet in wallet_addresses:
-            result = self.analyze_wallet(wallet)
-            all_results.append(result)
-            self.results['wallets'][wallet] = result
+        # Wallets wait on different API calls, so their analyses overlap; their tokens all
+        # go through one token pool rather than a pool per wallet. Results are collected
+        # in input order so reports and exports keep the wallet order
+        workers = max(1, min(WALLET_ANALYSIS_WORKERS, len(wallet_addresses)))
+        with ThreadPoolExecutor(max_workers=self.parallelism) as token_pool, \
+                ThreadPoolExecutor(max_workers=workers) as pool:
+            self._token_pool = token_pool
+            try:
+                futures = [pool.submit(self.analyze_wallet, wallet) for wallet in wallet_addresses]
+                for wallet, future in zip(wallet_addresses, futures):
+                    result = future.result()
+                    all_results.append(result)
+                    self.results['wallets'][wallet] = result
+            finally:
+                self._token_pool = None
 
         # Calculate combined metrics
-        total_tokens = sum(r['num_tokens_deployed'] for r in all_results)
-        total_profit_avax = sum(r['total_profit_avax'] for r in all_results)
-        total_profit_usd = sum(r['total_profit_usd'] for r in all_results)
-        total_profitable = sum(r['profitable_tokens'] for r in all_results)
-        total_analyzed = sum(r['num_tokens_analyzed'] for r in all_results)
-        total_secondary = sum(r.get('total_secondary_wallets_used', 0) for r in all_results)
-
-        self.results['summary'] = {
+        (total_tokens, total_profit_avax, total_profit_usd,
+         total_profitable, total_analyzed, total_secondary) = _wallet_totals(all_results)
+
+        self.results['summary'] = summary = {
             'num_wallets_analyzed': len(wallet_addresses),
             'total_tokens_deployed': total_tokens,
             'total_tokens_analyzed': total_analyzed,
@@ -711,50 +1548,149 @@ class ArenaProxyProfitTracker:
         }
 
         # Print final summary
-        print(f"\n{'#'*70}")
+        avg_avax, avg_usd, success_rate = (summary['average_profit_per_wallet_avax'],
+                                           summary['average_profit_per_wallet_usd'],
+                                           summary['overall_success_rate'])
+        print(f"\n{HASH_RULE}")
         print(f"# COMBINED SUMMARY - ALL WALLETS")
-        print(f"{'#'*70}")
+        print(f"{HASH_RULE}")
         print(f"  Wallets Analyzed:          {len(wallet_addresses)}")
         print(f"  Total Tokens Deployed:     {total_tokens}")
         print(f"  Total Tokens Analyzed:     {total_analyzed}")
         print(f"  Total Profitable Tokens:   {total_profitable}")
         print(f"  COMBINED PROFIT:           {total_profit_avax:.4f} AVAX (${total_profit_usd:.2f} USD)")
-        print(f"  Avg Profit per Wallet:     {self.results['summary']['average_profit_per_wallet_avax']:.4f} AVAX (${self.results['summary']['average_profit_per_wallet_usd']:.2f} USD)")
-        print(f"  Overall Success Rate:      {self.results['summary']['overall_success_rate']:.1f}%")
+        print(f"  Avg Profit per Wallet:     {avg_avax:.4f} AVAX (${avg_usd:.2f} USD)")
+        print(f"  Overall Success Rate:      {success_rate:.1f}%")
         print(f"  Total Secondary Wallets:   {total_secondary}")
-        print(f"{'#'*70}\n")
+        print(f"{HASH_RULE}\n")
 
         return self.results
 
-    def export_results(self, filename: Optional[str] = None):
-        """Export results to JSON file"""
+    def export_results(self, filename: Optional[str] = None, pretty: bool = False):
+        """
+        Export results to JSON file
+        Compact output is streamed one wallet at a time through a large write buffer,
+        so only one wallet's JSON is held in memory; pretty output is written in one go
+        """
         if filename is None:
             filename = f"arena_profit_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
         try:
-            with open(filename, 'w') as f:
-                json.dump(self.results, f, indent=2)
+            with open(filename, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+                if pretty:
+                    f.write(_dumps(self.results, pretty=True))
+                else:
+                    f.write(b'{"wallets":{')
+                    for i, (wallet, data) in enumerate(self.results['wallets'].items()):
+                        if i:
+                            f.write(b',')
+                        f.write(_dumps(wallet) + b':' + _dumps(data))
+                    f.write(b'}')
+                    for key, value in self.results.items():
+                        if key != 'wallets':
+                            f.write(b',' + _dumps(key) + b':' + _dumps(value))
+                    f.write(b'}')
             print(f"[EXPORT] Results saved to {filename}")
         except Exception as e:
             print(f"[ERROR] Failed to export results: {e}")
 
-    def generate_blacklist_entries(self, min_tokens: int = 5000, min_profit_usd: float = 100.0) -> List[Dict]:
+    def export_results_binary(self, filename: Optional[str] = None):
         """
-        Generate blacklist entries for wallets meeting criteria
+        Export every wallet's token table as one fixed-layout binary file, plus a JSON
+        header (filename + RESULTS_HEADER_SUFFIX) with the schema and wallet summaries
+        load_results() memory-maps it back without parsing the token rows
+        """
+        if np is None:
+            print("[ERROR] Binary export needs numpy")
+            return
+        if filename is None:
+            filename = f"arena_profit_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.bin"
 
-        Args:
-            min_tokens: Minimum combined tokens deployed to blacklist
-            min_profit_usd: Minimum combined profit in USD to blacklist
+        tables = []
+        wallets = []
+        row = 0
+        for wallet_addr, data in self.results['wallets'].items():
+            table = self._token_tables.get(data.get('wallet_address'))
+            if table is None or len(table) != len(data['tokens']):
+                table = _token_table(data['tokens'])
+            tables.append(table)
+            summary = {k: v for k, v in data.items() if k != 'tokens'}
+            wallets.append({**summary, 'key': wallet_addr, 'rows': [row, row + len(table)]})
+            row += len(table)
+        table = np.concatenate(tables) if tables else _token_table([])
+
+        header = {
+            'dtype': table.dtype.descr,
+            'rows': len(table),
+            'wallets': wallets,
+            'summary': self.results['summary'],
+            'timestamp': self.results['timestamp']
+        }
+        try:
+            table.tofile(filename)
+            with open(filename + RESULTS_HEADER_SUFFIX, 'wb') as f:
+                f.write(_dumps(header, pretty=True))
+            print(f"[EXPORT] Binary results saved to {filename}")
+        except Exception as e:
+            print(f"[ERROR] Failed to export binary results: {e}")
+
+    def load_results(self, filename: str) -> Dict:
         """
-        blacklist_entries = []
+        Load results written by export_results_binary, memory-mapping the token rows
+        Wallet token lists are views on the mapping, so processes loading the same file
+        share its pages and rows are only decoded when a report reads them
+        """
+        with open(filename + RESULTS_HEADER_SUFFIX, 'rb') as f:
+            header = _loads(f.read())
+        dtype = np.dtype([tuple(field) for field in header['dtype']])
+        if header['rows']:
+            table = np.memmap(filename, dtype=dtype, mode='r', shape=(header['rows'],))
+        else:
+            table = np.zeros(0, dtype=dtype)
+
+        wallets = {}
+        for summary in header['wallets']:
+            start, end = summary.pop('rows')
+            rows = table[start:end]
+            wallets[summary.pop('key')] = {**summary, 'tokens': _TableTokens(rows)}
+            self._token_tables[summary['wallet_address']] = rows
+
+        self.results = {'wallets': wallets, 'summary': header['summary'], 'timestamp': header['timestamp']}
+        return self.results
 
+    def _walk_wallets(self, callbacks: List):
+        """Run every callback(wallet_addr, data) over the analyzed wallets in a single pass"""
         for wallet_addr, data in self.results['wallets'].items():
-            num_tokens = data['num_tokens_deployed']
-            profit_avax = data['total_profit_avax']
-            profit_usd = data['total_profit_usd']
-            secondary_wallets = data.get('total_secondary_wallets_used', 0)
+            for callback in callbacks:
+                callback(wallet_addr, data)
+
+    def _blacklist_check(self, min_tokens: int, min_profit_usd: float) -> tuple:
+        """
+        (per-wallet callback, finish) for blacklist evaluation during _walk_wallets;
+        finish() applies the thresholds to the collected columns, builds entries only
+        for the wallets that meet them, prints the report and returns the entries
+        """
+        wallets = []
+        num_tokens_col = []
+        profit_usd_col = []
+
+        def check(wallet_addr: str, data: Dict):
+            wallets.append((wallet_addr, data))
+            num_tokens_col.append(data['num_tokens_deployed'])
+            profit_usd_col.append(data['total_profit_usd'])
+
+        def finish() -> List[Dict]:
+            blacklist_entries = []
+            lines = []  # Report text, written to stdout in one go
+            flagged_at = datetime.now().isoformat()  # One evaluation, one timestamp for all its entries
+
+            for i in _blacklist_rows(num_tokens_col, profit_usd_col, min_tokens, min_profit_usd):
+                wallet_addr, data = wallets[i]
+                num_tokens = num_tokens_col[i]
+                profit_avax = data['total_profit_avax']
+                profit_usd = profit_usd_col[i]
+                secondary_wallets = data.get('total_secondary_wallets_used', 0)
 
-            if num_tokens >= min_tokens or profit_usd >= min_profit_usd:
                 entry = {
                     'address': wallet_addr.lower(),
                     'reason': f"Arena deployer: {num_tokens} tokens deployed, ${profit_usd:.2f} USD profit ({profit_avax:.2f} AVAX)",
@@ -769,46 +1705,138 @@ class ArenaProxyProfitTracker:
                         'pattern': 'arena_serial_deployer',
                         'arena_proxy': self.arena_proxy
                     },
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': flagged_at,
                     'flagged_by': 'ArenaProxyProfitTracker'
                 }
                 blacklist_entries.append(entry)
 
-                print(f"\n[BLACKLIST] {wallet_addr}")
-                print(f"  Reason: {entry['reason']}")
+                lines.append(f"\n[BLACKLIST] {wallet_addr}")
+                lines.append(f"  Reason: {entry['reason']}")
                 if secondary_wallets > 0:
-                    print(f"  Secondary Wallets Used: {secondary_wallets}")
+                    lines.append(f"  Secondary Wallets Used: {secondary_wallets}")
 
-        return blacklist_entries
+            if lines:
+                sys.stdout.write('\n'.join(lines) + '\n')
+            return blacklist_entries
 
-    def print_detailed_token_report(self, wallet_address: str, top_n: int = 10):
-        """Print detailed report of top N most profitable tokens for a wallet"""
-        wallet_address = Web3.to_checksum_address(wallet_address)
+        return check, finish
 
-        if wallet_address not in self.results['wallets']:
-            print(f"No data found for wallet {wallet_address}")
-            return
+    def generate_blacklist_entries(self, min_tokens: int = 5000, min_profit_usd: float = 100.0) -> List[Dict]:
+        """
+        Generate blacklist entries for wallets meeting criteria
 
-        wallet_data = self.results['wallets'][wallet_address]
-        tokens = wallet_data['tokens']
+        Args:
+            min_tokens: Minimum combined tokens deployed to blacklist
+            min_profit_usd: Minimum combined profit in USD to blacklist
+        """
+        check, finish = self._blacklist_check(min_tokens, min_profit_usd)
+        self._walk_wallets([check])
+        return finish()
 
-        # Sort by profit (USD)
-        sorted_tokens = sorted(tokens, key=lambda x: x.get('profit_usd', 0), reverse=True)
+    def print_detailed_token_report(self, wallet_address: str, top_n: int = 10):
+        """Print detailed report of top N most profitable tokens for a wallet"""
+        self.print_detailed_token_reports([wallet_address], top_n)
 
-        print(f"\n{'='*70}")
-        print(f"TOP {top_n} MOST PROFITABLE TOKENS - {wallet_address[:10]}...")
-        print(f"{'='*70}\n")
+    def print_detailed_token_reports(self, wallet_addresses: List[str], top_n: int = 10):
+        """
+        Print the detailed token report of each wallet, in order
+        Reports are independent, so past REPORT_PROCESS_THRESHOLD wallets they're
+        formatted in a process pool; the text is still written from this process
+        """
+        jobs = []
+        for wallet_address in wallet_addresses:
+            wallet_address = _checksum(wallet_address.lower())
+            wallet_data = self.results['wallets'].get(wallet_address)
+            if wallet_data is None:
+                jobs.append(wallet_address)
+                continue
+            table = self._token_tables.get(wallet_data.get('wallet_address'))
+            jobs.append((wallet_address, wallet_data['tokens'], table, top_n))
+
+        reports = [job for job in jobs if isinstance(job, tuple)]
+        if len(reports) >= REPORT_PROCESS_THRESHOLD:
+            with ProcessPoolExecutor() as pool:
+                texts = iter(pool.map(_format_wallet_report, *zip(*reports), chunksize=REPORT_CHUNK))
+        else:
+            texts = iter([_format_wallet_report(*job) for job in reports])
+
+        for job in jobs:
+            if isinstance(job, tuple):
+                sys.stdout.write(next(texts))
+            else:
+                print(f"No data found for wallet {job}")
+
+    def _buy_limit_check(self, min_buy_limit: float) -> tuple:
+        """
+        (per-wallet callback, finish) for buy-limit checks during _walk_wallets;
+        finish() runs the limit check over the collected columns, prints the report
+        and returns the violations
+        """
+        # Every (wallet, token) pair as flat columns, so the limit check runs over whole arrays;
+        # a wallet's tokens start at its offset in starts, and are only looked up when flagged
+        owners = []
+        starts = []
+        bought = []
+        sold = []
+
+        def collect(wallet_addr: str, data: Dict):
+            tokens = data['tokens']
+            owners.append((wallet_addr, tokens))
+            starts.append(len(bought))
+            table = self._token_tables.get(data.get('wallet_address'))
+            if table is not None and len(table) == len(tokens):
+                bought.extend(table['avax_spent'].tolist())
+                sold.extend(table['avax_received'].tolist())
+            else:
+                bought.extend(token.get('total_avax_spent', 0) for token in tokens)
+                sold.extend(token.get('total_avax_received', 0) for token in tokens)
+
+        def finish() -> Dict:
+            lines = [f"\n{EQ_RULE}"]
+            lines.append(f"CHECKING BUY LIMIT VIOLATIONS (>{min_buy_limit} AVAX)")
+            lines.append(f"{EQ_RULE}\n")
+
+            violations = []
+
+            # Flag buys over the limit that were then dumped (profited or broke even) before
+            # bonding, which is a no-no; sold at least 80% of value (prebond is so much worse bro)
+            for i in _violation_rows(bought, sold, min_buy_limit):
+                owner = bisect_right(starts, i) - 1
+                wallet_addr, tokens = owners[owner]
+                token = tokens[i - starts[owner]]
+                total_bought, total_sold = bought[i], sold[i]
+                violation = {
+                    'wallet': wallet_addr,
+                    'token': token['token_address'],
+                    'avax_bought': total_bought,
+                    'avax_sold': total_sold,
+                    'profit_avax': token.get('profit_avax', 0),
+                    'profit_usd': token.get('profit_usd', 0),
+                    'deployed': token.get('datetime', 'unknown'),
+                    'num_buys': token.get('num_buys', 0),
+                    'num_sells': token.get('num_sells', 0),
+                    'secondary_sells': token.get('num_secondary_sells', 0)
+                }
+                violations.append(violation)
+
+                lines.append(f"[VIOLATION] {wallet_addr[:10]}...")
+                lines.append(f"  Token: {token['token_address'][:10]}...")
+                lines.append(f"  Bought: {total_bought:.2f} AVAX (limit: {min_buy_limit})")
+                lines.append(f"  Sold: {total_sold:.2f} AVAX")
+                lines.append(f"  Profit: {violation['profit_avax']:.2f} AVAX (${violation['profit_usd']:.2f})")
+                if violation['secondary_sells'] > 0:
+                    lines.append(f"  Secondary dumps: {violation['secondary_sells']}")
+                lines.append('')
+
+            lines.append(f"Total violations found: {len(violations)}\n")
+            sys.stdout.write('\n'.join(lines) + '\n')
+            return {
+                'violations': violations,
+                'total_violations': len(violations),
+                'min_buy_limit': min_buy_limit
+            }
 
-        for i, token in enumerate(sorted_tokens[:top_n], 1):
-            print(f"{i}. Token: {token['token_address']}")
-            print(f"   Deployed: {token['datetime']}")
-            print(f"   Buys: {token['num_buys']} | Sells: {token['num_sells']} (Primary)")
-            if token.get('num_secondary_sells', 0) > 0:
-                print(f"   Secondary Sells: {token['num_secondary_sells']} via {len(token.get('secondary_wallets', []))} wallets")
-            print(f"   Spent: {token['total_avax_spent']:.4f} AVAX (${token['total_usd_spent']:.2f})")
-            print(f"   Received: {token['total_avax_received']:.4f} AVAX (${token['total_usd_received']:.2f})")
-            print(f"   PROFIT: {token['profit_avax']:.4f} AVAX (${token['profit_usd']:.2f})")
-            print()
+        return collect, finish
 
     def check_buy_limit_violations(self, min_buy_limit: float = 5.0) -> Dict:
         """
@@ -818,52 +1846,20 @@ class ArenaProxyProfitTracker:
         Args:
             min_buy_limit: Minimum AVAX buy amount to be flagged (default 5 AVAX)
         """
-        print(f"\n{'='*70}")
-        print(f"CHECKING BUY LIMIT VIOLATIONS (>{min_buy_limit} AVAX)")
-        print(f"{'='*70}\n")
-
-        violations = []
+        collect, finish = self._buy_limit_check(min_buy_limit)
+        self._walk_wallets([collect])
+        return finish()
 
-        for wallet_addr, data in self.results['wallets'].items():
-            for token in data['tokens']:
-                total_bought = token.get('total_avax_spent', 0)
-
-                # If bought more than limit
-                if total_bought > min_buy_limit:
-                    # Will lets check if they dumped (sold more than they bought)
-                    total_sold = token.get('total_avax_received', 0)
-
-                    # Only flag if they dumped (profited or broke even) before bonding is a no-no
-                    if total_sold >= total_bought * 0.8:  # Sold at least 80% of value(prebond is so much worse bro)
-                        violation = {
-                            'wallet': wallet_addr,
-                            'token': token['token_address'],
-                            'avax_bought': total_bought,
-                            'avax_sold': total_sold,
-                            'profit_avax': token.get('profit_avax', 0),
-                            'profit_usd': token.get('profit_usd', 0),
-                            'deployed': token.get('datetime', 'unknown'),
-                            'num_buys': token.get('num_buys', 0),
-                            'num_sells': token.get('num_sells', 0),
-                            'secondary_sells': token.get('num_secondary_sells', 0)
-                        }
-                        violations.append(violation)
-
-                        print(f"[VIOLATION] {wallet_addr[:10]}...")
-                        print(f"  Token: {token['token_address'][:10]}...")
-                        print(f"  Bought: {total_bought:.2f} AVAX (limit: {min_buy_limit})")
-                        print(f"  Sold: {total_sold:.2f} AVAX")
-                        print(f"  Profit: {violation['profit_avax']:.2f} AVAX (${violation['profit_usd']:.2f})")
-                        if violation['secondary_sells'] > 0:
-                            print(f"  Secondary dumps: {violation['secondary_sells']}")
-                        print()
-
-        print(f"Total violations found: {len(violations)}\n")
-        return {
-            'violations': violations,
-            'total_violations': len(violations),
-            'min_buy_limit': min_buy_limit
-        }
+    def review_wallets(self, min_tokens: int = 5000, min_profit_usd: float = 100.0,
+                       min_buy_limit: float = 5.0) -> tuple:
+        """
+        generate_blacklist_entries and check_buy_limit_violations in one pass over the
+        analyzed wallets; returns (blacklist entries, buy limit violations)
+        """
+        blacklist_check, blacklist_finish = self._blacklist_check(min_tokens, min_profit_usd)
+        buy_limit_check, buy_limit_finish = self._buy_limit_check(min_buy_limit)
+        self._walk_wallets([blacklist_check, buy_limit_check])
+        return blacklist_finish(), buy_limit_finish()
 
     def get_latest_block_number(self) -> int:
         """Get the latest block number from the blockchain"""
@@ -892,8 +1888,9 @@ class ArenaProxyProfitTracker:
                     'sort': 'asc',
                     'apikey': self.api_key
                 }
-                response = requests.get(url, params=params, timeout=15)
-                data = response.json()
+                self._snowscan_limiter.acquire()
+                response = self.session.get(url, params=params, timeout=15)
+                data = _loads(response.content)
 
                 if data['status'] == '1' and data['result']:
                     for tx in data['result']:
@@ -901,7 +1898,7 @@ class ArenaProxyProfitTracker:
                         if tx.get('isError') == '1':
                             continue
 
-                        deployer_addr = Web3.to_checksum_address(tx['from'])
+                        deployer_addr = _checksum(tx['from'].lower())
                         tx_hash = tx['hash']
                         block_number = int(tx['blockNumber'])
                         timestamp = int(tx['timeStamp'])
@@ -919,9 +1916,10 @@ class ArenaProxyProfitTracker:
                                         if len(potential_addr) >= 66:
                                             addr_hex = '0x' + potential_addr[-40:]
                                             try:
-                                                contract_addr = Web3.to_checksum_address(addr_hex)
-                                                # Verify it has code
-                                                if len(self.w3.eth.get_code(contract_addr)) > 0:
+                                                contract_addr = _checksum(addr_hex.lower())
+                                                # Verify it has code (known token contracts do)
+                                                if contract_addr in self._verified_contracts or \
+                                                        len(self.w3.eth.get_code(contract_addr)) > 0:
                                                     break
                                             except Exception:
                                                 continue
@@ -940,8 +1938,6 @@ class ArenaProxyProfitTracker:
                             # Skip this transaction if we can't get receipt
                             continue
 
-                time.sleep(0.2)  # Rate limiting
-
             except Exception as e:
                 print(f"[ERROR] Failed to scan factory {factory_addr[:10]}...: {e}")
                 continue
@@ -953,14 +1949,16 @@ class ArenaProxyProfitTracker:
         """
         Update statistics for a deployer and calculate their profit
         """
-        deployer = Web3.to_checksum_address(deployer)
+        deployer = _checksum(deployer.lower())
 
         # Update deployment count
         self.deployer_stats[deployer]['token_count'] += 1
         self.deployer_stats[deployer]['last_deployment'] = datetime.fromtimestamp(timestamp).isoformat()
         self.deployer_stats[deployer]['tokens'].append(token_address)
 
-        # Quick profit analysis for this token
+        # Quick profit analysis for this token, as its own run so the history memo
+        # is fresh for this deployment and dropped afterwards
+        self._begin_run()
         try:
             analysis = self.analyze_token_trades(deployer, token_address, block_number)
 
@@ -969,6 +1967,8 @@ class ArenaProxyProfitTracker:
 
         except Exception as e:
             print(f"    [WARNING] Could not analyze profit for {token_address[:10]}...: {e}")
+        finally:
+            self._end_run()
 
     def check_and_flag_deployer(self, deployer: str, min_tokens: int = 3,
                                 min_profit_avax: float = 1.0):
@@ -976,7 +1976,7 @@ class ArenaProxyProfitTracker:
         Check if a deployer meets flagging criteria and flag them if so
         Prints realtime alert when flagged
         """
-        deployer = Web3.to_checksum_address(deployer)
+        deployer = _checksum(deployer.lower())
         stats = self.deployer_stats[deployer]
 
         # Check if already flagged
@@ -989,16 +1989,16 @@ class ArenaProxyProfitTracker:
             self.flagged_deployers.add(deployer)
 
             # Print realtime alert
-            print(f"\n{'='*70}")
+            print(f"\n{EQ_RULE}")
             print(f"🚨 FLAGGED DEPLOYER DETECTED!")
-            print(f"{'='*70}")
+            print(f"{EQ_RULE}")
             print(f"  Address:         {deployer}")
             print(f"  Tokens Deployed: {stats['token_count']}")
             print(f"  Total Profit:    {stats['total_profit_avax']:.4f} AVAX")
             print(f"                   ${stats['total_profit_usd']:.2f} USD")
             print(f"  Last Deployment: {stats['last_deployment']}")
             print(f"  Avg Profit/Token: {stats['total_profit_avax']/stats['token_count']:.4f} AVAX")
-            print(f"{'='*70}\n")
+            print(f"{EQ_RULE}\n")
 
             return True
 
@@ -1015,10 +2015,10 @@ class ArenaProxyProfitTracker:
             min_tokens_to_flag: Minimum tokens deployed to flag account (default: 3)
             min_profit_avax: Minimum profit in AVAX to flag (default: 1.0)
         """
-        print(f"\n{'#'*70}")
+        print(f"\n{HASH_RULE}")
         print(f"# REALTIME ARENA DEPLOYER MONITOR")
         print(f"# Poll Interval: {poll_interval}s | Min Tokens: {min_tokens_to_flag}")
-        print(f"{'#'*70}\n")
+        print(f"{HASH_RULE}\n")
 
         # Initialize starting block
         if self.last_processed_block == 0:
@@ -1081,9 +2081,9 @@ class ArenaProxyProfitTracker:
 
     def print_monitoring_summary(self):
         """Print summary of all deployers monitored during realtime session"""
-        print(f"\n{'#'*70}")
+        print(f"\n{HASH_RULE}")
         print(f"# MONITORING SESSION SUMMARY")
-        print(f"{'#'*70}\n")
+        print(f"{HASH_RULE}\n")
 
         print(f"Total Unique Deployers: {len(self.deployer_stats)}")
         print(f"Flagged Deployers: {len(self.flagged_deployers)}\n")
@@ -1096,9 +2096,9 @@ class ArenaProxyProfitTracker:
                 reverse=True
             )
 
-            print(f"{'='*70}")
+            print(f"{EQ_RULE}")
             print("TOP DEPLOYERS (by token count):")
-            print(f"{'='*70}\n")
+            print(f"{EQ_RULE}\n")
 
             for i, (deployer, stats) in enumerate(sorted_deployers[:10], 1):
                 flag = "🚨 FLAGGED" if stats['flagged'] else ""
@@ -1110,7 +2110,7 @@ class ArenaProxyProfitTracker:
                     print(f"   Last: {stats['last_deployment']}")
                 print()
 
-        print(f"{'#'*70}\n")
+        print(f"{HASH_RULE}\n")
 
 
 # Main execution
@@ -1170,26 +2170,25 @@ if __name__ == "__main__":
         tracker.export_results()
 
         # Generate blacklist entries
-        print(f"\n{'='*70}")
+        print(f"\n{EQ_RULE}")
         print("BLACKLIST EVALUATION")
-        print(f"{'='*70}")
-        blacklist_entries = tracker.generate_blacklist_entries(
+        print(f"{EQ_RULE}")
+        # Blacklist criteria and buy limit violations (>5 AVAX buys that were dumped),
+        # both checked in one pass over the results
+        blacklist_entries, buy_violations = tracker.review_wallets(
             min_tokens=2500,
-            min_profit_usd=50.0
+            min_profit_usd=50.0,
+            min_buy_limit=5.0
         )
 
-        # Check for buy limit violations (>5 AVAX buys that were dumped)
-        buy_violations = tracker.check_buy_limit_violations(min_buy_limit=5.0)
-
         # Print detailed reports for each wallet
-        for wallet in TARGET_WALLETS:
-            tracker.print_detailed_token_report(wallet, top_n=10)
+        tracker.print_detailed_token_reports(TARGET_WALLETS, top_n=10)
 
-        print(f"\n{'='*70}")
+        print(f"\n{EQ_RULE}")
         print("ANALYSIS COMPLETE")
-        print(f"{'='*70}")
+        print(f"{EQ_RULE}")
         print(f"\nBlacklist Entries: {len(blacklist_entries)}")
         print(f"Buy Limit Violations: {buy_violations['total_violations']}")
         print(f"\nNote: Dexscreener bonding check not yet implemented.")
         print(f"      Currently flagging dumps that recovered 80%+ of buy value.")
-        print(f"{'='*70}")
+        print(f"{EQ_RULE}")
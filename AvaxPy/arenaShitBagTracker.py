@@ -4,6 +4,8 @@ import json
 from datetime import datetime
 import time
 
+from rate_limiter import SNOWTRACE_RATE, shared_bucket
+
 class DeployerTokenTracker:
     def __init__(self, rpc_url, avax_scan_api_key=None, blacklist_file='wallet_blacklist.json'):
         self.w3 = Web3(Web3.HTTPProvider(rpc_url))
@@ -11,6 +13,7 @@ class DeployerTokenTracker:
         self.deployer_addresses = set()
         self.blacklist_file = blacklist_file
         self.wallet_blacklist = self.load_blacklist()
+        self._snowtrace_limiter = shared_bucket('snowtrace', rate=SNOWTRACE_RATE)
 
     def load_blacklist(self):
         """Load blacklist from JSON file"""
@@ -458,6 +461,11 @@ class DeployerTokenTracker:
             print(f"Error tracking token deployer: {e}")
             return None
 
+    def _snowtrace_get(self, url, params):
+        """GET a Snowtrace API URL once the shared Snowtrace rate limit allows it"""
+        self._snowtrace_limiter.acquire()
+        return requests.get(url, params=params)
+
     def get_address_transactions(self, address):
         """Get transaction history for an address using Snowtrace API"""
         if not self.avax_scan_api_key:
@@ -475,7 +483,7 @@ class DeployerTokenTracker:
                 'sort': 'desc',
                 'apikey': self.avax_scan_api_key
             }
-            response = requests.get(url, params=params)
+            response = self._snowtrace_get(url, params)
             data = response.json()
 
             if data['status'] == '1':
@@ -502,7 +510,7 @@ class DeployerTokenTracker:
                 'sort': 'asc',
                 'apikey': self.avax_scan_api_key
             }
-            response = requests.get(url, params=params)
+            response = self._snowtrace_get(url, params)
             data = response.json()
 
             if data['status'] == '1':
@@ -523,7 +531,7 @@ class DeployerTokenTracker:
                 'contractaddresses': token_contract,
                 'apikey': self.avax_scan_api_key
             }
-            response = requests.get(url, params=params)
+            response = self._snowtrace_get(url, params)
             data = response.json()
 
             if data['status'] == '1' and len(data['result']) > 0:
@@ -544,7 +552,7 @@ class DeployerTokenTracker:
                 'contractaddresses': token_contract,
                 'apikey': self.avax_scan_api_key
             }
-            response = requests.get(url, params=params)
+            response = self._snowtrace_get(url, params)
             data = response.json()
 
             if data['status'] == '1' and len(data['result']) > 0:
@@ -607,7 +615,7 @@ class DeployerTokenTracker:
                 'sort': 'asc',
                 'apikey': self.avax_scan_api_key
             }
-            response = requests.get(url, params=params)
+            response = self._snowtrace_get(url, params)
             data = response.json()
 
             if data['status'] == '1':
@@ -0,0 +1,75 @@
+"""
+Token-bucket rate limiters shared by the Arena trackers
+"""
+
+import asyncio
+import threading
+import time
+
+# Requests per second per upstream endpoint, defined once here: shared_bucket keeps the
+# first caller's rate, so every tracker must pass the same figures
+SNOWTRACE_RATE = 5  # Free tier
+SNOWSCAN_RATE = 5
+COINGECKO_RATE = 10 / 60  # Free tier; bursts of up to COINGECKO_BURST
+COINGECKO_BURST = 10
+AVAX_RPC_RATE = 40
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    Allows bursts of up to `capacity` calls, refilling at `rate` tokens per second.
+    acquire() only sleeps when the bucket is empty.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self, tokens: float = 1.0):
+        """Take tokens from the bucket, blocking until enough are available"""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1.0):
+        """acquire() for coroutines: waits on the event loop instead of blocking the thread"""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            await asyncio.sleep(wait)
+
+
+# One bucket per upstream endpoint, shared by every tracker in the process
+_shared_buckets = {}
+_shared_lock = threading.Lock()
+
+
+def shared_bucket(endpoint: str, rate: float, capacity: float = None) -> TokenBucket:
+    """
+    The process-wide bucket for an endpoint (e.g. 'snowtrace', 'avax_rpc').
+    Created with the first caller's rate; later callers share it, so their
+    combined request rate stays within the endpoint's quota.
+    """
+    with _shared_lock:
+        bucket = _shared_buckets.get(endpoint)
+        if bucket is None:
+            bucket = _shared_buckets[endpoint] = TokenBucket(rate, capacity)
+        return bucket
@@ -0,0 +1,39 @@
+"""
+Read-only HTTP API over known_grifters.json
+
+Runs on an ASGI server so concurrent queries don't serialize behind one thread:
+    uvicorn serve:app --workers 2
+"""
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
+
+from add_dune_wallets import load_grifters
+
+app = FastAPI(title="Arena Known Grifters", default_response_class=ORJSONResponse)
+
+
+@app.get('/grifters')
+def get_grifters():
+    """Full grifters database, including entries still in the journal"""
+    try:
+        return load_grifters()
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="known_grifters.json not found")
+
+
+@app.get('/grifters/{wallet_address}')
+def get_grifter(wallet_address: str):
+    """Look up a single wallet"""
+    wallet_lower = wallet_address.lower()
+    try:
+        data = load_grifters()
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="known_grifters.json not found")
+
+    for grifter in data.get('known_grifters', []):
+        if grifter['wallet_address'] == wallet_lower:
+            return {'listed': True, 'source': 'known_grifters', 'entry': grifter}
+    if wallet_lower in data.get('additional_suspicious_wallets', []):
+        return {'listed': True, 'source': 'additional_suspicious_wallets'}
+    return {'listed': False}